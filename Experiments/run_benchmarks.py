@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Implementation.benchmark import (default_cases, run_suite, write_results, load_results,
+                                      compare, print_comparison)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks Grover and arithmetic circuits.")
+    parser.add_argument("--quick", action="store_true", help="only the smallest cases")
+    parser.add_argument("--shots", type=int, default=1024)
+    parser.add_argument("--output", default=os.path.join("Experiments", "benchmark_results.json"))
+    parser.add_argument("--baseline", default=os.path.join("Experiments", "benchmark_baseline.json"),
+                        help="results file to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    records = run_suite(default_cases(args.quick), shots=args.shots)
+    for record in records:
+        seconds = sum(record[f"{s}_seconds"] for s in ("construct", "transpile", "simulate"))
+        print(f"{record['name']:<36} {seconds:8.3f} s  {record['qubits']:3d} qubits  "
+              f"{record['peak_rss_mb']:8.1f} MB  p={record['success_probability']:.3f}")
+    write_results(records, args.output)
+    print(f"Saved results to: {args.output}")
+
+    if args.save_baseline:
+        write_results(records, args.baseline)
+        print(f"Saved baseline to: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        rows = compare(records, load_results(args.baseline), tolerance=args.tolerance)
+        print_comparison(rows)
+        if any(row["status"] == "regression" for row in rows):
+            sys.exit(1)
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+
+if __name__ == "__main__":
+    main()
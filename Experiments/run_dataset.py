@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Implementation.dataset import ResultStore, run_dataset, plot_store, write_graph_file
+
+def _iterations(value):
+    if value in ("none", "auto"):
+        return None if value == "none" else value
+    return int(value)
+
+def cmd_generate(args):
+    # Imported here: generating a dataset does not need the simulator
+    from Implementation.families import make_graph
+    os.makedirs(args.directory, exist_ok=True)
+    for seed in range(args.count):
+        graph = make_graph("random", args.n, args.p, seed)
+        write_graph_file(graph, os.path.join(args.directory, f"random_{args.n}_{args.p}_{seed}.txt"))
+    print(f"Wrote {args.count} graphs to: {args.directory}")
+
+def cmd_run(args):
+    store = ResultStore(args.store)
+    settings = dict(shots=args.shots, method=args.method, synthesis=args.synthesis)
+    try:
+        store.use_settings(**settings)
+    except ValueError as error:
+        sys.exit(str(error))
+    skipped = len(store)
+    for row in run_dataset(args.graphs, store, args.k, args.iterations, shots=args.shots,
+                           method=args.method, synthesis=args.synthesis,
+                           max_workers=args.workers, memory_limit_mb=args.memory_limit_mb):
+        print(f"{row['graph']:<40} k={row['k']:<3} {row['status']:<9} "
+              f"p={row['success_probability']:.3f}  {row['seconds']:7.3f} s  {row['best_set']}")
+    print(f"{len(store) - skipped} new rows, {len(store)} in {args.store}")
+
+def cmd_plot(args):
+    filenames = plot_store(args.store, args.output_dir, graphs=args.graph, top=args.top)
+    print(f"Saved {len(filenames)} plots to: {args.output_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Runs Grover over a dataset of graph files into a resumable result store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="write random G(n,p) graph files")
+    generate.add_argument("directory")
+    generate.add_argument("--n", type=int, default=6)
+    generate.add_argument("--p", type=float, default=0.5)
+    generate.add_argument("--count", type=int, default=100)
+
+    run = commands.add_parser("run", help="run (or resume) the dataset into the store")
+    run.add_argument("store", help="result store directory")
+    run.add_argument("graphs", nargs="+", help="graph files or directories of them")
+    run.add_argument("-k", type=int, nargs="+", required=True)
+    run.add_argument("--iterations", type=_iterations, nargs="+", default=[None],
+                     help="ints, 'none' (default formula) or 'auto'")
+    run.add_argument("--shots", type=int, default=1024)
+    run.add_argument("--method", default="aer", choices=("aer", "phase"))
+    run.add_argument("--synthesis", default="generic")
+    run.add_argument("--workers", type=int, default=None)
+    run.add_argument("--memory-limit-mb", type=int, default=None)
+
+    plot = commands.add_parser("plot", help="histograms of the stored counts")
+    plot.add_argument("store")
+    plot.add_argument("--output-dir", default=os.path.join("Experiments", "dataset_plots"))
+    plot.add_argument("--graph", nargs="+", default=None, help="only these graph ids")
+    plot.add_argument("--top", type=int, default=10)
+
+    args = parser.parse_args()
+    {"generate": cmd_generate, "run": cmd_run, "plot": cmd_plot}[args.command](args)
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,20 @@
 import sys
 import os
-import matplotlib.pyplot as plt
-from qiskit.visualization import plot_histogram
 
 # Add the parent directory to path so we can import our modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from Implementation.graph import Graph
-from Implementation.grover import run_grover
+from Implementation.grover import run_grover_batch
+from Implementation.classical import minimum_dominating_set
 
 def save_plot(counts, title, filename):
     """Generates and saves a histogram of the results."""
     # Filter counts to keep only the top 10 to make chart readable
     sorted_counts = dict(sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10])
     
+    # Imported here so that running without plots never loads matplotlib
+    from qiskit.visualization import plot_histogram
     fig = plot_histogram(sorted_counts, title=title)
     save_path = os.path.join("Experiments", filename)
     fig.savefig(save_path)
@@ -25,7 +26,7 @@ def experiment_1_triangle_isolated():
     Looking for Dominating Set of size 2.
     Solution: Must include 3, and one of {0,1,2}.
     """
-    print("\n--- Running Experiment 1: Triangle + Isolated Node ---")
+    print("\n--- Preparing Experiment 1: Triangle + Isolated Node ---")
     g = Graph()
     g.set_number_vertices(4)
     g.add_edge(0, 1)
@@ -33,8 +34,7 @@ def experiment_1_triangle_isolated():
     g.add_edge(0, 2)
     # Node 3 is isolated (no edges added)
     
-    counts, _ = run_grover(g, k=2, iterations=1)
-    save_plot(counts, "Exp1: Triangle+Isolated (k=2)", "exp1_results.png")
+    return (g, 2, "auto"), "Exp1: Triangle+Isolated (k=2)", "exp1_results.png"
 
 def experiment_2_linear_graph():
     """
@@ -43,15 +43,14 @@ def experiment_2_linear_graph():
     Solutions: {1,2}, {0,2}, {0,3}?? 
     Let's see what Quantum finds.
     """
-    print("\n--- Running Experiment 2: Linear Path 0-1-2-3 ---")
+    print("\n--- Preparing Experiment 2: Linear Path 0-1-2-3 ---")
     g = Graph()
     g.set_number_vertices(4)
     g.add_edge(0, 1)
     g.add_edge(1, 2)
     g.add_edge(2, 3)
     
-    counts, _ = run_grover(g, k=2, iterations=1)
-    save_plot(counts, "Exp2: Line Graph 4 Nodes (k=2)", "exp2_results.png")
+    return (g, 2, "auto"), "Exp2: Line Graph 4 Nodes (k=2)", "exp2_results.png"
 
 def experiment_3_impossible_case():
     """
@@ -59,7 +58,7 @@ def experiment_3_impossible_case():
     Looking for Dominating Set of size 1. (Impossible, needs at least 2)
     We expect no clear peak (noise).
     """
-    print("\n--- Running Experiment 3: Square Cycle (Impossible k=1) ---")
+    print("\n--- Preparing Experiment 3: Square Cycle (Impossible k=1) ---")
     g = Graph()
     g.set_number_vertices(4)
     g.add_edge(0, 1)
@@ -67,16 +66,27 @@ def experiment_3_impossible_case():
     g.add_edge(2, 3)
     g.add_edge(3, 0)
     
-    counts, _ = run_grover(g, k=1)
-    save_plot(counts, "Exp3: Square Cycle (k=1, Impossible)", "exp3_results.png")
+    return (g, 1, "auto"), "Exp3: Square Cycle (k=1, Impossible)", "exp3_results.png"
 
 if __name__ == "__main__":
     # Ensure the directory exists
     if not os.path.exists("Experiments"):
         os.makedirs("Experiments")
         
-    experiment_1_triangle_isolated()
-    experiment_2_linear_graph()
-    experiment_3_impossible_case()
+    experiments = [
+        experiment_1_triangle_isolated(),
+        experiment_2_linear_graph(),
+        experiment_3_impossible_case(),
+    ]
+
+    # All experiments are transpiled and simulated as one batched Aer job
+    print("\n--- Running all experiments in one batch ---")
+    results = run_grover_batch([job for job, _, _ in experiments])
+    for (counts, _), ((g, k, _), title, filename) in zip(results, experiments):
+        # Classical reference: is k at least the domination number?
+        exact = minimum_dominating_set(g)
+        verdict = "feasible" if k >= len(exact) else "infeasible"
+        print(f"{title}: classical minimum {exact} -> k={k} is {verdict}")
+        save_plot(counts, title, filename)
     
     print("\nAll experiments completed! Check the 'Experiments' folder.")
\ No newline at end of file
@@ -1,23 +1,30 @@
 import sys
 import os
-import matplotlib.pyplot as plt
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
-from qiskit_aer import AerSimulator
-from qiskit.visualization import plot_histogram
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from Implementation.modular_exponentiation import set_bits, greater_or_eq, add_mod
+from Implementation.modular_exponentiation import (set_bits, greater_or_eq, add_mod,
+                                                   greater_or_eq_const, add_mod_const)
+from Implementation.backends import run_circuit
+from Implementation.reversible import simulate, all_inputs
 
 def save_plot(counts, title, filename):
     # Filter to top 10 to keep it clean
     sorted_counts = dict(sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10])
+    # Imported here so that running without plots never loads matplotlib
+    from qiskit.visualization import plot_histogram
     fig = plot_histogram(sorted_counts, title=title)
     save_path = os.path.join("Experiments", filename)
     fig.savefig(save_path)
     print(f"Saved plot to: {save_path}")
 
+def print_exact(circuit):
+    # The arithmetic circuits are deterministic, so one shot-free run gives the answer
+    probabilities = run_circuit(circuit, shots=None)
+    outcome = max(probabilities, key=probabilities.get)
+    print(f"Exact outcome: {outcome} (probability {probabilities[outcome]:.3f})")
+
 def run_tests():
-    backend = AerSimulator()
     n = 4
 
     # --- Experiment 1: Comparison (7 >= 3) ---
@@ -34,7 +41,8 @@ def run_tests():
     greater_or_eq(qc, qr_a, qr_b, qr_r[0], qr_aux)
     qc.measure(qr_r, cr)
     
-    res = backend.run(transpile(qc, backend)).result().get_counts()
+    print_exact(qc)
+    res = run_circuit(qc)
     save_plot(res, "Exp1: 7 >= 3 (Expect 1)", "p1_exp1_compare.png")
 
     # --- Experiment 2: Mod Addition (2 + 3 mod 15) ---
@@ -45,9 +53,8 @@ def run_tests():
     qr_b2 = QuantumRegister(n, 'b2')
     cr_sum = ClassicalRegister(n, 'c_sum')
     
-    # Need larger AUX for the robust adder
-    # Robust adder needs AUX size = n
-    qr_aux2 = QuantumRegister(n + 2, 'aux2')
+    # Modular adder needs AUX size = n + 3 (carry, adder ancilla, flag, n-qubit N copy)
+    qr_aux2 = QuantumRegister(n + 3, 'aux2')
 
     qc2 = QuantumCircuit(qr_n, qr_a2, qr_b2, qr_res, qr_aux2, cr_sum)
     set_bits(qc2, qr_a2, 2)
@@ -57,8 +64,53 @@ def run_tests():
     add_mod(qc2, qr_n, qr_a2, qr_b2, qr_res, qr_aux2)
     qc2.measure(qr_res, cr_sum)
     
-    res2 = backend.run(transpile(qc2, backend)).result().get_counts()
+    print_exact(qc2)
+    res2 = run_circuit(qc2)
     save_plot(res2, "Exp2: 2+3 mod 15 (Expect 5)", "p1_exp2_add.png")
 
+    # --- Experiment 3: the same operations with the classical operands folded in ---
+    print("Running Exp 3: Constant-folded 7 >= 3 and 2 + 3 mod 15...")
+    qr_a3 = QuantumRegister(n, 'a3')
+    qr_r3 = QuantumRegister(1, 'res3')
+    qr_aux3 = QuantumRegister(n - 1, 'aux3')
+    cr3 = ClassicalRegister(1, 'c3')
+    qc3 = QuantumCircuit(qr_a3, qr_r3, qr_aux3, cr3)
+    set_bits(qc3, qr_a3, 7)
+    greater_or_eq_const(qc3, qr_a3, 3, qr_r3[0], qr_aux3)
+    qc3.measure(qr_r3, cr3)
+    print(f"Qubits: {qc3.num_qubits} (quantum operands: {qc.num_qubits})")
+    print_exact(qc3)
+
+    qr_b4 = QuantumRegister(n, 'b4')
+    qr_aux4 = QuantumRegister(n, 'aux4')
+    cr4 = ClassicalRegister(n, 'c4')
+    qc4 = QuantumCircuit(qr_b4, qr_aux4, cr4)
+    set_bits(qc4, qr_b4, 3)
+    add_mod_const(qc4, 15, 2, qr_b4, qr_aux4)
+    qc4.measure(qr_b4, cr4)
+    print(f"Qubits: {qc4.num_qubits} (quantum operands: {qc2.num_qubits})")
+    print_exact(qc4)
+
+def verify_exhaustive(n=8):
+    """Checks greater_or_eq and add_mod_const on every input with the reversible simulator."""
+    print(f"Running exhaustive checks on {n}-bit operands...")
+    a, b = all_inputs(n, n)
+    qr_a, qr_b = QuantumRegister(n, 'a'), QuantumRegister(n, 'b')
+    qr_r, qr_aux = QuantumRegister(1, 'res'), QuantumRegister(2 * n, 'aux')
+    qc = QuantumCircuit(qr_a, qr_b, qr_r, qr_aux)
+    greater_or_eq(qc, qr_a, qr_b, qr_r[0], qr_aux)
+    wrong = int((simulate(qc, {qr_a: a, qr_b: b}).value(qr_r) != (a >= b)).sum())
+    print(f"greater_or_eq: {len(a)} operand pairs, {wrong} wrong")
+
+    modulus = 2**n - 5
+    values = a[(a < modulus) & (b == 0)]
+    qc = QuantumCircuit(qr_a, qr_aux)
+    add_mod_const(qc, modulus, 2, qr_a, qr_aux[:n])
+    result = simulate(qc, {qr_a: values})
+    wrong = int((result.value(qr_a) != (values + 2) % modulus).sum())
+    print(f"add_mod_const: {len(values)} inputs, {wrong} wrong, "
+          f"{int(result.dirty(qr_aux).sum())} with dirty ancillas")
+
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    run_tests()
+    verify_exhaustive()
\ No newline at end of file
@@ -1,10 +1,18 @@
 import sys
 import os
+import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
 from qiskit_aer import AerSimulator
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from Implementation.modular_exponentiation import set_bits, greater_or_eq, add_mod
+from Implementation.modular_exponentiation import (set_bits, greater_or_eq, add, subtract,
+                                                   add_mod, times_two_mod, cuccaro_add,
+                                                   cuccaro_subtract, draper_add,
+                                                   draper_add_const, mod_exp, add_const,
+                                                   greater_or_eq_const, add_mod_const,
+                                                   times_two_mod_const, mod_exp_ripple)
+from Implementation.backends import run_circuit
+from Implementation.reversible import simulate, all_inputs, check_ancillas
 
 def test_phase_2():
     print("Testing Phase 2: Modular Logic...")
@@ -56,5 +64,191 @@ def test_phase_2():
     else:
         print("❌ Add Mod Failed")
 
+def measure_registers(qc, registers):
+    """Runs qc shot-free and returns the (deterministic) value of each register."""
+    qubits = [q for r in registers for q in r]
+    cr = ClassicalRegister(len(qubits), 'out')
+    qc.add_register(cr)
+    qc.measure(qubits, cr)
+    probabilities = run_circuit(qc, shots=None)
+    outcome = max(probabilities, key=probabilities.get)
+    assert probabilities[outcome] > 0.999
+    value = int(outcome, 2)
+    values = []
+    for r in registers:
+        values.append(value & ((1 << len(r)) - 1))
+        value >>= len(r)
+    return values
+
+def test_in_place_adders():
+    n = 3
+    for a, b in [(0, 0), (3, 5), (7, 7), (6, 1)]:
+        A, B = QuantumRegister(n, 'a'), QuantumRegister(n, 'b')
+        anc, carry = QuantumRegister(1, 'anc'), QuantumRegister(1, 'carry')
+
+        qc = QuantumCircuit(A, B, anc, carry)
+        set_bits(qc, A, a)
+        set_bits(qc, B, b)
+        cuccaro_add(qc, A, B, anc[0], carry[0])
+        assert measure_registers(qc, [A, B, anc, carry]) == [a, (a + b) % 8, 0, (a + b) >> 3]
+
+        qc = QuantumCircuit(A, B, anc, carry)
+        set_bits(qc, A, a)
+        set_bits(qc, B, b)
+        cuccaro_subtract(qc, A, B, anc[0], carry[0])
+        assert measure_registers(qc, [A, B, anc, carry]) == [a, (b - a) % 8, 0, int(b < a)]
+
+        qc = QuantumCircuit(A, B)
+        set_bits(qc, A, a)
+        set_bits(qc, B, b)
+        draper_add(qc, A, B)
+        assert measure_registers(qc, [A, B]) == [a, (a + b) % 8]
+
+        qc = QuantumCircuit(B)
+        set_bits(qc, B, b)
+        draper_add_const(qc, a, B)
+        assert measure_registers(qc, [B]) == [(a + b) % 8]
+
+def test_add_mod_cleans_ancillas():
+    n, modulus = 3, 7
+    for a, b in [(2, 3), (4, 5), (6, 6), (0, 6)]:
+        N, A, B = QuantumRegister(n, 'n'), QuantumRegister(n, 'a'), QuantumRegister(n, 'b')
+        R, AUX = QuantumRegister(n, 'r'), QuantumRegister(n + 3, 'aux')
+        qc = QuantumCircuit(N, A, B, R, AUX)
+        set_bits(qc, N, modulus)
+        set_bits(qc, A, a)
+        set_bits(qc, B, b)
+        add_mod(qc, N, A, B, R, AUX)
+        assert measure_registers(qc, [N, A, B, R, AUX]) == [modulus, a, b, (a + b) % modulus, 0]
+
+        qc = QuantumCircuit(N, A, R, AUX)
+        set_bits(qc, N, modulus)
+        set_bits(qc, A, a)
+        times_two_mod(qc, N, A, R, AUX)
+        assert measure_registers(qc, [N, A, R, AUX]) == [modulus, a, (2 * a) % modulus, 0]
+
+def test_mod_exp():
+    modulus, base = 15, 7
+    for e in (0, 3, 6):
+        E, X = QuantumRegister(3, 'e'), QuantumRegister(4, 'x')
+        B, anc = QuantumRegister(5, 'b'), QuantumRegister(1, 'anc')
+        qc = QuantumCircuit(E, X, B, anc)
+        set_bits(qc, E, e)
+        set_bits(qc, X, 1)
+        mod_exp(qc, base, modulus, E, X, B, anc[0])
+        assert measure_registers(qc, [E, X, B, anc]) == [e, pow(base, e, modulus), 0, 0]
+
+def test_constant_folded_arithmetic():
+    n, modulus = 3, 7
+    for a, b in [(0, 5), (3, 4), (6, 6), (5, 2)]:
+        B, AUX = QuantumRegister(n, 'b'), QuantumRegister(n, 'aux')
+        carry, r = QuantumRegister(1, 'carry'), QuantumRegister(1, 'r')
+
+        qc = QuantumCircuit(B, AUX, carry)
+        set_bits(qc, B, b)
+        add_const(qc, a, B, AUX[:n - 1], carry[0])
+        assert measure_registers(qc, [B, AUX, carry]) == [(a + b) % 8, 0, (a + b) >> 3]
+
+        qc = QuantumCircuit(B, AUX, r)
+        set_bits(qc, B, b)
+        greater_or_eq_const(qc, B, a, r[0], AUX[:n - 1])
+        assert measure_registers(qc, [B, AUX, r]) == [b, 0, int(b >= a)]
+
+        qc = QuantumCircuit(B, AUX)
+        set_bits(qc, B, b % modulus)
+        add_mod_const(qc, modulus, a, B, AUX)
+        assert measure_registers(qc, [B, AUX]) == [(a + b % modulus) % modulus, 0]
+
+        qc = QuantumCircuit(B, AUX)
+        set_bits(qc, B, b % modulus)
+        times_two_mod_const(qc, modulus, B, AUX)
+        assert measure_registers(qc, [B, AUX]) == [(2 * b) % modulus, 0]
+
+def test_mod_exp_ripple():
+    modulus, base = 15, 7
+    for e in (0, 5):
+        E, X, AUX = QuantumRegister(3, 'e'), QuantumRegister(4, 'x'), QuantumRegister(8, 'aux')
+        qc = QuantumCircuit(E, X, AUX)
+        set_bits(qc, E, e)
+        set_bits(qc, X, 1)
+        mod_exp_ripple(qc, base, modulus, E, X, AUX)
+        assert measure_registers(qc, [E, X, AUX]) == [e, pow(base, e, modulus), 0]
+
+def test_exhaustive_quantum_operands():
+    n = 6
+    a, b = all_inputs(n, n)
+    A, B = QuantumRegister(n, 'a'), QuantumRegister(n, 'b')
+    R, AUX = QuantumRegister(n, 'r'), QuantumRegister(n, 'aux')
+
+    qc = QuantumCircuit(A, B, R, AUX)
+    add(qc, A, B, R, AUX)
+    result = simulate(qc, {A: a, B: b})
+    assert (result.value(R) == (a + b) % 2**n).all()
+
+    qc = QuantumCircuit(A, B, R, AUX)
+    subtract(qc, A, B, R, AUX)
+    result = simulate(qc, {A: a, B: b})
+    assert (result.value(R) == (a - b) % 2**n).all()
+    assert (result.value(A) == a).all() and (result.value(B) == b).all()
+
+    r, AUX2 = QuantumRegister(1, 'res'), QuantumRegister(2 * n, 'aux2')
+    qc = QuantumCircuit(A, B, r, AUX2)
+    greater_or_eq(qc, A, B, r[0], AUX2)
+    assert (simulate(qc, {A: a, B: b}).value(r) == (a >= b)).all()
+
+    anc, carry = QuantumRegister(1, 'anc'), QuantumRegister(1, 'carry')
+    qc = QuantumCircuit(A, B, anc, carry)
+    cuccaro_add(qc, A, B, anc[0], carry[0])
+    result = simulate(qc, {A: a, B: b})
+    assert (result.value(list(B) + [carry[0]]) == a + b).all()
+    check_ancillas(result, anc)
+
+    modulus = 2**n - 5
+    keep = (a < modulus) & (b < modulus)
+    N, AUX3 = QuantumRegister(n, 'n'), QuantumRegister(n + 3, 'aux3')
+    qc = QuantumCircuit(N, A, B, R, AUX3)
+    add_mod(qc, N, A, B, R, AUX3)
+    result = simulate(qc, {N: np.full(keep.sum(), modulus), A: a[keep], B: b[keep]})
+    assert (result.value(R) == (a[keep] + b[keep]) % modulus).all()
+    check_ancillas(result, AUX3)
+
+def test_exhaustive_constant_operands():
+    n, modulus = 6, 59
+    B, AUX = QuantumRegister(n, 'b'), QuantumRegister(n, 'aux')
+    values = np.arange(2**n, dtype=np.uint64)
+    reduced = values[values < modulus]
+    for a in (0, 1, 22, 58, 63):
+        qc = QuantumCircuit(B, AUX)
+        add_const(qc, a, B, AUX[:n - 1])
+        result = simulate(qc, {B: values})
+        assert (result.value(B) == (values + a) % 2**n).all()
+        check_ancillas(result, AUX)
+
+        qc = QuantumCircuit(B, AUX)
+        greater_or_eq_const(qc, B, a, AUX[n - 1], AUX[:n - 1])
+        result = simulate(qc, {B: values})
+        assert (result.value(AUX[n - 1]) == (values >= a)).all()
+        check_ancillas(result, AUX[:n - 1])
+
+        qc = QuantumCircuit(B, AUX)
+        add_mod_const(qc, modulus, a, B, AUX)
+        result = simulate(qc, {B: reduced})
+        assert (result.value(B) == (reduced + a) % modulus).all()
+        check_ancillas(result, AUX)
+
+    qc = QuantumCircuit(B, AUX)
+    times_two_mod_const(qc, modulus, B, AUX)
+    result = simulate(qc, {B: reduced})
+    assert (result.value(B) == (2 * reduced) % modulus).all()
+    check_ancillas(result, AUX)
+
+    E, X, AUX2 = QuantumRegister(4, 'e'), QuantumRegister(n, 'x'), QuantumRegister(2 * n, 'aux2')
+    qc = QuantumCircuit(E, X, AUX2)
+    mod_exp_ripple(qc, 5, modulus, E, X, AUX2)
+    exponents = np.arange(16, dtype=np.uint64)
+    result = simulate(qc, {E: exponents, X: np.ones(16, dtype=np.uint64)})
+    assert result.value(X).tolist() == [pow(5, int(e), modulus) for e in exponents]
+    check_ancillas(result, AUX2)
+
 if __name__ == "__main__":
     test_phase_2()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Implementation.families import make_graph
+from Implementation.benchmark import run_suite, compare, write_results, load_results
+
+def test_graph_families():
+    assert len(make_graph("path", 5).edges()) == 4
+    assert len(make_graph("cycle", 5).edges()) == 5
+    assert make_graph("star", 5).degree(0) == 4
+    assert len(make_graph("grid", 2, 3).edges()) == 7
+    a, b = make_graph("random", 8, 0.5, seed=1), make_graph("random", 8, 0.5, seed=1)
+    assert (a.edges() == b.edges()).all()
+
+def test_suite_records_and_baseline(tmp_path):
+    cases = [{"kind": "grover", "family": "path", "params": [4], "k": 2},
+             {"kind": "arithmetic", "op": "add", "width": 2},
+             {"kind": "arithmetic", "op": "greater_or_eq", "width": 2}]
+    records = run_suite(cases, shots=256, isolate=False)
+    assert [r["name"] for r in records] == ["grover/path(4)/k=2", "add/width=2",
+                                            "greater_or_eq/width=2"]
+    assert all(r["success_probability"] == 1.0 for r in records[1:])
+    assert records[0]["success_probability"] > 0.3
+
+    path = str(tmp_path / "baseline.json")
+    write_results(records, path)
+    baseline = load_results(path)
+    assert compare(records, baseline) == []
+
+    slower = [dict(r) for r in records]
+    slower[1]["simulate_seconds"] = baseline[1]["simulate_seconds"] + 1.0
+    slower[2]["size"] = baseline[2]["size"] - 1
+    rows = compare(slower, baseline)
+    assert {(row["name"], row["metric"], row["status"]) for row in rows} == {
+        ("add/width=2", "simulate_seconds", "regression"),
+        ("greater_or_eq/width=2", "size", "improvement"),
+    }
+
+def test_dataset_store_resumes(tmp_path):
+    import pytest
+    from Implementation.dataset import ResultStore, run_dataset, write_graph_file
+    from Implementation.grover import run_grover
+
+    files = []
+    for family, params in (("path", (4,)), ("cycle", (5,)), ("star", (5,))):
+        files.append(str(tmp_path / f"{family}.txt"))
+        write_graph_file(make_graph(family, *params), files[-1])
+    store_dir = str(tmp_path / "store")
+    rows = list(run_dataset(files, store_dir, k_values=[1, 2], iteration_counts=[None, 1],
+                            shots=None, method="phase", max_workers=2))
+    assert len(rows) == 12
+
+    # A run killed mid-append leaves partial bytes behind; reopening cuts them off
+    with open(os.path.join(store_dir, "rows.bin"), "ab") as f:
+        f.write(b"\0" * 7)
+    with open(os.path.join(store_dir, "counts.bin"), "ab") as f:
+        f.write(b"\0" * 16)
+    store = ResultStore(store_dir)
+    assert len(store) == 12
+    assert list(run_dataset(files, store, k_values=[1, 2], iteration_counts=[None, 1],
+                            shots=None, method="phase")) == []
+    # Rows run another way would not be comparable, so the store refuses them
+    with pytest.raises(ValueError):
+        list(run_dataset(files, store, k_values=[1, 2], shots=256, method="phase"))
+
+    record = next(r for r in store.records() if r["graph"].endswith("star.txt")
+                  and r["k"] == 1 and r["iterations"] is None)
+    expected, _ = run_grover(make_graph("star", 5), 1, shots=None, method="phase")
+    assert record["counts"].keys() == expected.keys()
+    assert record["best_set"] == [0] and record["shots"] is None and record["status"] == "ok"
+
+    new = list(run_dataset(files, store, k_values=[1, 2, 3], iteration_counts=[None, 1],
+                           shots=None, method="phase", max_workers=1))
+    assert len(new) == 6 and len(store) == 18
+    assert ResultStore(store_dir).completed() == store.completed()
+
+def test_dataset_run_survives_bad_jobs(tmp_path):
+    from Implementation.dataset import ResultStore, run_dataset, write_graph_file
+
+    graphs = tmp_path / "graphs"
+    graphs.mkdir()
+    write_graph_file(make_graph("path", 4), str(graphs / "path.txt"))
+    (graphs / "broken.txt").write_text("4\n0 x\n")
+    (graphs / "notes.md").write_text("not a graph\n")
+    store_dir = str(tmp_path / "store")
+    rows = list(run_dataset([str(graphs)], store_dir, k_values=[1, 2], shots=None,
+                            method="phase", max_workers=2))
+    statuses = sorted((os.path.basename(r["graph"]), r["k"], r["status"]) for r in rows)
+    assert statuses == [("broken.txt", 1, "error"), ("broken.txt", 2, "error"),
+                        ("path.txt", 1, "ok"), ("path.txt", 2, "ok")]
+
+    store = ResultStore(store_dir)
+    assert all("ValueError" in r["error"] for r in store.records() if r["status"] == "error")
+    # Failed jobs are retried on resume, finished ones are not
+    (graphs / "broken.txt").write_text("4\n0 1\n")
+    rows = list(run_dataset([str(graphs)], store, k_values=[1, 2], shots=None, method="phase"))
+    assert sorted((os.path.basename(r["graph"]), r["status"]) for r in rows) == [
+        ("broken.txt", "ok"), ("broken.txt", "ok")]
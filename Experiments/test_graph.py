@@ -0,0 +1,80 @@
+import sys
+import os
+from itertools import combinations
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Implementation.graph import Graph
+from Implementation.classical import (minimum_dominating_set, greedy_dominating_set,
+                                      lower_bound, is_feasible, verify)
+
+EDGES = [(0, 1), (1, 2), (2, 0), (2, 3), (1, 0)]
+
+def test_bulk_and_incremental_agree():
+    g1 = Graph()
+    g1.set_number_vertices(5)
+    for u, v in EDGES:
+        g1.add_edge(u, v)
+
+    g2 = Graph.from_edges(5, np.array(EDGES))
+    assert g1.adj_list == g2.adj_list == [[1, 2], [0, 2], [0, 1, 3], [2], []]
+    assert g2.has_edge(3, 2) and not g2.has_edge(3, 1)
+    assert g2.edges().tolist() == [[0, 1], [0, 2], [1, 2], [2, 3]]
+
+    # Edits after a bulk load go through the neighbor sets
+    g2.add_edge(3, 4)
+    assert g2.adj_list[4] == [3]
+    assert g2.degree(3) == 2
+
+def test_file_loaders(tmp_path):
+    text_file = str(tmp_path / "graph.txt")
+    with open(text_file, 'w') as f:
+        f.write("5\n")
+        for u, v in EDGES:
+            f.write(f"{u} {v}\n")
+    npy_file = str(tmp_path / "graph.npy")
+    np.save(npy_file, np.array(EDGES))
+
+    g1 = Graph()
+    g1.read_from_file(text_file)
+    g2 = Graph.from_edge_file(text_file)
+    g3 = Graph.from_edge_file(npy_file, n=5)
+    assert g1.n == g2.n == g3.n == 5
+    assert g1.adj_list == g2.adj_list == g3.adj_list
+
+def test_classical_solver_matches_brute_force():
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        n = int(rng.integers(1, 9))
+        pairs = [(u, v) for u in range(n) for v in range(u + 1, n) if rng.random() < 0.3]
+        g = Graph.from_edges(n, pairs)
+
+        gamma = next(k for k in range(1, n + 1)
+                     if any(g.is_dominating_set(c) for c in combinations(range(n), k)))
+        best = minimum_dominating_set(g)
+        assert len(best) == gamma and verify(g, best)
+        assert lower_bound(g) <= gamma <= len(greedy_dominating_set(g))
+        assert [is_feasible(g, k) for k in range(1, n + 1)] == [k >= gamma for k in range(1, n + 1)]
+
+def test_edit_log():
+    g = Graph.from_edges(5, np.array(EDGES))
+    start = g.revision
+    g.add_edge(3, 4)
+    g.add_edge(4, 3)  # already an edge: not logged
+    g.remove_edge(0, 1)
+    g.remove_edge(0, 4)  # not an edge: not logged
+    assert g.changes_since(start) == [(3, 4), (0, 1)]
+    assert g.changes_since(g.revision) == []
+    assert g.neighbors(0) == [2] and g.neighbors(4) == [3]
+    assert g.edges().tolist() == [[0, 2], [1, 2], [2, 3], [3, 4]]
+
+    g.set_number_vertices(5)
+    assert g.changes_since(start) is None
+
+def test_components_and_subgraph():
+    g = Graph.from_edges(7, np.array([(0, 1), (1, 2), (4, 5), (5, 6), (6, 4)]))
+    assert g.connected_components() == [[0, 1, 2], [3], [4, 5, 6]]
+    assert g.connected_components([0, 2, 4, 5]) == [[0], [2], [4, 5]]
+    sub = g.subgraph([4, 5, 6])
+    assert sub.n == 3 and sub.edges().tolist() == [[0, 1], [0, 2], [1, 2]]
@@ -0,0 +1,493 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Implementation.graph import Graph
+from Implementation.grover import (run_grover, run_grover_batch, total_qubits, compare_oracles,
+                                   resolve_iterations, vertex_set_counts, decode_bitstring,
+                                   build_grover_circuit)
+from Implementation.cache import CircuitCache, graph_fingerprint
+from Implementation.phase_oracle import domination_mask, grover_probabilities, count_marked
+from Implementation.counting import choose_iterations, exponential_search
+from Implementation.subset_encoding import subset_domination_mask
+from Implementation.sweep import find_minimum, run_task
+from Implementation.backends import choose_method, make_backend
+from Implementation.resources import estimate_all_dominated, estimate_diffuser, estimate_grover
+from Implementation.profiling import Profiler
+from Implementation.oracle_check import check_oracle
+
+def triangle_isolated():
+    """Triangle (0,1,2) + isolated 3, same graph as Experiment 1."""
+    g = Graph()
+    g.set_number_vertices(4)
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(0, 2)
+    return g
+
+def test_fingerprint_ignores_edge_order():
+    g1 = triangle_isolated()
+    g2 = Graph()
+    g2.set_number_vertices(4)
+    g2.add_edge(2, 0)
+    g2.add_edge(1, 0)
+    g2.add_edge(2, 1)
+    assert graph_fingerprint(g1) == graph_fingerprint(g2)
+
+    g2.add_edge(2, 3)
+    assert graph_fingerprint(g1) != graph_fingerprint(g2)
+
+def test_cache_reuses_circuits(tmp_path):
+    g = triangle_isolated()
+    cache = CircuitCache(directory=str(tmp_path))
+
+    counts, qc = run_grover(g, k=2, iterations=1, cache=cache)
+    assert cache.misses == 2 and cache.hits == 0
+
+    counts2, qc2 = run_grover(g, k=2, iterations=1, shots=256, cache=cache)
+    assert cache.hits == 2
+    assert qc2 is qc
+    assert sum(counts2.values()) == 256
+
+    # A fresh cache on the same directory is served from the QPY store
+    disk_cache = CircuitCache(directory=str(tmp_path))
+    run_grover(g, k=2, iterations=1, cache=disk_cache)
+    assert disk_cache.hits == 2 and disk_cache.misses == 0
+
+def test_phase_method_matches_aer():
+    # Path 0-1-2-3 has several size-2 dominating sets ({1,2}, {0,2}, {1,3}, {0,3})
+    g = Graph()
+    g.set_number_vertices(4)
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    marked = domination_mask(g, 2)
+    expected = {(1, 2), (0, 2), (1, 3), (0, 3)}
+    for i in range(16):
+        pair = tuple(sorted((i & 3, i >> 2)))
+        assert marked[i] == (pair in expected)
+
+    shots = 4096
+    aer_counts, _ = run_grover(g, k=2, iterations=1, shots=shots)
+    phase_counts, qc = run_grover(g, k=2, iterations=1, shots=shots, method="phase")
+    assert qc is None
+
+    probs = grover_probabilities(marked, 1)
+    for i, p in enumerate(probs):
+        key = format(i, '04b')
+        assert abs(aer_counts.get(key, 0) / shots - p) < 0.05
+        assert abs(phase_counts.get(key, 0) / shots - p) < 0.05
+
+def path_5():
+    """Path 0-1-2-3-4: n=5 is not a power of two, so unused index codes are exercised."""
+    g = Graph()
+    g.set_number_vertices(5)
+    for u in range(4):
+        g.add_edge(u, u + 1)
+    return g
+
+def assert_matches_phase(g, k, iterations, counts, shots):
+    probs = grover_probabilities(domination_mask(g, k), iterations)
+    width = len(next(iter(counts)))
+    for i, p in enumerate(probs):
+        assert abs(counts.get(format(i, f'0{width}b'), 0) / shots - p) < 0.05
+
+def test_pooled_oracle_fits_budget():
+    g = path_5()
+    assert total_qubits(5, 2) == 17
+    shots = 8192
+    counts, qc = run_grover(g, k=2, iterations=2, shots=shots, qubit_budget=16)
+    assert qc.num_qubits == 16
+    assert_matches_phase(g, 2, 2, counts, shots)
+
+def test_neighborhood_oracle():
+    g = path_5()
+    report = compare_oracles(g, 2)
+    assert report["neighborhood"]["mcx"] < report["generic"]["mcx"]
+    assert report["neighborhood"]["qubits"] == report["generic"]["qubits"] - 3
+
+    shots = 8192
+    for budget in (None, 13):
+        counts, qc = run_grover(g, k=2, iterations=2, shots=shots,
+                                qubit_budget=budget, synthesis="neighborhood")
+        assert_matches_phase(g, 2, 2, counts, shots)
+
+def test_batch_returns_results_per_job():
+    g1 = triangle_isolated()
+    g2 = path_5()
+    shots = 8192
+    results = run_grover_batch([(g1, 2, 1), (g2, 2, 2)], shots=shots)
+    assert len(results) == 2
+    assert_matches_phase(g1, 2, 1, results[0][0], shots)
+    assert_matches_phase(g2, 2, 2, results[1][0], shots)
+
+def test_sweep_stops_at_minimum(tmp_path):
+    g = Graph()
+    g.set_number_vertices(6)
+    for u in range(5):
+        g.add_edge(u, u + 1)
+
+    results_file = str(tmp_path / "sweep.csv")
+    k, best_set, rows = find_minimum(g, results_file=results_file, method="phase",
+                                     iteration_counts=(None, 1), max_workers=2)
+    assert k == 2
+    assert g.is_dominating_set(best_set)
+    assert all(row["k"] <= 2 for row in rows)
+    assert os.path.exists(results_file)
+
+def _run_task_or_die(graph, k, *args):
+    # Stand-in for a worker the OOM killer takes down at k = 3
+    if k == 3:
+        os._exit(1)
+    return run_task(graph, k, *args)
+
+def test_sweep_survives_killed_worker(monkeypatch):
+    import Implementation.sweep as sweep_module
+    monkeypatch.setattr(sweep_module, "run_task", _run_task_or_die)
+
+    g = Graph.from_edges(6, [(u, u + 1) for u in range(5)])
+    rows = list(sweep_module.sweep(g, k_values=[1, 2, 3], method="phase", max_workers=2,
+                                   prune=False, early_stop=False))
+    statuses = {row["k"]: row["status"] for row in rows}
+    assert statuses == {1: "ok", 2: "ok", 3: "memory"}
+
+def test_iterations_from_solution_count():
+    g = triangle_isolated()
+    # {3} plus any of {0,1,2}, in either order
+    assert count_marked(g, 2) == 6
+    assert choose_iterations(g, 2) == 1
+    assert choose_iterations(g, 2, mode="quantum", synthesis="neighborhood") == 1
+
+    # k=1 is infeasible, so no oracle call is spent
+    assert resolve_iterations(g, 1, "auto") == 0
+
+    vertices, _ = exponential_search(g, 2, method="phase", seed=0)
+    assert g.is_dominating_set(vertices)
+    assert exponential_search(g, 1, method="phase", seed=0)[0] is None
+
+def test_subset_encoding():
+    g = path_5()
+    subsets, marked = subset_domination_mask(g, 2)
+    solutions = {s for s, m in zip(subsets, marked) if m}
+    assert solutions == {s for s in subsets if g.is_dominating_set(s)}
+
+    shots = 2048
+    counts, qc = run_grover(g, k=2, iterations="auto", shots=shots, encoding="subset")
+    assert qc.num_qubits == 2 * 5 + 1
+    sets = vertex_set_counts(counts, 2, encoding="subset")
+    assert all(len(s) == 2 for s in sets)
+    assert sum(c for s, c in sets.items() if s in solutions) / shots > 0.8
+
+def test_grover_result_decodes_in_bulk():
+    g = path_5()
+    result, _ = run_grover(g, k=2, iterations="auto", shots=2048, method="phase", decode=True)
+    for row, bitstring in enumerate(result.bitstrings):
+        vertices = decode_bitstring(bitstring, 2, 3)
+        assert tuple(result.vertices[row]) == vertices
+        assert result.valid[row] == g.is_dominating_set(vertices)
+    assert result.total_shots == 2048
+    assert g.is_dominating_set(result.best_set)
+    assert result.success_probability > 0.8
+
+    subset_result, _ = run_grover(g, k=2, iterations="auto", method="phase",
+                                  encoding="subset", decode=True)
+    assert set(subset_result.valid_sets) <= {s for s in result.valid_sets}
+
+    # n = 5 leaves index codes 5..7 unused: they are padding, never vertices
+    star = Graph.from_edges(5, [(0, v) for v in range(1, 5)])
+    result, _ = run_grover(star, k=2, shots=None, method="phase", decode=True)
+    assert all(v < 5 for s in result.valid_sets for v in s)
+    assert result.best_set == (0,)
+    counts, _ = run_grover(star, k=2, shots=None, method="phase")
+    assert all(v < 5 for s in vertex_set_counts(counts, 2, 3, n=5) for v in s)
+
+def test_probability_mode_is_exact():
+    g = triangle_isolated()
+    probabilities, qc = run_grover(g, k=2, iterations=1, shots=None)
+    expected = grover_probabilities(domination_mask(g, 2), 1)
+    assert len(probabilities) == len(expected)
+    for bitstring, p in probabilities.items():
+        assert abs(p - expected[int(bitstring, 2)]) < 1e-9
+
+    phase, _ = run_grover(g, k=2, iterations=1, shots=None, method="phase")
+    assert phase.keys() == probabilities.keys()
+    result, _ = run_grover(g, k=2, iterations=1, shots=None, decode=True)
+    assert abs(result.total_shots - 1.0) < 1e-9
+
+def test_backend_selection():
+    from qiskit import QuantumCircuit
+    clifford = QuantumCircuit(40)
+    clifford.h(0)
+    for q in range(39):
+        clifford.cx(q, q + 1)
+    assert choose_method(clifford) == "stabilizer"
+    # Opaque blocks are looked into, not taken as arbitrary gates
+    wrapped = QuantumCircuit(40)
+    wrapped.append(clifford.to_gate(label="Block"), range(40))
+    assert choose_method(wrapped) == "stabilizer"
+
+    g = triangle_isolated()
+    counts, qc = run_grover(g, k=2, iterations=1, shots=64,
+                            simulation_method="matrix_product_state", precision="single")
+    assert sum(counts.values()) == 64
+    assert choose_method(qc) == "statevector"
+    assert make_backend(qc, "automatic").options.method == "statevector"
+
+def test_resource_estimates_match_built_circuits():
+    from qiskit import QuantumCircuit
+    from Implementation.grover import oracle_circuit, diffuser
+    from Implementation.dominating_set import aux_qubits_needed
+    g = path_5()
+    for pool_size, synthesis in [(None, "generic"), (None, "neighborhood"), (2, "generic")]:
+        qc = oracle_circuit(g, 2, 3, aux_qubits_needed(5, 3, 2, pool_size, synthesis),
+                            pool_size, synthesis)
+        estimate = estimate_all_dominated(g, 2, pool_size, synthesis)
+        ops = qc.count_ops()
+        for name in ("x", "cx", "ccx", "mcx"):
+            assert estimate[name] == ops.get(name, 0)
+        assert estimate["qubits"] == qc.num_qubits
+        assert estimate["depth"] == qc.depth()
+
+    qc = QuantumCircuit(6)
+    qc.append(diffuser(6), range(6))
+    assert estimate_diffuser(6)["size"] == qc.decompose().size()
+
+    full = build_grover_circuit(g, 2, iterations=2).decompose()
+    estimate = estimate_grover(g, 2, iterations=2)
+    assert estimate["size"] == full.size()
+    assert estimate["depth"] >= full.depth()
+
+def test_profiler_times_each_stage():
+    g = triangle_isolated()
+    profiler = Profiler()
+    run_grover(g, k=2, iterations=1, shots=64, decode=True, profiler=profiler)
+    assert [row[0] for row in profiler.report()] == ["construct", "transpile", "simulate", "decode"]
+    assert all(seconds >= 0 for seconds in profiler.timings.values())
+
+def test_oracle_truth_table():
+    g = path_5()
+    for kwargs in [dict(k=2), dict(k=2, synthesis="neighborhood"), dict(k=2, pool_size=2),
+                   dict(k=3, synthesis="neighborhood"), dict(encoding="subset")]:
+        report = check_oracle(g, **kwargs)
+        assert report["ok"], (kwargs, report)
+
+def test_oracle_check_reports_bugs(monkeypatch):
+    import Implementation.grover as grover
+    from Implementation.dominating_set import DominatedConst
+
+    def no_uncompute(G, circuit, A_list, AUX, b, targets=None):
+        flags, inner_aux = AUX[0:G.n], AUX[G.n:]
+        for v in range(G.n):
+            DominatedConst(G, circuit, A_list, v, inner_aux, flags[v])
+        circuit.mcx(list(flags), b)
+
+    monkeypatch.setattr(grover, "AllDominatedConst", no_uncompute)
+    report = check_oracle(path_5(), k=2, synthesis="neighborhood")
+    assert not report["ok"]
+    assert report["dirty_ancillas"] and not report["mismatched"]
+
+    # Aux qubits beyond the first 64 are checked as well: leave only the flag
+    # of the last vertex of a 70-vertex path (aux index 69) computed
+    def last_flag_dirty(G, circuit, A_list, AUX, b, targets=None):
+        flags, inner_aux = AUX[0:G.n], AUX[G.n:]
+        for v in range(G.n):
+            DominatedConst(G, circuit, A_list, v, inner_aux, flags[v])
+        circuit.mcx(list(flags), b)
+        for v in range(G.n - 1):
+            DominatedConst(G, circuit, A_list, v, inner_aux, flags[v])
+
+    monkeypatch.setattr(grover, "AllDominatedConst", last_flag_dirty)
+    report = check_oracle(Graph.from_edges(70, [(u, u + 1) for u in range(69)]), k=1,
+                          synthesis="neighborhood")
+    assert report["dirty_ancillas"] == [68, 69] and not report["mismatched"]
+
+def test_lightweight_imports_and_cli(capsys):
+    import json
+    import subprocess
+    import pytest
+    from Implementation.__main__ import main
+
+    # Building and checking circuits must not pull in the simulator or plotting
+    code = ("import sys, Implementation.oracle_check, Implementation.resources; "
+            "print(sorted(m for m in ('qiskit_aer', 'matplotlib') if m in sys.modules))")
+    root = os.path.join(os.path.dirname(__file__), '..')
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True,
+                         text=True, check=True).stdout
+    assert out.strip() == "[]"
+    # Nor may sweep workers pay for scipy.stats (only streamed runs use it)
+    code = ("import sys, Implementation.sweep, Implementation.dataset; "
+            "print('scipy.stats' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True,
+                         text=True, check=True).stdout
+    assert out.strip() == "False"
+
+    assert main(["classical", "star:5"]) == 0
+    assert json.loads(capsys.readouterr().out)["minimum"] == [0]
+    assert main(["check", "path:5", "-k", "2"]) == 0
+    assert json.loads(capsys.readouterr().out)["ok"]
+    with pytest.raises(SystemExit):
+        main(["check", "path:5"])
+    assert "-k" in capsys.readouterr().err
+
+def test_mcx_synthesis_modes_are_equivalent():
+    from qiskit.quantum_info import Operator, Statevector
+    from Implementation.grover import oracle_circuit, diffuser
+    from Implementation.dominating_set import aux_qubits_needed
+    g = path_5()
+    num_aux = aux_qubits_needed(5, 3, 2, None, "neighborhood")
+    raw = oracle_circuit(g, 2, 3, num_aux, synthesis="neighborhood", mcx_synthesis=None)
+    state = Statevector.from_label("0" * (num_aux + 1) + "101001")
+    expected = state.evolve(raw)
+    for mode in ("native", "ancilla", "toffoli"):
+        qc = oracle_circuit(g, 2, 3, num_aux, synthesis="neighborhood", mcx_synthesis=mode)
+        assert state.evolve(qc).equiv(expected), mode
+        assert check_oracle(g, k=2, synthesis="neighborhood", mcx_synthesis=mode)["ok"]
+    # Adjacent X masks cancel, and "toffoli" leaves no MCX behind
+    native = oracle_circuit(g, 2, 3, num_aux, synthesis="neighborhood")
+    assert native.count_ops()["x"] < raw.count_ops()["x"]
+    toffoli = oracle_circuit(g, 2, 3, num_aux, synthesis="neighborhood", mcx_synthesis="toffoli")
+    assert "mcx" not in toffoli.count_ops()
+    assert estimate_all_dominated(g, 2, synthesis="neighborhood",
+                                  mcx_synthesis="toffoli")["mcx"] == 0
+
+    # A self-loop must not undo the Equal flag of its vertex
+    looped = Graph.from_edges(4, [(0, 1), (1, 2)])
+    looped.add_edge(3, 3)
+    for mode in (None, "native"):
+        assert check_oracle(looped, 2, synthesis="generic", mcx_synthesis=mode)["ok"], mode
+
+    # The diffuser only borrows its ancillas while they are |0>
+    reference = Operator(diffuser(5, mcx_synthesis=None))
+    for mode in ("ancilla", "toffoli"):
+        qc = diffuser(5, 2, mcx_synthesis=mode)
+        zero_ancillas = Operator(qc).data.reshape([4, 32, 4, 32])[0, :, 0, :]
+        assert Operator(zero_ancillas).equiv(reference), mode
+
+def test_toffoli_mcx_is_exact():
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Operator
+    from Implementation.mcx_synthesis import MCXSynthesizer
+
+    # The dirty chain and the split use relative-phase Toffolis, so compare
+    # full operators (phases included) for any state of the idle qubits
+    for m in (3, 4, 5):
+        for idle in sorted({0, 1, m - 2}):
+            qc, reference = QuantumCircuit(m + 1 + idle), QuantumCircuit(m + 1 + idle)
+            synthesizer = MCXSynthesizer(qc, "toffoli")
+            synthesizer.mcx(list(range(m)), m)
+            synthesizer.flush()
+            reference.mcx(list(range(m)), m)
+            assert Operator(qc) == Operator(reference), (m, idle)
+            assert idle == 0 or "mcx" not in qc.count_ops(), (m, idle)
+
+def test_incremental_oracle_follows_edits():
+    import numpy as np
+    import pytest
+    from Implementation.incremental import IncrementalOracle
+    from Implementation.reversible import simulate
+
+    def marks_dominating_sets(inc):
+        qc = inc.circuit()
+        inputs = qc.qubits[:inc.num_input_qubits]
+        result = simulate(qc, {tuple(inputs): np.arange(2**len(inputs), dtype=np.uint64)})
+        output = result.value([qc.qubits[-1]]).astype(bool)
+        return (np.array_equal(output, domination_mask(inc.graph, inc.k))
+                and not result.dirty(qc.qubits[len(inputs):-1]).any())
+
+    for synthesis in ("generic", "neighborhood"):
+        g = path_5()
+        inc = IncrementalOracle(g, 2, synthesis)
+        assert marks_dominating_sets(inc)
+        g.add_edge(0, 4)
+        g.remove_edge(1, 2)
+        rebuilt = inc.update()
+        if synthesis == "generic":
+            assert rebuilt == {("edge", 0, 4), ("edge", 1, 2)}
+        else:
+            assert rebuilt == {("vertex", v) for v in (0, 1, 2, 4)}
+        assert marks_dominating_sets(inc)
+        assert inc.update() == set()
+        # The cached oracle is re-spliced, not rebuilt: it matches a fresh assembly
+        g.add_edge(1, 2)
+        g.add_edge(2, 4)
+        inc.update()
+        assert inc.circuit() == IncrementalOracle(g, 2, synthesis).circuit()
+
+    # run_grover reuses the transpiled segments and matches a fresh build
+    g = triangle_isolated()
+    inc = IncrementalOracle(g, 2, "neighborhood")
+    run_grover(g, k=2, iterations=1, shots=None, synthesis="neighborhood", incremental=inc)
+    g.remove_edge(0, 2)
+    probs, _ = run_grover(g, k=2, iterations=1, shots=None, synthesis="neighborhood",
+                          incremental=inc)
+    expected, _ = run_grover(g, k=2, iterations=1, shots=None, synthesis="neighborhood")
+    assert probs.keys() == expected.keys()
+    assert all(abs(probs[key] - expected[key]) < 1e-9 for key in expected)
+    backend = make_backend(None, "statevector")
+    assert inc.transpiled(backend) == IncrementalOracle(g, 2, "neighborhood").transpiled(backend)
+    with pytest.raises(ValueError):
+        run_grover(g, k=2, synthesis="neighborhood", incremental=inc, cache=CircuitCache())
+
+def test_decomposition_matches_minimum():
+    import numpy as np
+    from Implementation.decomposition import reduce_graph, solve_by_components
+    from Implementation.classical import minimum_dominating_set
+
+    # Triangle with a tail (2-3-4) plus a separate edge: the leaf rule forces
+    # 3 and one end of the edge, the triangle only has to dominate 0 and 1
+    g = Graph.from_edges(7, [(0, 1), (1, 2), (0, 2), (2, 3), (3, 4), (5, 6)])
+    forced, components = reduce_graph(g)
+    assert forced == [3, 5]
+    assert [(c.vertices, c.targets) for c in components] == [([0, 1, 2], [0, 1])]
+    assert check_oracle(components[0].graph, k=1, targets=[0, 1])["ok"]
+    size, chosen, rows = solve_by_components(g, max_workers=1, iterations="auto", shots=256)
+    assert size == 3 and g.is_dominating_set(chosen)
+    assert rows[0]["verified"] and rows[0]["qubits"] < total_qubits(7, 3)
+
+    # Experiment 1: the isolated vertex is forced, the triangle is searched alone
+    forced, components = reduce_graph(triangle_isolated())
+    assert forced == [3] and components[0].targets is None
+
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        n = int(rng.integers(2, 10))
+        g = Graph.from_edges(n, [(u, v) for u in range(n) for v in range(u + 1, n)
+                                 if rng.random() < 0.25])
+        size, chosen, _ = solve_by_components(g, max_workers=1, method="phase",
+                                              iterations="auto", shots=None)
+        assert g.is_dominating_set(chosen)
+        assert size == len(minimum_dominating_set(g))
+
+def test_stream_stops_early():
+    import asyncio
+    import pytest
+    from Implementation.streaming import stream_grover, astream_grover
+
+    g = Graph()
+    g.set_number_vertices(6)
+    for u in range(6):
+        g.add_edge(u, (u + 1) % 6)
+
+    # gamma(C6) = 2: k=1 marks nothing and looks uniform, k=2 hits at once
+    updates = list(stream_grover(g, 1, shots=1024, method="phase", seed=0))
+    assert updates[-1]["status"] == "uniform" and updates[-1]["shots"] < 1024
+    assert all(u["status"] == "running" for u in updates[:-1])
+    last = list(stream_grover(g, 2, shots=1024, method="phase", seed=0))[-1]
+    assert last["status"] == "found" and last["shots"] == 64
+    assert g.is_dominating_set(last["best_set"])
+
+    # gamma(C12) = 4, but 1024 shots are too few for 256 outcomes to call k=2 uniform
+    c12 = Graph.from_edges(12, [(u, (u + 1) % 12) for u in range(12)])
+    sparse = list(stream_grover(c12, 2, shots=1024, method="phase", seed=0))[-1]
+    assert sparse["status"] == "inconclusive" and sparse["shots"] == 1024
+
+    async def collect():
+        return [u async for u in astream_grover(g, 2, method="phase", seed=0)]
+    assert asyncio.run(collect())[-1] == last
+
+    row = run_task(g, 2, None, 1024, "phase", "generic", stream=True)
+    assert row["status"] == "found" and row["success"] and row["shots"] == 64
+    for shots in (0, None):
+        with pytest.raises(ValueError):
+            run_task(g, 2, None, shots, "phase", "generic", stream=True)
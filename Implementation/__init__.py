@@ -0,0 +1,49 @@
+"""
+Quantum dominating-set search with Grover's algorithm, and the reversible
+arithmetic of Project 1.
+
+Importing the package is cheap: the public names below are resolved on
+first access (PEP 562), so a worker that only builds or verifies circuits
+never loads qiskit_aer or matplotlib. Submodules can also be imported
+directly, e.g. ``from Implementation.grover import run_grover``.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "Graph": "graph",
+    "make_graph": "families",
+    "FAMILIES": "families",
+    "run_grover": "grover",
+    "run_grover_batch": "grover",
+    "build_grover_circuit": "grover",
+    "resolve_iterations": "grover",
+    "GroverResult": "results",
+    "minimum_dominating_set": "classical",
+    "greedy_dominating_set": "classical",
+    "is_feasible": "classical",
+    "estimate_grover": "resources",
+    "check_oracle": "oracle_check",
+    "make_backend": "backends",
+    "run_circuit": "backends",
+    "Profiler": "profiling",
+    "find_minimum": "sweep",
+    "IncrementalOracle": "incremental",
+    "reduce_graph": "decomposition",
+    "solve_by_components": "decomposition",
+    "stream_grover": "streaming",
+    "ResultStore": "dataset",
+    "run_dataset": "dataset",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,96 @@
+"""
+Command-line entry point: python -m Implementation <command> <graph> ...
+
+<graph> is an edge file (see Graph.from_edge_file) or a family spec such
+as "cycle:6", "grid:2,3" or "random:8,0.5,0". Every command imports only
+the modules it needs, so "estimate", "check" and "classical" never load
+the simulator.
+"""
+import argparse
+import json
+import os
+import sys
+
+def load_graph(spec):
+    """Graph from an edge file path or a 'family:p1,p2,...' spec."""
+    if os.path.exists(spec):
+        from .graph import Graph
+        return Graph.from_edge_file(spec)
+    from .families import make_graph
+    family, _, params = spec.partition(":")
+    values = [float(p) if "." in p else int(p) for p in params.split(",") if p]
+    return make_graph(family, *values)
+
+def _iterations(value):
+    if value in (None, "auto"):
+        return value
+    return int(value)
+
+def cmd_run(args, graph):
+    from .grover import run_grover
+    from .profiling import Profiler
+    profiler = Profiler()
+    result, _ = run_grover(graph, args.k, iterations=_iterations(args.iterations),
+                           shots=args.shots, method=args.method, synthesis=args.synthesis,
+                           encoding=args.encoding, decode=True, profiler=profiler,
+                           mcx_synthesis=args.mcx_synthesis)
+    return {"success_probability": result.success_probability,
+            "best_set": result.best_set,
+            "timings": profiler.timings}
+
+def cmd_estimate(args, graph):
+    from .resources import estimate_grover
+    return estimate_grover(graph, args.k, iterations=_iterations(args.iterations),
+                           synthesis=args.synthesis, mcx_synthesis=args.mcx_synthesis)
+
+def cmd_check(args, graph):
+    from .oracle_check import check_oracle
+    return check_oracle(graph, args.k, synthesis=args.synthesis, encoding=args.encoding,
+                        mcx_synthesis=args.mcx_synthesis)
+
+def cmd_classical(args, graph):
+    from .classical import minimum_dominating_set, greedy_dominating_set
+    return {"minimum": minimum_dominating_set(graph),
+            "greedy": greedy_dominating_set(graph)}
+
+COMMANDS = {
+    "run": (cmd_run, "Run Grover's search and verify the measured sets"),
+    "estimate": (cmd_estimate, "Resource estimate of the Grover circuit (no simulation)"),
+    "check": (cmd_check, "Exhaustive classical check of the oracle's truth table"),
+    "classical": (cmd_classical, "Exact and greedy classical dominating sets"),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Implementation", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("graph", help="edge file or family spec, e.g. cycle:6")
+        if name != "classical":
+            sub.add_argument("-k", type=int, required=name != "check",
+                             help="dominating set size (check: all sizes with --encoding subset)")
+            sub.add_argument("--synthesis", default="generic")
+            sub.add_argument("--mcx-synthesis", default="native",
+                             choices=("native", "ancilla", "toffoli"))
+        if name in ("run", "estimate"):
+            sub.add_argument("--iterations", default=None, help="int, or 'auto'")
+        if name in ("run", "check"):
+            sub.add_argument("--encoding", default="index", choices=("index", "subset"))
+        if name == "run":
+            sub.add_argument("--shots", type=int, default=1024)
+            sub.add_argument("--method", default="aer", choices=("aer", "phase"))
+    args = parser.parse_args(argv)
+    if args.command == "check" and args.k is None and args.encoding != "subset":
+        parser.error("check needs -k unless --encoding subset is given")
+
+    graph = load_graph(args.graph)
+    handler = COMMANDS[args.command][0]
+    output = handler(args, graph)
+    json.dump(output, sys.stdout, indent=2, default=lambda value: value.tolist()
+              if hasattr(value, "tolist") else list(value))
+    print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
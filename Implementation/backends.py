@@ -0,0 +1,122 @@
+from qiskit import transpile
+
+# qiskit_aer is imported on first use: it is the slowest import in the
+# package and modules that only build or count circuits never need it.
+
+# Widest circuit simulated with a dense statevector before switching methods
+STATEVECTOR_MAX_QUBITS = 28
+# Largest T-count for which the extended stabilizer method is worth it
+EXTENDED_STABILIZER_MAX_T = 40
+
+CLIFFORD_GATES = {"x", "y", "z", "h", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz",
+                  "swap", "id", "measure", "barrier", "reset"}
+# T-count of the non-Clifford gates we know how to cost
+T_COUNT = {"t": 1, "tdg": 1, "ccx": 7}
+
+METHODS = ("automatic", "statevector", "matrix_product_state", "stabilizer",
+           "extended_stabilizer")
+
+def gate_counts(circuit):
+    """
+    circuit.count_ops() with composite gates (such as the opaque "Oracle"
+    and "Diffuser" of build_grover_circuit) counted as the gates of their
+    definitions, recursively. Clifford gates, the gates of T_COUNT and mcx
+    are counted as they are.
+    """
+    leaves = CLIFFORD_GATES | set(T_COUNT) | {"mcx"}
+    expanded = {}
+
+    def count(definition):
+        key = id(definition)
+        if key not in expanded:
+            counts = {}
+            for instruction in definition.data:
+                operation = instruction.operation
+                inner = None if operation.name in leaves else operation.definition
+                for name, n in (count(inner) if inner is not None
+                                else {operation.name: 1}).items():
+                    counts[name] = counts.get(name, 0) + n
+            # Holding the definition keeps its id from being reused
+            expanded[key] = (definition, counts)
+        return expanded[key][1]
+
+    return count(circuit)
+
+def choose_method(circuit):
+    """
+    Picks an Aer simulation method from the circuit's width and gate set:
+    stabilizer for Clifford-only circuits, statevector up to
+    STATEVECTOR_MAX_QUBITS qubits, extended stabilizer for wide circuits with
+    few T gates, and matrix product states otherwise.
+    The gate set is read through gate_counts, so opaque blocks do not hide
+    what they contain. It is still a heuristic: a wide Grover circuit has
+    MCX gates and lands on matrix product states, whose cost depends on the
+    entanglement the run builds up, not on anything counted here.
+    """
+    ops = gate_counts(circuit)
+    if set(ops) <= CLIFFORD_GATES:
+        return "stabilizer"
+    if circuit.num_qubits <= STATEVECTOR_MAX_QUBITS:
+        return "statevector"
+    if set(ops) <= CLIFFORD_GATES | set(T_COUNT):
+        t_count = sum(T_COUNT[name] * count for name, count in ops.items() if name in T_COUNT)
+        if t_count <= EXTENDED_STABILIZER_MAX_T:
+            return "extended_stabilizer"
+    return "matrix_product_state"
+
+def make_backend(circuit=None, method="automatic", precision="double",
+                 max_parallel_threads=0, max_memory_mb=0):
+    """
+    AerSimulator configured for 'circuit'.
+    method="automatic" resolves through choose_method; precision is "single"
+    or "double"; 0 for threads/memory means Aer's default (all cores, all memory).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown simulation method '{method}', expected one of {METHODS}")
+    if precision not in ("single", "double"):
+        raise ValueError(f"Unknown precision '{precision}', expected 'single' or 'double'")
+    if method == "automatic" and circuit is not None:
+        method = choose_method(circuit)
+    from qiskit_aer import AerSimulator
+    return AerSimulator(method=method, precision=precision,
+                        max_parallel_threads=max_parallel_threads,
+                        max_memory_mb=max_memory_mb)
+
+def probability_circuit(circuit):
+    """
+    Copy of 'circuit' with its measurements replaced by a save_probabilities
+    instruction on the measured qubits (in classical bit order), so a single
+    execution returns the exact outcome distribution.
+    """
+    measured = {}
+    stripped = circuit.copy_empty_like()
+    for instruction in circuit.data:
+        if instruction.operation.name == "measure":
+            clbit = circuit.find_bit(instruction.clbits[0]).index
+            measured[clbit] = instruction.qubits[0]
+        else:
+            stripped.append(instruction)
+    qubits = [measured[c] for c in sorted(measured)]
+    stripped.save_probabilities(qubits)
+    return stripped
+
+def probabilities_from_result(result, width, cutoff=0.0):
+    """Probabilities saved by probability_circuit, keyed like Qiskit counts."""
+    probabilities = result.data(0)["probabilities"]
+    return {format(i, f'0{width}b'): float(p)
+            for i, p in enumerate(probabilities) if p > cutoff}
+
+def run_circuit(circuit, shots=1024, method="automatic", precision="double",
+                max_parallel_threads=0, max_memory_mb=0):
+    """
+    Transpiles and runs 'circuit' on a backend chosen by make_backend.
+    shots=None is the shot-free mode: exact probabilities of the measured
+    bits are returned instead of sampled counts.
+    """
+    backend = make_backend(circuit, method, precision, max_parallel_threads, max_memory_mb)
+    if shots is None:
+        width = sum(1 for inst in circuit.data if inst.operation.name == "measure")
+        t_qc = transpile(probability_circuit(circuit), backend)
+        return probabilities_from_result(backend.run(t_qc, shots=1).result(), width)
+    t_qc = transpile(circuit, backend)
+    return backend.run(t_qc, shots=shots).result().get_counts()
@@ -0,0 +1,215 @@
+import json
+import platform
+import resource
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import qiskit
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+
+from .families import make_graph
+from .grover import run_grover, resolve_iterations
+from .profiling import Profiler
+from .resources import estimate_grover
+from .backends import make_backend, probability_circuit, probabilities_from_result
+from .modular_exponentiation import set_bits, add, subtract, greater_or_eq
+
+# Metrics compared against the baseline, and which direction is better
+TIME_METRICS = ["construct_seconds", "transpile_seconds", "simulate_seconds", "decode_seconds"]
+MEMORY_METRICS = ["peak_rss_mb"]
+COUNT_METRICS = ["qubits", "size", "depth", "mcx", "t_count"]
+QUALITY_METRICS = ["success_probability"]
+
+def default_cases(quick=False):
+    """
+    Benchmark cases: Grover over the graph families and the arithmetic
+    circuits over register widths. quick=True keeps only the smallest ones.
+    """
+    graphs = [("path", (4,)), ("cycle", (4,)), ("star", (4,)), ("grid", (2, 2)),
+              ("random", (4, 0.5, 0))]
+    if not quick:
+        graphs += [("path", (6,)), ("cycle", (6,)), ("star", (8,)), ("grid", (2, 3)),
+                   ("random", (6, 0.5, 0))]
+    widths = (2, 3) if quick else (2, 3, 4, 5)
+
+    cases = [{"kind": "grover", "family": family, "params": list(params), "k": 2}
+             for family, params in graphs]
+    cases += [{"kind": "arithmetic", "op": op, "width": width}
+              for op in ("add", "subtract", "greater_or_eq") for width in widths]
+    return cases
+
+def case_name(case):
+    if case["kind"] == "grover":
+        params = ",".join(str(p) for p in case["params"])
+        return f"grover/{case['family']}({params})/k={case['k']}"
+    return f"{case['op']}/width={case['width']}"
+
+def _peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_grover_case(case, shots=1024):
+    graph = make_graph(case["family"], *case["params"])
+    k = case["k"]
+    profiler = Profiler()
+    result, _ = run_grover(graph, k, iterations="auto", shots=shots, decode=True,
+                           profiler=profiler)
+    estimate = estimate_grover(graph, k, iterations=resolve_iterations(graph, k, "auto"))
+
+    record = {f"{stage}_seconds": profiler.timings.get(stage, 0.0)
+              for stage in ("construct", "transpile", "simulate", "decode")}
+    record.update({name: estimate[name] for name in COUNT_METRICS})
+    record["success_probability"] = result.success_probability
+    return record
+
+def arithmetic_circuit(op, width, a, b):
+    """Circuit computing op(a, b) on width-bit registers, measuring the result; also returns the expected value."""
+    n = width
+    qr_a = QuantumRegister(n, 'a')
+    qr_b = QuantumRegister(n, 'b')
+    if op == "greater_or_eq":
+        qr_r = QuantumRegister(1, 'res')
+        qr_aux = QuantumRegister(2 * n, 'aux')
+        expected = int(a >= b)
+    else:
+        qr_r = QuantumRegister(n, 'r')
+        qr_aux = QuantumRegister(n, 'aux')
+        expected = (a + b if op == "add" else a - b) % (1 << n)
+    cr = ClassicalRegister(len(qr_r), 'c')
+    qc = QuantumCircuit(qr_a, qr_b, qr_r, qr_aux, cr)
+    set_bits(qc, qr_a, a)
+    set_bits(qc, qr_b, b)
+
+    if op == "add":
+        add(qc, qr_a, qr_b, qr_r, qr_aux)
+    elif op == "subtract":
+        subtract(qc, qr_a, qr_b, qr_r, qr_aux)
+    elif op == "greater_or_eq":
+        greater_or_eq(qc, qr_a, qr_b, qr_r[0], qr_aux)
+    else:
+        raise ValueError(f"Unknown arithmetic op '{op}'")
+    qc.measure(qr_r, cr)
+    return qc, expected
+
+def run_arithmetic_case(case, seed=0):
+    rng = np.random.default_rng(seed)
+    a, b = (int(x) for x in rng.integers(0, 1 << case["width"], size=2))
+    profiler = Profiler()
+    with profiler.stage("construct"):
+        qc, expected = arithmetic_circuit(case["op"], case["width"], a, b)
+        backend = make_backend(qc)
+    with profiler.stage("transpile"):
+        t_qc = transpile(qc, backend)
+    with profiler.stage("simulate"):
+        result = backend.run(probability_circuit(t_qc), shots=1).result()
+        probabilities = probabilities_from_result(result, qc.num_clbits)
+
+    ops = qc.count_ops()
+    record = {f"{stage}_seconds": profiler.timings.get(stage, 0.0)
+              for stage in ("construct", "transpile", "simulate", "decode")}
+    record.update({
+        "qubits": qc.num_qubits,
+        "size": qc.size(),
+        "depth": qc.depth(),
+        "mcx": ops.get("mcx", 0),
+        "t_count": 7 * ops.get("ccx", 0),
+        "success_probability": probabilities.get(format(expected, f'0{qc.num_clbits}b'), 0.0),
+    })
+    return record
+
+def run_case(case, shots=1024):
+    """Runs one benchmark case and returns its record (timings, counts, memory)."""
+    if case["kind"] == "grover":
+        record = run_grover_case(case, shots)
+    else:
+        record = run_arithmetic_case(case)
+    record["name"] = case_name(case)
+    record["case"] = case
+    record["peak_rss_mb"] = _peak_rss_mb()
+    return record
+
+def run_suite(cases=None, shots=1024, isolate=True):
+    """
+    Runs the cases one at a time and returns their records.
+    With isolate, every case runs in a fresh worker process so that
+    peak_rss_mb is that case's own high-water mark.
+    """
+    if cases is None:
+        cases = default_cases()
+    if not isolate:
+        return [run_case(case, shots) for case in cases]
+    records = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for case in cases:
+            records.append(pool.submit(run_case, case, shots).result())
+    return records
+
+def write_results(records, filename):
+    """Writes the records with the environment they were measured in as JSON."""
+    data = {
+        "qiskit": qiskit.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "records": records,
+    }
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def load_results(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)["records"]
+
+def compare(records, baseline, tolerance=0.25, min_seconds=0.05):
+    """
+    Compares records against baseline records (matched by name).
+    Times and memory regress when they grow by more than 'tolerance'
+    (relative) and min_seconds (absolute, times only); gate counts are
+    reported whenever they change; success probability regresses when it
+    drops by more than 0.05. Returns rows of
+    {name, metric, baseline, current, ratio, status}, only for changes.
+    """
+    previous = {record["name"]: record for record in baseline}
+    rows = []
+    for record in records:
+        name = record["name"]
+        if name not in previous:
+            rows.append({"name": name, "metric": None, "baseline": None,
+                         "current": None, "ratio": None, "status": "new"})
+            continue
+        old = previous[name]
+        for metric in TIME_METRICS + MEMORY_METRICS + COUNT_METRICS + QUALITY_METRICS:
+            before, after = old.get(metric), record.get(metric)
+            if before is None or after is None:
+                continue
+            ratio = after / before if before else None
+            status = None
+            if metric in QUALITY_METRICS:
+                if after < before - 0.05:
+                    status = "regression"
+                elif after > before + 0.05:
+                    status = "improvement"
+            elif metric in COUNT_METRICS:
+                if after != before:
+                    status = "regression" if after > before else "improvement"
+            else:
+                slack = min_seconds if metric in TIME_METRICS else 0.0
+                if after > before * (1 + tolerance) and after - before > slack:
+                    status = "regression"
+                elif after < before / (1 + tolerance) and before - after > slack:
+                    status = "improvement"
+            if status is not None:
+                rows.append({"name": name, "metric": metric, "baseline": before,
+                             "current": after, "ratio": ratio, "status": status})
+    return rows
+
+def print_comparison(rows):
+    if not rows:
+        print("No changes against the baseline.")
+        return
+    for row in rows:
+        if row["status"] == "new":
+            print(f"{'new':<12} {row['name']}")
+            continue
+        ratio = f"x{row['ratio']:.2f}" if row["ratio"] is not None else ""
+        print(f"{row['status']:<12} {row['name']:<36} {row['metric']:<20} "
+              f"{row['baseline']:.4g} -> {row['current']:.4g} {ratio}")
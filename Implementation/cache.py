@@ -0,0 +1,85 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from qiskit import qpy
+import qiskit
+
+def graph_fingerprint(graph):
+    """Canonical hash of the graph: vertex count plus the sorted edge set."""
+    data = f"{graph.n}|".encode() + graph.edges().astype('<i8').tobytes()
+    return hashlib.sha256(data).hexdigest()
+
+def backend_fingerprint(backend):
+    """Identifies the transpilation target of a backend (name + supported operations)."""
+    ops = sorted(str(op) for op in backend.operation_names)
+    return f"{backend.name}|" + ",".join(ops)
+
+def cache_key(*parts):
+    """Content-addressed key built from any number of parts."""
+    # The qiskit version is part of the key: QPY files and transpiler output
+    # are not guaranteed to be stable across releases.
+    data = "|".join(str(p) for p in (qiskit.__version__,) + parts)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+class CircuitCache:
+    """
+    In-memory LRU cache of circuits with an optional on-disk QPY store.
+    Memory hits are returned as-is; disk hits are loaded and promoted to memory.
+    """
+    def __init__(self, maxsize=32, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.qpy")
+
+    def get(self, key):
+        """Returns the cached circuit for key, or None on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), 'rb') as f:
+                circuit = qpy.load(f)[0]
+            self._remember(key, circuit)
+            self.hits += 1
+            return circuit
+
+        self.misses += 1
+        return None
+
+    def put(self, key, circuit):
+        """Stores circuit under key (and on disk if a directory is set)."""
+        self._remember(key, circuit)
+        if self.directory is not None:
+            # Write to a temp file first so a crash never leaves a truncated entry
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                qpy.dump(circuit, f)
+            os.replace(tmp_path, self._path(key))
+
+    def _remember(self, key, circuit):
+        self._entries[key] = circuit
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops the in-memory entries (the on-disk store is kept)."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        if key in self._entries:
+            return True
+        return self.directory is not None and os.path.exists(self._path(key))
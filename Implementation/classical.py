@@ -0,0 +1,115 @@
+import numpy as np
+
+# Classical dominating-set baselines. Vertex sets are Python int bitsets
+# (bit v set = vertex v), so union/difference/popcount are single operations.
+
+def closed_neighborhood_masks(graph):
+    """Bitset of N[u] = {u} + neighbors(u) for every vertex u."""
+    masks = []
+    for u, neighbors in enumerate(graph.adj_list):
+        mask = 1 << u
+        for v in neighbors:
+            mask |= 1 << v
+        masks.append(mask)
+    return masks
+
+def _vertices(mask):
+    """Vertices whose bit is set in mask, in increasing order."""
+    vertices = []
+    while mask:
+        low = mask & -mask
+        vertices.append(low.bit_length() - 1)
+        mask ^= low
+    return vertices
+
+def verify(graph, vertices):
+    """O(k * deg) check that 'vertices' dominates the graph."""
+    return graph.is_dominating_set(vertices)
+
+def greedy_dominating_set(graph):
+    """Greedy upper bound: repeatedly take the vertex dominating the most undominated vertices."""
+    masks = closed_neighborhood_masks(graph)
+    undominated = (1 << graph.n) - 1
+    chosen = []
+    while undominated:
+        best = max(range(graph.n), key=lambda u: (masks[u] & undominated).bit_count())
+        chosen.append(best)
+        undominated &= ~masks[best]
+    return sorted(chosen)
+
+def lower_bound(graph):
+    """
+    Cheap lower bound on the domination number: the larger of
+    ceil(n / (max_degree + 1)) and the size of a greedy 2-packing
+    (vertices pairwise at distance >= 3 need distinct dominators).
+    """
+    n = graph.n
+    if n == 0:
+        return 0
+    indptr, _ = graph.csr()
+    max_degree = int(np.diff(indptr).max())
+    degree_bound = -(-n // (max_degree + 1))
+
+    masks = closed_neighborhood_masks(graph)
+    available = (1 << n) - 1
+    packing = 0
+    # Low-degree vertices block the fewest others, so try them first
+    for u in sorted(range(n), key=lambda u: masks[u].bit_count()):
+        if available >> u & 1:
+            packing += 1
+            # Remove everything within distance 2 of u
+            ball = 0
+            for v in _vertices(masks[u]):
+                ball |= masks[v]
+            available &= ~ball
+    return max(degree_bound, packing)
+
+def minimum_dominating_set(graph):
+    """
+    Exact minimum dominating set by bitset branch and bound.
+    Branches on the undominated vertex with the fewest possible dominators and
+    prunes with |chosen| + ceil(undominated / best_cover) >= best.
+    """
+    n = graph.n
+    masks = closed_neighborhood_masks(graph)
+    best = greedy_dominating_set(graph)
+    best_size = len(best)
+    max_cover = max((m.bit_count() for m in masks), default=1)
+
+    def search(chosen, undominated):
+        nonlocal best, best_size
+        if not undominated:
+            if len(chosen) < best_size:
+                best, best_size = sorted(chosen), len(chosen)
+            return
+        remaining = undominated.bit_count()
+        if len(chosen) + -(-remaining // max_cover) >= best_size:
+            return
+
+        # Undominated vertex with the fewest candidate dominators
+        u = min(_vertices(undominated), key=lambda v: masks[v].bit_count())
+        candidates = sorted(_vertices(masks[u]),
+                            key=lambda w: -(masks[w] & undominated).bit_count())
+        for w in candidates:
+            chosen.append(w)
+            search(chosen, undominated & ~masks[w])
+            chosen.pop()
+
+    search([], (1 << n) - 1)
+    return best
+
+def domination_number(graph):
+    """Size of a minimum dominating set."""
+    return len(minimum_dominating_set(graph))
+
+def is_feasible(graph, k):
+    """
+    Whether a dominating set of size k exists (vertices may repeat, as in the
+    index encoding, so any k >= domination number works).
+    Uses the cheap bounds first and the exact solver only when they disagree.
+    """
+    if k >= len(greedy_dominating_set(graph)):
+        return True
+    if k < lower_bound(graph):
+        return False
+    return k >= domination_number(graph)
@@ -0,0 +1,112 @@
+from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister, transpile
+from qiskit.circuit.library import QFTGate
+import numpy as np
+
+from .dominating_set import aux_qubits_needed
+from .grover import oracle, diffuser, run_grover, decode_bitstring
+from .phase_oracle import count_marked, optimal_iterations
+from .backends import make_backend
+
+def grover_operator(graph, k, synthesis="generic"):
+    """One Grover iteration (Oracle then Diffuser) as a gate on [input, aux, target]."""
+    n = graph.n
+    n_bits_node = int(np.ceil(np.log2(n)))
+    num_input_qubits = k * n_bits_node
+    num_aux_qubits = aux_qubits_needed(n, n_bits_node, k, None, synthesis)
+
+    qc = QuantumCircuit(num_input_qubits + num_aux_qubits + 1)
+    qc.append(oracle(graph, k, n_bits_node, num_aux_qubits, synthesis=synthesis),
+              range(qc.num_qubits))
+    qc.append(diffuser(num_input_qubits), range(num_input_qubits))
+    gate = qc.to_gate()
+    gate.name = "Grover"
+    return gate, num_input_qubits
+
+def counting_circuit(graph, k, precision_qubits, synthesis="generic"):
+    """
+    Quantum counting: phase estimation of the Grover operator with
+    precision_qubits counting qubits. Counting qubit j controls G^(2^j).
+    """
+    grover_gate, num_input_qubits = grover_operator(graph, k, synthesis)
+    controlled_grover = grover_gate.control(1)
+
+    qr_count = QuantumRegister(precision_qubits, 'count')
+    qr_work = QuantumRegister(grover_gate.num_qubits, 'work')
+    cr = ClassicalRegister(precision_qubits, 'meas')
+    qc = QuantumCircuit(qr_count, qr_work, cr)
+
+    # Uniform superposition on the input, target in |->, counting register in |+>
+    qc.h(qr_count)
+    qc.h(qr_work[:num_input_qubits])
+    qc.x(qr_work[-1])
+    qc.h(qr_work[-1])
+
+    for j in range(precision_qubits):
+        for _ in range(2**j):
+            qc.append(controlled_grover, [qr_count[j]] + list(qr_work))
+
+    qc.append(QFTGate(precision_qubits).inverse(), qr_count)
+    qc.measure(qr_count, cr)
+    return qc, num_input_qubits
+
+def quantum_count(graph, k, precision_qubits=4, shots=1024, synthesis="generic"):
+    """
+    Estimates the number M of marked inputs with quantum counting.
+    Our diffuser is -(2|s><s| - I), so the Grover operator has eigenphases
+    pi +- theta with sin^2(theta/2) = M/N, which gives M = N cos^2(pi * phase).
+    """
+    qc, num_input_qubits = counting_circuit(graph, k, precision_qubits, synthesis)
+    backend = make_backend(qc)
+    counts = backend.run(transpile(qc, backend), shots=shots).result().get_counts()
+
+    y = int(max(counts, key=counts.get), 2)
+    phase = y / 2**precision_qubits
+    N = 2**num_input_qubits
+    return int(round(N * np.cos(np.pi * phase)**2))
+
+def choose_iterations(graph, k, mode="classical", precision_qubits=4, synthesis="generic"):
+    """
+    Iteration count floor(pi/4 * sqrt(N/M)) with M from exact classical
+    enumeration (mode="classical") or quantum counting (mode="quantum").
+    """
+    n_bits_node = int(np.ceil(np.log2(graph.n)))
+    N = 2**(k * n_bits_node)
+    if mode == "classical":
+        M = count_marked(graph, k)
+    elif mode == "quantum":
+        M = quantum_count(graph, k, precision_qubits, synthesis=synthesis)
+    else:
+        raise ValueError(f"Unknown mode '{mode}', expected 'classical' or 'quantum'")
+    return optimal_iterations(N, M)
+
+def exponential_search(graph, k, method="aer", synthesis="generic", max_oracle_calls=None,
+                       seed=None):
+    """
+    Randomized exponential-search schedule (Boyer, Brassard, Hoyer, Tapp) for an
+    unknown number of solutions: run a random number of iterations below a
+    growing bound m, check the single measured outcome classically, and grow m
+    by 6/5 after every failure.
+    Returns (vertices, oracle_calls); vertices is None if max_oracle_calls
+    (default 9/2 * sqrt(N), beyond which k is very unlikely to be feasible)
+    is exhausted.
+    """
+    n_bits_node = int(np.ceil(np.log2(graph.n)))
+    N = 2**(k * n_bits_node)
+    if max_oracle_calls is None:
+        max_oracle_calls = int(np.ceil(4.5 * np.sqrt(N)))
+
+    rng = np.random.default_rng(seed)
+    m = 1.0
+    oracle_calls = 0
+    while oracle_calls <= max_oracle_calls:
+        iterations = int(rng.integers(0, int(np.ceil(m))))
+        counts, _ = run_grover(graph, k, iterations=iterations, shots=1,
+                               method=method, synthesis=synthesis)
+        oracle_calls += iterations
+        # Padding index codes >= n are no vertex and are dropped
+        vertices = tuple(sorted(set(u for u in decode_bitstring(next(iter(counts)), k, n_bits_node)
+                                    if u < graph.n)))
+        if graph.is_dominating_set(vertices):
+            return vertices, oracle_calls
+        m = min(6 / 5 * m, np.sqrt(N))
+    return None, oracle_calls
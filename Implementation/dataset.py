@@ -0,0 +1,346 @@
+import json
+import os
+import time
+
+import numpy as np
+from qiskit.transpiler.exceptions import CircuitTooWideForTarget
+
+from .graph import Graph
+from .grover import run_grover
+from .profiling import Profiler, STAGES
+from .sweep import run_in_pool
+
+# Append-only result store of a dataset run, one directory:
+#   graphs.txt - graph ids (file paths), one per line; rows refer to them by line
+#   rows.bin   - one fixed-width ROW_DTYPE record per job, memory-mapped on read
+#   counts.bin - measured outcomes of all rows back to back (COUNT_DTYPE)
+#   sets.bin   - verified best sets back to back (int32 vertices)
+#   errors.txt - "<row>\t<message>" for every row with status "error"
+#   settings.json - shots, method and synthesis the rows were run with; a
+#                 store only ever holds one setting, so rows stay comparable
+# A row stores where its counts and set end; they start where the previous
+# row's end. Blobs are written before their row, so a run killed mid-append
+# leaves at most a partial record and unreferenced blob bytes, which the next
+# open cuts off. Only the parent process writes; workers return rows.
+
+# "error": the job raised (e.g. a malformed graph file); "memory" also covers
+# a worker killed outright
+STATUSES = ("ok", "memory", "too_wide", "error")
+
+# Files taken from a dataset directory (see Graph.from_edge_file)
+GRAPH_EXTENSIONS = (".txt", ".npy")
+
+# iterations column: the run_grover argument, with None and "auto" encoded;
+# shots is -1 for shot-free (probability) rows
+ITERATIONS_NONE = -1
+ITERATIONS_AUTO = -2
+
+ROW_DTYPE = np.dtype([
+    ("graph", "<i4"),
+    ("k", "<i4"),
+    ("iterations", "<i4"),
+    ("shots", "<i8"),
+    ("status", "<i1"),
+    ("num_bits", "<i2"),
+    ("success_probability", "<f8"),
+] + [(f"{stage}_seconds", "<f8") for stage in STAGES] + [
+    ("seconds", "<f8"),
+    ("counts_end", "<i8"),
+    ("set_end", "<i8"),
+])
+
+# Outcome bitstring as an integer, and its count (a probability when shots=None)
+COUNT_DTYPE = np.dtype([("outcome", "<u8"), ("count", "<f8")])
+SET_DTYPE = np.dtype("<i4")
+
+def _encode_iterations(iterations):
+    if iterations is None:
+        return ITERATIONS_NONE
+    if iterations == "auto":
+        return ITERATIONS_AUTO
+    return int(iterations)
+
+def _decode_iterations(value):
+    return {ITERATIONS_NONE: None, ITERATIONS_AUTO: "auto"}.get(int(value), int(value))
+
+class ResultStore:
+    """
+    Append-only, memory-mapped store of dataset rows (see the layout above).
+    Opening a store recovers from an interrupted append; completed() tells a
+    resumed run which jobs are already done, and use_settings() that it runs
+    them the same way.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._rows_path = os.path.join(directory, "rows.bin")
+        self._counts_path = os.path.join(directory, "counts.bin")
+        self._sets_path = os.path.join(directory, "sets.bin")
+        self._graphs_path = os.path.join(directory, "graphs.txt")
+        self._errors_path = os.path.join(directory, "errors.txt")
+        self._settings_path = os.path.join(directory, "settings.json")
+        for path in (self._rows_path, self._counts_path, self._sets_path, self._graphs_path,
+                     self._errors_path):
+            open(path, 'ab').close()
+
+        with open(self._graphs_path, 'r') as f:
+            self.graph_ids = f.read().splitlines()
+        self._graph_index = {graph_id: i for i, graph_id in enumerate(self.graph_ids)}
+        self._recover()
+        self.errors = {}
+        with open(self._errors_path, 'r') as f:
+            for line in f:
+                row, _, message = line.rstrip("\n").partition("\t")
+                if row.isdigit() and int(row) < self._num_rows:
+                    self.errors[int(row)] = message
+
+    @property
+    def settings(self):
+        """Settings of the stored rows (use_settings), or None for a new store."""
+        if not os.path.exists(self._settings_path):
+            return None
+        with open(self._settings_path, 'r') as f:
+            return json.load(f)
+
+    def use_settings(self, **settings):
+        """
+        Records the run settings on first use; afterwards raises ValueError
+        if they differ from those of the stored rows.
+        """
+        stored = self.settings
+        if stored is None:
+            with open(self._settings_path, 'w') as f:
+                json.dump(settings, f, indent=2)
+        elif stored != settings:
+            raise ValueError(f"Store {self.directory} holds rows run with {stored}, "
+                             f"not {settings}; use a new store")
+
+    def _recover(self):
+        """Cuts off a partial last record and the blob bytes no record refers to."""
+        size = os.path.getsize(self._rows_path)
+        self._num_rows = size // ROW_DTYPE.itemsize
+        if size % ROW_DTYPE.itemsize:
+            os.truncate(self._rows_path, self._num_rows * ROW_DTYPE.itemsize)
+        self._counts_end = self._sets_end = 0
+        if self._num_rows:
+            last = self.rows[-1]
+            self._counts_end, self._sets_end = int(last["counts_end"]), int(last["set_end"])
+        os.truncate(self._counts_path, self._counts_end * COUNT_DTYPE.itemsize)
+        os.truncate(self._sets_path, self._sets_end * SET_DTYPE.itemsize)
+
+    def __len__(self):
+        return self._num_rows
+
+    @property
+    def rows(self):
+        """All fixed-width columns as a read-only structured array (memory-mapped)."""
+        if self._num_rows == 0:
+            return np.zeros(0, dtype=ROW_DTYPE)
+        return np.memmap(self._rows_path, dtype=ROW_DTYPE, mode='r', shape=(self._num_rows,))
+
+    def _blob(self, path, dtype, column, i):
+        rows = self.rows
+        start = int(rows[column][i - 1]) if i > 0 else 0
+        end = int(rows[column][i])
+        if end == start:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', offset=start * dtype.itemsize,
+                         shape=(end - start,))
+
+    def counts(self, i):
+        """Counts of row i as {bitstring: count}."""
+        num_bits = int(self.rows["num_bits"][i])
+        blob = self._blob(self._counts_path, COUNT_DTYPE, "counts_end", i)
+        return {format(int(outcome), f'0{num_bits}b'): count.item()
+                for outcome, count in zip(blob["outcome"], blob["count"])}
+
+    def best_set(self, i):
+        """Verified best set of row i (sorted vertices), or None."""
+        blob = self._blob(self._sets_path, SET_DTYPE, "set_end", i)
+        return [int(v) for v in blob] if len(blob) else None
+
+    def record(self, i):
+        """Row i as a dict, in the form run_job returns."""
+        row = self.rows[i]
+        record = {name: row[name].item() for name in ROW_DTYPE.names
+                  if name not in ("counts_end", "set_end", "num_bits")}
+        record.update(graph=self.graph_ids[row["graph"]], status=STATUSES[row["status"]],
+                      iterations=_decode_iterations(row["iterations"]),
+                      shots=None if row["shots"] < 0 else int(row["shots"]),
+                      counts=self.counts(i), best_set=self.best_set(i))
+        if i in self.errors:
+            record["error"] = self.errors[i]
+        return record
+
+    def records(self):
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def completed(self):
+        """
+        (graph id, k, iterations) of every stored row, except those with
+        status "error": a resumed run retries them.
+        """
+        rows = self.rows
+        error = STATUSES.index("error")
+        return {(self.graph_ids[g], int(k), _decode_iterations(it))
+                for g, k, it, status in zip(rows["graph"], rows["k"], rows["iterations"],
+                                            rows["status"]) if status != error}
+
+    def _graph(self, graph_id):
+        if graph_id not in self._graph_index:
+            with open(self._graphs_path, 'a') as f:
+                f.write(graph_id + "\n")
+            self._graph_index[graph_id] = len(self.graph_ids)
+            self.graph_ids.append(graph_id)
+        return self._graph_index[graph_id]
+
+    def append(self, record):
+        """Appends one run_job row."""
+        counts = record["counts"]
+        blob = np.zeros(len(counts), dtype=COUNT_DTYPE)
+        blob["outcome"] = [int(bitstring, 2) for bitstring in counts]
+        blob["count"] = list(counts.values())
+        best_set = np.asarray(record["best_set"] or [], dtype=SET_DTYPE)
+
+        row = np.zeros(1, dtype=ROW_DTYPE)
+        for name in ROW_DTYPE.names:
+            if name in record and name not in ("graph", "status", "iterations", "shots"):
+                row[name] = record[name]
+        row["graph"] = self._graph(record["graph"])
+        row["status"] = STATUSES.index(record["status"])
+        row["iterations"] = _encode_iterations(record["iterations"])
+        row["shots"] = -1 if record["shots"] is None else record["shots"]
+        row["num_bits"] = len(next(iter(counts), ""))
+        row["counts_end"] = self._counts_end + len(blob)
+        row["set_end"] = self._sets_end + len(best_set)
+
+        for path, data in ((self._counts_path, blob), (self._sets_path, best_set),
+                           (self._rows_path, row)):
+            with open(path, 'ab') as f:
+                f.write(data.tobytes())
+        if "error" in record:
+            # Written after the row: a line without its row is dropped on open
+            message = " ".join(record["error"].split())
+            with open(self._errors_path, 'a') as f:
+                f.write(f"{self._num_rows}\t{message}\n")
+            self.errors[self._num_rows] = message
+        self._counts_end += len(blob)
+        self._sets_end += len(best_set)
+        self._num_rows += 1
+
+def load_graph_file(path):
+    """Graph from a dataset file ('.npy' edge array or text edge file, see Graph.from_edge_file)."""
+    return Graph.from_edge_file(path)
+
+def write_graph_file(graph, path):
+    """Writes 'graph' in the read_from_file text format."""
+    with open(path, 'w') as f:
+        f.write(f"{graph.n}\n")
+        np.savetxt(f, graph.edges(), fmt="%d")
+
+def dataset_files(paths, extensions=GRAPH_EXTENSIONS):
+    """
+    Graph files named by 'paths'; directories contribute their files with
+    one of 'extensions', sorted. Files named directly are always taken.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if not name.startswith(".") and name.endswith(tuple(extensions)))
+        else:
+            files.append(path)
+    return [os.path.normpath(path) for path in files]
+
+def run_job(path, k, iterations, shots, method, synthesis):
+    """One dataset job: loads the graph and runs, times and verifies run_grover."""
+    start = time.perf_counter()
+    row = {"graph": path, "k": k, "iterations": iterations, "shots": shots,
+           "success_probability": 0.0, "counts": {}, "best_set": None}
+    profiler = Profiler()
+    try:
+        graph = load_graph_file(path)
+        result, _ = run_grover(graph, k, iterations=iterations, shots=shots, method=method,
+                               synthesis=synthesis, decode=True, profiler=profiler)
+    except MemoryError:
+        row["status"] = "memory"
+    except CircuitTooWideForTarget:
+        row["status"] = "too_wide"
+    except Exception as error:
+        # One bad file or configuration must not take the dataset run down
+        row.update(status="error", error=f"{type(error).__name__}: {error}")
+    else:
+        best_set = result.best_set
+        row.update(status="ok", success_probability=result.success_probability,
+                   counts=dict(zip(result.bitstrings, result.shots.tolist())),
+                   best_set=None if best_set is None else sorted(best_set))
+    row.update({f"{stage}_seconds": profiler.timings.get(stage, 0.0) for stage in STAGES})
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+def run_dataset(paths, store, k_values, iteration_counts=(None,), shots=1024, method="aer",
+                synthesis="generic", max_workers=None, memory_limit_mb=None):
+    """
+    Runs run_job for every (graph file, k, iterations) of the dataset in a
+    process pool and appends each row to 'store' (a ResultStore or its
+    directory) as soon as it finishes; yields the rows in that order.
+    Jobs already in the store are skipped, so rerunning an interrupted run
+    resumes it; a store only resumes with the shots, method and synthesis it
+    was started with (ValueError otherwise). k values above a graph's vertex
+    count are skipped.
+    A job that raises is stored with status "error" (and its message), one
+    whose worker is killed with status "memory"; the run goes on either way.
+    max_workers and memory_limit_mb are as in sweep.sweep.
+    """
+    if not isinstance(store, ResultStore):
+        store = ResultStore(store)
+    store.use_settings(shots=shots, method=method, synthesis=synthesis)
+    done = store.completed()
+    jobs = []
+    for path in dataset_files(paths):
+        try:
+            n = load_graph_file(path).n
+        except Exception:
+            # Unreadable here, so every job reports the error from its worker
+            n = max(k_values)
+        jobs += [(path, k, it, shots, method, synthesis) for k in k_values if k <= n
+                 for it in iteration_counts if (path, k, it) not in done]
+    max_workers = max_workers or os.cpu_count()
+
+    # A bounded queue keeps thousands of jobs from being pickled up front
+    for job, row in run_in_pool(run_job, jobs, max_workers, memory_limit_mb,
+                                queue_size=2 * max_workers):
+        if row is None:
+            path, k, it = job[:3]
+            row = {"graph": path, "k": k, "iterations": it, "shots": shots, "status": "memory",
+                   "success_probability": 0.0, "counts": {}, "best_set": None, "seconds": 0.0}
+        store.append(row)
+        yield row
+
+def plot_store(store, directory, graphs=None, top=10):
+    """
+    Writes a histogram of the top outcomes of every stored row (optionally
+    only those of the graph ids in 'graphs') to 'directory'; returns the
+    file names. matplotlib is only loaded here.
+    """
+    from qiskit.visualization import plot_histogram
+    import matplotlib.pyplot as plt
+
+    if not isinstance(store, ResultStore):
+        store = ResultStore(store)
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+    for i, record in enumerate(store.records()):
+        if graphs is not None and record["graph"] not in graphs or not record["counts"]:
+            continue
+        counts = dict(sorted(record["counts"].items(), key=lambda item: item[1],
+                             reverse=True)[:top])
+        name = os.path.splitext(os.path.basename(record["graph"]))[0]
+        title = f"{name} (k={record['k']}, best set {record['best_set']})"
+        fig = plot_histogram(counts, title=title)
+        filename = os.path.join(directory, f"{i:06d}_{name}_k{record['k']}.png")
+        fig.savefig(filename)
+        plt.close(fig)
+        filenames.append(filename)
+    return filenames
@@ -0,0 +1,124 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .grover import run_grover
+
+# Preprocessing that shrinks the search register of run_grover.
+# Domination is separable over connected components, so each component gets
+# its own (much narrower) search, and the sizes add up. Before splitting,
+# three rules fire until none applies; "targets" are the vertices that still
+# need a dominator, the others only serve as candidate dominators:
+#   - isolated target v: only v can dominate it, so v is forced;
+#   - target leaf v with neighbor p: a solution using v stays one with p
+#     instead (N[v] is inside N[p]), so p is forced and N[p] stops being
+#     targets;
+#   - a non-target vertex with at most one neighbor, or no target in its
+#     closed neighborhood, is never needed as a dominator and is dropped.
+# Trees are solved by the rules alone; what is left is searched with the
+# targets-restricted oracle (run_grover(targets=...)).
+
+class Component:
+    """
+    One connected piece left by reduce_graph.
+      graph    - subgraph induced by the piece, vertices relabeled 0..m-1
+      vertices - original label of each relabeled vertex
+      targets  - relabeled vertices that still need a dominator (None: all)
+    """
+    def __init__(self, graph, vertices, targets):
+        self.graph = graph
+        self.vertices = vertices
+        self.targets = targets
+
+    @property
+    def num_targets(self):
+        return self.graph.n if self.targets is None else len(self.targets)
+
+def reduce_graph(graph):
+    """
+    Applies the reduction rules until none fires, then splits what is left.
+    Returns (forced, components): the vertices every returned solution
+    contains (sorted), and one Component per connected piece that still
+    has targets.
+    """
+    adj_list = graph.adj_list
+    active = [True] * graph.n
+    target = [True] * graph.n
+    forced = []
+
+    def active_neighbors(v):
+        return [w for w in adj_list[v] if active[w] and w != v]
+
+    work = list(range(graph.n))
+    while work:
+        v = work.pop()
+        if not active[v]:
+            continue
+        neighbors = active_neighbors(v)
+        if target[v] and len(neighbors) <= 1:
+            # Isolated: v itself is forced. Leaf: its neighbor is.
+            p = neighbors[0] if neighbors else v
+            forced.append(p)
+            active[p] = False
+            changed = [p] + active_neighbors(p)
+            for w in changed:
+                target[w] = False
+            for w in changed:
+                work.append(w)
+                work.extend(active_neighbors(w))
+        elif not target[v] and (len(neighbors) <= 1 or not any(target[w] for w in neighbors)):
+            active[v] = False
+            work.extend(neighbors)
+
+    components = []
+    for vertices in graph.connected_components([v for v in range(graph.n) if active[v]]):
+        targets = [i for i, v in enumerate(vertices) if target[v]]
+        if not targets:
+            continue
+        components.append(Component(graph.subgraph(vertices), vertices,
+                                    None if len(targets) == len(vertices) else targets))
+    return sorted(forced), components
+
+def solve_component(component, **kwargs):
+    """
+    Searches k = 1, 2, ... for a set dominating the component's targets with
+    run_grover (kwargs are passed on) and stops at the first verified one.
+    If every k below the number of targets fails, the targets themselves
+    are returned. Returns a row dict; best_set uses the original labels.
+    """
+    start = time.perf_counter()
+    row = {"vertices": component.graph.n, "targets": component.num_targets,
+           "k": component.num_targets, "verified": False, "qubits": None,
+           "best_set": [component.vertices[v] for v in
+                        (component.targets or range(component.graph.n))]}
+    for k in range(1, component.num_targets):
+        result, qc = run_grover(component.graph, k, decode=True, targets=component.targets,
+                                **kwargs)
+        if qc is not None:
+            row["qubits"] = max(row["qubits"] or 0, qc.num_qubits)
+        if result.best_set is not None:
+            row.update(k=k, verified=True,
+                       best_set=sorted(component.vertices[v] for v in result.best_set))
+            break
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+def solve_by_components(graph, max_workers=None, **kwargs):
+    """
+    Dominating set of 'graph' from reduce_graph and one Grover search per
+    component (solve_component, kwargs are passed to run_grover), run in a
+    process pool of max_workers (default: all cores; 1 runs them in order).
+    Returns (size, sorted vertex set, rows), with one row per component.
+    The set is minimum whenever every component search found its minimum.
+    """
+    forced, components = reduce_graph(graph)
+    task = partial(solve_component, **kwargs)
+    if max_workers == 1 or len(components) <= 1:
+        rows = [task(component) for component in components]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            rows = list(pool.map(task, components))
+
+    chosen = sorted(set(forced).union(*(row["best_set"] for row in rows)))
+    return len(chosen), chosen, rows
@@ -1,6 +1,8 @@
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import MCXGate
 
+from .mcx_synthesis import clean_ancillas
+
 def apply_binary_control(qc, register, number, n_bits):
     """Applies X gates to qubits where 'number' has a 0 bit."""
     binary_str = format(number, f'0{n_bits}b')[::-1] 
@@ -11,30 +13,74 @@ def apply_binary_control(qc, register, number, n_bits):
 def remove_binary_control(qc, register, number, n_bits):
     apply_binary_control(qc, register, number, n_bits)
 
+def gray_rank(x):
+    """Position of x in the reflected Gray code sequence."""
+    rank = 0
+    while x:
+        rank ^= x
+        x >>= 1
+    return rank
+
 def Adj(G, circuit, A, B, b):
     """Sets qubit b to 1 if {number(A), number(B)} is an edge."""
     n_bits = len(A)
-    for sublist_idx, neighbors in enumerate(G.adj_list):
-        u = sublist_idx
-        for v in neighbors:
-            if u < v:
-                apply_binary_control(circuit, A, u, n_bits)
-                apply_binary_control(circuit, B, v, n_bits)
-                circuit.mcx(list(A) + list(B), b)
-                remove_binary_control(circuit, B, v, n_bits)
-                remove_binary_control(circuit, A, u, n_bits)
-
-                apply_binary_control(circuit, A, v, n_bits)
-                apply_binary_control(circuit, B, u, n_bits)
-                circuit.mcx(list(A) + list(B), b)
-                remove_binary_control(circuit, B, u, n_bits)
-                remove_binary_control(circuit, A, v, n_bits)
+    # One MCX per ordered pair (u, v). They all target b and commute, so they
+    # run in Gray code order of their control patterns: consecutive X masks
+    # then differ in few qubits and mostly cancel (see mcx_synthesis).
+    # Self-loops are skipped: A = B = u is already covered by Equal.
+    pairs = [(u, v) for u, neighbors in enumerate(G.adj_list) for v in neighbors if u != v]
+    pairs.sort(key=lambda pair: gray_rank(pair[0] | pair[1] << n_bits))
+    for u, v in pairs:
+        apply_binary_control(circuit, A, u, n_bits)
+        apply_binary_control(circuit, B, v, n_bits)
+        circuit.mcx(list(A) + list(B), b)
+        remove_binary_control(circuit, B, v, n_bits)
+        remove_binary_control(circuit, A, u, n_bits)
+
+def AdjEdge(circuit, A, B, u, v, b):
+    """Flips b if {number(A), number(B)} is the edge {u, v}: its share of Adj."""
+    n_bits = len(A)
+    for x, y in ((u, v), (v, u)) if u != v else ((u, v),):
+        apply_binary_control(circuit, A, x, n_bits)
+        apply_binary_control(circuit, B, y, n_bits)
+        circuit.mcx(list(A) + list(B), b)
+        remove_binary_control(circuit, B, y, n_bits)
+        remove_binary_control(circuit, A, x, n_bits)
+
+def Equal(circuit, A, B, b):
+    """Flips b if number(A) == number(B); B is restored afterwards."""
+    n_bits = len(B)
+    for j in range(n_bits):
+        circuit.cx(A[j], B[j])
+        circuit.x(B[j])
+    circuit.mcx(list(B), b)
+    for j in reversed(range(n_bits)):
+        circuit.x(B[j])
+        circuit.cx(A[j], B[j])
+
+def AnyFlag(circuit, flags, b):
+    """
+    Sets b = OR(flags), assuming b starts at 0.
+    Uses De Morgan: b = NOT( AND( NOT flags ) ).
+    """
+    circuit.x(flags)
+    circuit.x(b) 
+    
+    # If all flags are 0 (so inverted flags are 1), flip b (1 -> 0)
+    circuit.mcx(list(flags), b)
+    
+    # Restore flags state
+    circuit.x(flags)
+    
+    # Crucial Fix: DO NOT apply x(b) here again.
+    # Logic Trace:
+    # If all flags 0 -> inverted are 1 -> mcx triggers -> b(1) becomes 0. Result: 0. Correct.
+    # If any flag 1 -> inverted has 0 -> mcx no trigger -> b(1) stays 1. Result: 1. Correct.
 
 def Dominated(G, circuit, A_list, B, AUX, b):
     """
     Sets b=1 if B is dominated by at least one vertex in A_list.
     """
-    n_bits = len(B)
     k = len(A_list)
     
     # Use the first k qubits of AUX as scratch flags for each A_i check
@@ -46,53 +92,28 @@ def Dominated(G, circuit, A_list, B, AUX, b):
         target_flag = flags[i]
         
         # Check Equality
-        for j in range(n_bits):
-            circuit.cx(A_i[j], B[j])
-            circuit.x(B[j])
-        circuit.mcx(list(B), target_flag)
-        for j in reversed(range(n_bits)):
-            circuit.x(B[j])
-            circuit.cx(A_i[j], B[j])
+        Equal(circuit, A_i, B, target_flag)
             
         # Check Adjacency
         Adj(G, circuit, A_i, B, target_flag)
 
     # 2. Compute OR of all flags into b
     # Logic: b = b OR (flags[0] OR flags[1]...)
-    # Implementation using De Morgan: b = NOT( AND( NOT flags ) ) assuming b starts at 0.
-    
-    circuit.x(flags)
-    circuit.x(b) 
-    
-    # If all flags are 0 (so inverted flags are 1), flip b (1 -> 0)
-    circuit.mcx(list(flags), b)
-    
-    # Restore flags state
-    circuit.x(flags)
-    
-    # Crucial Fix: DO NOT apply x(b) here again.
-    # Logic Trace:
-    # If all flags 0 -> inverted are 1 -> mcx triggers -> b(1) becomes 0. Result: 0. Correct.
-    # If any flag 1 -> inverted has 0 -> mcx no trigger -> b(1) stays 1. Result: 1. Correct.
+    AnyFlag(circuit, flags, b)
     
     # 3. Uncompute flags
     for i in range(k):
         A_i = A_list[i]
         target_flag = flags[i]
         Adj(G, circuit, A_i, B, target_flag)
-        for j in range(n_bits):
-            circuit.cx(A_i[j], B[j])
-            circuit.x(B[j])
-        circuit.mcx(list(B), target_flag)
-        for j in reversed(range(n_bits)):
-            circuit.x(B[j])
-            circuit.cx(A_i[j], B[j])
+        Equal(circuit, A_i, B, target_flag)
 
-def AllDominated(G, circuit, A_list, AUX, b):
+def AllDominated(G, circuit, A_list, AUX, b, targets=None):
     """
-    Sets b to 1 if every vertex v in G is dominated by A_list.
+    Sets b to 1 if every vertex v in G (or in targets) is dominated by A_list.
     """
-    n = G.n
+    checked = range(G.n) if targets is None else list(targets)
+    n = len(checked)
     n_bits_node = len(A_list[0])
     
     B_temp = AUX[0:n_bits_node]
@@ -100,30 +121,237 @@ def AllDominated(G, circuit, A_list, AUX, b):
     inner_aux = AUX[n_bits_node + n:]
     
     # 1. Loop through all vertices v and compute their dominated status
-    for v in range(n):
+    for slot, v in enumerate(checked):
         v_bin = format(v, f'0{n_bits_node}b')[::-1]
         for i, bit in enumerate(v_bin):
             if bit == '1':
                 circuit.x(B_temp[i])
         
-        Dominated(G, circuit, A_list, B_temp, inner_aux, flags[v])
+        Dominated(G, circuit, A_list, B_temp, inner_aux, flags[slot])
         
         for i, bit in enumerate(v_bin):
             if bit == '1':
                 circuit.x(B_temp[i])
                 
-    # 2. Check if ALL flags are 1 (AND logic)
-    circuit.mcx(list(flags), b)
+    # 2. Check if ALL flags are 1 (AND logic); B_temp and inner_aux are back to 0
+    with clean_ancillas(circuit, list(B_temp) + list(inner_aux)):
+        circuit.mcx(list(flags), b)
     
     # 3. Uncompute everything
-    for v in reversed(range(n)):
+    for slot, v in reversed(list(enumerate(checked))):
         v_bin = format(v, f'0{n_bits_node}b')[::-1]
         for i, bit in enumerate(v_bin):
             if bit == '1':
                 circuit.x(B_temp[i])
         
-        Dominated(G, circuit, A_list, B_temp, inner_aux, flags[v])
+        Dominated(G, circuit, A_list, B_temp, inner_aux, flags[slot])
         
         for i, bit in enumerate(v_bin):
             if bit == '1':
-                circuit.x(B_temp[i])
\ No newline at end of file
+                circuit.x(B_temp[i])
+
+def controlled_increment(circuit, controls, counter):
+    """Adds 1 (mod 2^len(counter)) to counter if all control qubits are 1."""
+    # Flip bit j when all lower bits are 1, starting from the top bit
+    for j in reversed(range(len(counter))):
+        circuit.mcx(list(controls) + list(counter[:j]), counter[j])
+
+def pool_layout(n, n_bits_node, k, pool_size, synthesis="generic"):
+    """
+    AUX layout of AllDominatedPooled: B_temp, flag pool, counter, inner flags.
+    Returns the number of qubits of each part (B_temp is empty for the
+    "neighborhood" synthesis, which never loads v into a register).
+    """
+    num_chunks = -(-n // pool_size)
+    counter_size = num_chunks.bit_length()
+    b_size = n_bits_node if synthesis == "generic" else 0
+    return b_size, pool_size, counter_size, k
+
+def aux_qubits_needed(n, n_bits_node, k, pool_size=None, synthesis="generic"):
+    """
+    Number of AUX qubits the oracle needs (pool_size=None: one flag per vertex).
+    n is the number of vertices checked (len(targets) for a restricted oracle).
+    """
+    if pool_size is None or pool_size >= n:
+        b_size = n_bits_node if synthesis == "generic" else 0
+        return b_size + n + k
+    return sum(pool_layout(n, n_bits_node, k, pool_size, synthesis))
+
+def AllDominatedPooled(G, circuit, A_list, AUX, b, pool_size, synthesis="generic",
+                       targets=None):
+    """
+    Sets b to 1 if every vertex v in G (or in targets) is dominated by A_list,
+    keeping only pool_size vertex flags live at a time.
+    Vertices are processed in chunks: their flags are computed, a counter is
+    incremented if the whole chunk is dominated, and the flags are uncomputed.
+    b is flipped when the counter reaches the number of chunks.
+    """
+    checked = list(range(G.n) if targets is None else targets)
+    n = len(checked)
+    n_bits_node = len(A_list[0])
+    b_size, _, counter_size, _ = pool_layout(n, n_bits_node, len(A_list), pool_size, synthesis)
+    num_chunks = -(-n // pool_size)
+
+    B_temp = AUX[0:b_size]
+    pool = AUX[b_size : b_size + pool_size]
+    counter = AUX[b_size + pool_size : b_size + pool_size + counter_size]
+    inner_aux = AUX[b_size + pool_size + counter_size:]
+
+    def mark_chunk(vertices):
+        for slot, v in enumerate(vertices):
+            if synthesis == "generic":
+                v_bin = format(v, f'0{n_bits_node}b')[::-1]
+                for i, bit in enumerate(v_bin):
+                    if bit == '1':
+                        circuit.x(B_temp[i])
+
+                Dominated(G, circuit, A_list, B_temp, inner_aux, pool[slot])
+
+                for i, bit in enumerate(v_bin):
+                    if bit == '1':
+                        circuit.x(B_temp[i])
+            else:
+                DominatedConst(G, circuit, A_list, v, inner_aux, pool[slot])
+
+    # 1. Count the fully dominated chunks
+    start = len(circuit.data)
+    for c in range(num_chunks):
+        vertices = checked[c * pool_size:(c + 1) * pool_size]
+        mark_chunk(vertices)
+        with clean_ancillas(circuit, list(B_temp) + list(inner_aux)):
+            controlled_increment(circuit, pool[:len(vertices)], counter)
+        # Dominated is its own inverse, so running it again clears the flags
+        mark_chunk(vertices)
+    end = len(circuit.data)
+
+    # 2. Check if counter == num_chunks
+    c_bin = format(num_chunks, f'0{counter_size}b')[::-1]
+    for i, bit in enumerate(c_bin):
+        if bit == '0':
+            circuit.x(counter[i])
+    with clean_ancillas(circuit, list(B_temp) + list(pool) + list(inner_aux)):
+        circuit.mcx(list(counter), b)
+    for i, bit in enumerate(c_bin):
+        if bit == '0':
+            circuit.x(counter[i])
+
+    # 3. Uncompute the counter (every gate above is self-inverse)
+    for instruction in reversed(circuit.data[start:end]):
+        circuit.append(instruction.operation, instruction.qubits)
+
+
+def esop_cubes(values, n_bits):
+    """
+    Covers the set of integers 'values' with disjoint cubes (value, care).
+    A cube matches x iff (x & care) == value; bits outside care are don't-cares.
+    Minterms/cubes differing in a single cared bit are merged repeatedly, so
+    the cubes stay disjoint and their XOR equals their OR.
+    """
+    full = (1 << n_bits) - 1
+    cubes = {(v, full) for v in values}
+    merged = True
+    while merged:
+        merged = False
+        result = set()
+        used = set()
+        for value, care in sorted(cubes):
+            if (value, care) in used:
+                continue
+            for j in range(n_bits):
+                bit = 1 << j
+                partner = (value ^ bit, care)
+                if care & bit and partner in cubes and partner not in used:
+                    used.add((value, care))
+                    used.add(partner)
+                    result.add((value & ~bit, care & ~bit))
+                    merged = True
+                    break
+            else:
+                used.add((value, care))
+                result.add((value, care))
+        cubes = result
+    return sorted(cubes)
+
+def Member(circuit, A, values, b):
+    """
+    Flips b if number(A) is in the classical set 'values'.
+    One MCX per ESOP cube; X masks are shared between consecutive cubes.
+    """
+    n_bits = len(A)
+    flipped = [False] * n_bits
+    for value, care in esop_cubes(values, n_bits):
+        controls = [j for j in range(n_bits) if care >> j & 1]
+        # Only touch qubits whose required polarity changed since the last cube
+        for j in controls:
+            need_flip = not (value >> j & 1)
+            if flipped[j] != need_flip:
+                circuit.x(A[j])
+                flipped[j] = need_flip
+        if controls:
+            circuit.mcx([A[j] for j in controls], b)
+        else:
+            circuit.x(b)
+    for j in range(n_bits):
+        if flipped[j]:
+            circuit.x(A[j])
+
+def DominatedConst(G, circuit, A_list, v, AUX, b):
+    """
+    Sets b=1 if the classical vertex v is dominated by at least one vertex in A_list.
+    A_i dominates v iff A_i is in N[v], so no B register and no Adj ladder is needed.
+    """
+    k = len(A_list)
+    flags = AUX[:k]
+    closed_neighborhood = [v] + list(G.neighbors(v))
+
+    # 1. Compute flags: flags[i] = 1 if A_i in N[v]
+    for i in range(k):
+        Member(circuit, A_list[i], closed_neighborhood, flags[i])
+
+    # 2. b = OR(flags), same De Morgan trick as Dominated
+    AnyFlag(circuit, flags, b)
+
+    # 3. Uncompute flags
+    for i in range(k):
+        Member(circuit, A_list[i], closed_neighborhood, flags[i])
+
+def AllDominatedConst(G, circuit, A_list, AUX, b, targets=None):
+    """
+    Same predicate as AllDominated, built from DominatedConst.
+    AUX holds one flag per checked vertex followed by k scratch flags.
+    """
+    checked = range(G.n) if targets is None else list(targets)
+    n = len(checked)
+    flags = AUX[0:n]
+    inner_aux = AUX[n:]
+
+    for slot, v in enumerate(checked):
+        DominatedConst(G, circuit, A_list, v, inner_aux, flags[slot])
+
+    with clean_ancillas(circuit, inner_aux):
+        circuit.mcx(list(flags), b)
+
+    for slot, v in reversed(list(enumerate(checked))):
+        DominatedConst(G, circuit, A_list, v, inner_aux, flags[slot])
+
+def SubsetAllDominated(G, circuit, X, AUX, b):
+    """
+    Subset (one-hot) encoding: qubit X[u] = 1 iff vertex u is in the set.
+    Sets b to 1 if every vertex v has some u in N[v] with X[u] = 1.
+    AUX holds one flag per vertex.
+    """
+    n = G.n
+    flags = AUX[0:n]
+
+    def mark_all():
+        for v in range(n):
+            closed_neighborhood = [X[u] for u in [v] + list(G.adj_list[v])]
+            # flags[v] = OR(N[v]) = NOT AND(NOT x_u)
+            circuit.x(closed_neighborhood)
+            circuit.mcx(closed_neighborhood, flags[v])
+            circuit.x(closed_neighborhood)
+            circuit.x(flags[v])
+
+    mark_all()
+    circuit.mcx(list(flags), b)
+    mark_all()
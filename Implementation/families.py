@@ -0,0 +1,48 @@
+import numpy as np
+
+from .graph import Graph
+
+# Parameterized graph families for benchmarks and experiments.
+
+def path_graph(n):
+    """0 - 1 - ... - (n-1)."""
+    u = np.arange(n - 1)
+    return Graph.from_edges(n, np.stack([u, u + 1], axis=1))
+
+def cycle_graph(n):
+    """Path closed into a ring (n >= 3)."""
+    u = np.arange(n)
+    return Graph.from_edges(n, np.stack([u, (u + 1) % n], axis=1))
+
+def star_graph(n):
+    """Vertex 0 joined to the n-1 leaves."""
+    leaves = np.arange(1, n)
+    return Graph.from_edges(n, np.stack([np.zeros_like(leaves), leaves], axis=1))
+
+def grid_graph(rows, cols):
+    """rows x cols lattice, vertex r*cols + c."""
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    horizontal = np.stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()], axis=1)
+    vertical = np.stack([ids[:-1, :].ravel(), ids[1:, :].ravel()], axis=1)
+    return Graph.from_edges(rows * cols, np.concatenate([horizontal, vertical]))
+
+def random_graph(n, p, seed=None):
+    """Erdos-Renyi G(n, p); a fixed seed gives the same graph every time."""
+    rng = np.random.default_rng(seed)
+    u, v = np.triu_indices(n, k=1)
+    keep = rng.random(len(u)) < p
+    return Graph.from_edges(n, np.stack([u[keep], v[keep]], axis=1))
+
+FAMILIES = {
+    "path": path_graph,
+    "cycle": cycle_graph,
+    "star": star_graph,
+    "grid": grid_graph,
+    "random": random_graph,
+}
+
+def make_graph(family, *params, **kwargs):
+    """Builds a graph of the named family, e.g. make_graph("grid", 2, 3)."""
+    if family not in FAMILIES:
+        raise ValueError(f"Unknown graph family '{family}', expected one of {sorted(FAMILIES)}")
+    return FAMILIES[family](*params, **kwargs)
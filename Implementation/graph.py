@@ -1,15 +1,124 @@
 import sys
 
+import numpy as np
+
 class Graph:
+    """
+    Undirected graph on vertices 0..n-1.
+    Edges are kept as one neighbor set per vertex (O(1) insert and adjacency
+    test); a CSR copy (indptr, indices) and the sorted adj_list view are
+    rebuilt lazily after edits. Bulk loaders fill the CSR arrays directly
+    with NumPy and only materialize the sets when an edit or query needs them.
+
+    Every edge edit bumps 'revision' and is logged, so derived data (such as
+    incremental.IncrementalOracle) can ask changes_since() which edges moved
+    instead of rebuilding from the whole graph.
+    """
     def __init__(self):
         self.n = 0
-        self.adj_list = []
+        self._neighbors = []
+        self._csr = None
+        self._adj_list = None
+        self.revision = 0
+        # Edges edited since _base_revision, one entry per revision
+        self._edits = []
+        self._base_revision = 0
+
+    def _replaced(self):
+        """Records that the whole graph changed (the edit log starts over)."""
+        self.revision += 1
+        self._base_revision = self.revision
+        self._edits = []
+
+    def _edited(self, u, v):
+        self._csr = None
+        self._adj_list = None
+        self._edits.append((u, v))
+        self.revision += 1
+
+    def changes_since(self, revision):
+        """
+        Edges {u, v} added or removed after 'revision', as (u, v) pairs in
+        edit order, or None if the graph was replaced wholesale since
+        (set_number_vertices, read_from_file).
+        """
+        if revision < self._base_revision:
+            return None
+        return self._edits[revision - self._base_revision:]
 
     def set_number_vertices(self, n):
         """Sets the number of vertices of the graph to n."""
         self.n = n
-        # Initialize adjacency list with n empty sublists
-        self.adj_list = [[] for _ in range(n)]
+        # Initialize with n empty neighbor sets
+        self._neighbors = [set() for _ in range(n)]
+        self._csr = None
+        self._adj_list = None
+        self._replaced()
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """
+        Builds a graph from an (m, 2) array-like of edges in one vectorized pass.
+        Out-of-range edges are reported and skipped, like in add_edge.
+        """
+        g = cls()
+        g.n = n
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+        valid = np.all((edges >= 0) & (edges < n), axis=1)
+        if not np.all(valid):
+            print(f"Error: {np.count_nonzero(~valid)} edges have vertices outside 0..{n - 1}")
+            edges = edges[valid]
+
+        # Both directions, de-duplicated and sorted by (u, v)
+        both = np.concatenate([edges, edges[:, ::-1]])
+        keys = np.sort(both[:, 0] * n + both[:, 1])
+        keys = keys[np.concatenate([np.ones(min(len(keys), 1), dtype=bool), keys[1:] != keys[:-1]])]
+        rows, cols = keys // n, keys % n
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        g._csr = (indptr, cols)
+        g._neighbors = None
+        g._adj_list = None
+        return g
+
+    def _sets(self):
+        """Neighbor sets, materialized from the CSR arrays if needed."""
+        if self._neighbors is None:
+            indptr, indices = self._csr
+            bounds, flat = indptr.tolist(), indices.tolist()
+            self._neighbors = [set(flat[bounds[u]:bounds[u + 1]]) for u in range(self.n)]
+        return self._neighbors
+
+    def csr(self):
+        """Returns (indptr, indices): neighbors of u are indices[indptr[u]:indptr[u+1]], sorted."""
+        if self._csr is None:
+            degrees = np.array([len(s) for s in self._neighbors], dtype=np.int64)
+            indptr = np.zeros(self.n + 1, dtype=np.int64)
+            np.cumsum(degrees, out=indptr[1:])
+            indices = np.fromiter((v for s in self._neighbors for v in sorted(s)),
+                                  dtype=np.int64, count=int(indptr[-1]))
+            self._csr = (indptr, indices)
+        return self._csr
+
+    @property
+    def adj_list(self):
+        """Sorted neighbor lists, one per vertex (read-only view, rebuilt after edits)."""
+        if self._adj_list is None:
+            indptr, indices = self.csr()
+            bounds, flat = indptr.tolist(), indices.tolist()
+            self._adj_list = [flat[bounds[u]:bounds[u + 1]] for u in range(self.n)]
+        return self._adj_list
+
+    def neighbors(self, u):
+        """Sorted neighbors of u, read without rebuilding the views of the whole graph."""
+        if self._adj_list is not None:
+            return self._adj_list[u]
+        if self._csr is not None:
+            indptr, indices = self._csr
+            return indices[indptr[u]:indptr[u + 1]].tolist()
+        return sorted(self._neighbors[u])
 
     def add_edge(self, u, v):
         """Adds edge {u, v}."""
@@ -17,40 +126,135 @@ class Graph:
         if u < 0 or u >= self.n or v < 0 or v >= self.n:
             print(f"Error: Vertices {u} and {v} must be between 0 and {self.n - 1}")
             return
-        
-        # Add u to v's list and v to u's list (undirected graph)
-        if u not in self.adj_list[v]:
-            self.adj_list[v].append(u)
-        if v not in self.adj_list[u]:
-            self.adj_list[u].append(v)
-            
-        # Optional: Sort lists for consistent printing
-        self.adj_list[v].sort()
-        self.adj_list[u].sort()
+
+        # Add u to v's set and v to u's set (undirected graph)
+        neighbors = self._sets()
+        if v in neighbors[u]:
+            return
+        neighbors[v].add(u)
+        neighbors[u].add(v)
+        self._edited(u, v)
+
+    def remove_edge(self, u, v):
+        """Removes edge {u, v} (no-op if it is not an edge)."""
+        if u < 0 or u >= self.n or v < 0 or v >= self.n:
+            print(f"Error: Vertices {u} and {v} must be between 0 and {self.n - 1}")
+            return
+
+        neighbors = self._sets()
+        if v not in neighbors[u]:
+            return
+        neighbors[v].discard(u)
+        neighbors[u].discard(v)
+        self._edited(u, v)
+
+    def has_edge(self, u, v):
+        """Checks whether {u, v} is an edge in O(1)."""
+        return v in self._sets()[u]
+
+    def degree(self, u):
+        """Number of neighbors of u."""
+        indptr, _ = self.csr()
+        return int(indptr[u + 1] - indptr[u])
+
+    def edges(self):
+        """(m, 2) array of the edges {u, v} with u < v, sorted."""
+        indptr, indices = self.csr()
+        rows = np.repeat(np.arange(self.n, dtype=np.int64), np.diff(indptr))
+        keep = rows < indices
+        return np.stack([rows[keep], indices[keep]], axis=1)
+
+    def connected_components(self, vertices=None):
+        """
+        Connected components as sorted vertex lists, ordered by smallest vertex.
+        With 'vertices', only the subgraph induced by them is considered.
+        """
+        adj_list = self.adj_list
+        allowed = None if vertices is None else set(vertices)
+        seen = set()
+        components = []
+        for start in (range(self.n) if vertices is None else sorted(allowed)):
+            if start in seen:
+                continue
+            seen.add(start)
+            component, stack = [], [start]
+            while stack:
+                u = stack.pop()
+                component.append(u)
+                for v in adj_list[u]:
+                    if v not in seen and (allowed is None or v in allowed):
+                        seen.add(v)
+                        stack.append(v)
+            components.append(sorted(component))
+        return components
+
+    def subgraph(self, vertices):
+        """Subgraph induced by 'vertices', relabeled 0..len(vertices)-1 in the given order."""
+        index = {v: i for i, v in enumerate(vertices)}
+        edges = [(index[u], index[v]) for u in vertices for v in self.adj_list[u]
+                 if v in index and index[u] < index[v]]
+        return Graph.from_edges(len(vertices), edges)
 
     def read_from_file(self, filename):
         """Reads the graph from a file."""
         try:
             with open(filename, 'r') as f:
-                lines = f.readlines()
-                
                 # First line is the number of vertices
-                if not lines:
+                first = f.readline()
+                if not first.strip():
                     return
-                self.set_number_vertices(int(lines[0].strip()))
-                
-                # Subsequent lines are edges
-                for line in lines[1:]:
-                    parts = line.strip().split()
+                n = int(first.strip())
+
+                # Subsequent lines are edges, streamed one at a time
+                edges = []
+                for line in f:
+                    parts = line.split()
                     if len(parts) >= 2:
-                        u = int(parts[0])
-                        v = int(parts[1])
-                        self.add_edge(u, v)
+                        edges.append((int(parts[0]), int(parts[1])))
+
+            loaded = Graph.from_edges(n, edges)
+            self.n = loaded.n
+            self._neighbors = None
+            self._csr = loaded._csr
+            self._adj_list = None
+            self._replaced()
         except FileNotFoundError:
             print(f"Error: File {filename} not found.")
         except ValueError:
             print("Error: Invalid file format.")
 
+    @classmethod
+    def from_edge_file(cls, filename, n=None):
+        """
+        Bulk loader for large benchmark graphs.
+        '.npy' files hold an (m, 2) integer edge array and are memory-mapped;
+        any other file uses the read_from_file text format (vertex count on the
+        first line, one 'u v' pair per line) and is parsed by NumPy in one call.
+        If n is not given for a '.npy' file, it is max vertex index + 1.
+        """
+        if filename.endswith('.npy'):
+            edges = np.load(filename, mmap_mode='r')
+            if n is None:
+                n = int(edges.max()) + 1 if len(edges) else 0
+        else:
+            with open(filename, 'r') as f:
+                file_n = int(f.readline().strip())
+                edges = np.loadtxt(f, dtype=np.int64, usecols=(0, 1), ndmin=2)
+            if n is None:
+                n = file_n
+        return cls.from_edges(n, edges)
+
+    def is_dominating_set(self, vertices):
+        """Checks whether every vertex is in 'vertices' or adjacent to one of them."""
+        dominated = set()
+        adj_list = self.adj_list
+        for u in vertices:
+            if u < 0 or u >= self.n:
+                continue
+            dominated.add(u)
+            dominated.update(adj_list[u])
+        return len(dominated) == self.n
+
     def print(self):
         """Prints the graph."""
         print(f"Graph with {self.n} vertices.")
@@ -58,7 +262,7 @@ class Graph:
         for i in range(self.n):
             print(f"Vertex {i}: {self.adj_list[i]}")
 
-# 测试代码 (作业里没要求，但为了确保你的环境没问题，我们先跑一下)
+# 测试代码 (作业里没要求，但为了确保你的环境没问题，我们先跑一下; python -m Implementation.graph)
 if __name__ == "__main__":
     # 创建一个测试图
     g = Graph()
@@ -67,4 +271,4 @@ if __name__ == "__main__":
     g.add_edge(1, 2)
     g.add_edge(2, 3)
     g.print()
-    print("\n[System Check]: If you see the graph structure above, Phase 1 is complete.")
\ No newline at end of file
+    print("\n[System Check]: If you see the graph structure above, Phase 1 is complete.")
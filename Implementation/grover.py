@@ -1,49 +1,246 @@
 from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister, transpile
-from qiskit_aer import AerSimulator
-from qiskit.visualization import plot_histogram
 import numpy as np
-import matplotlib.pyplot as plt
 
 # 导入我们之前写的模块
-try:
-    # 模式 A: 当作为外部脚本被调用时 (例如从 Experiments 运行)
-    from Implementation.graph import Graph
-    from Implementation.dominating_set import AllDominated
-except ImportError:
-    # 模式 B: 当直接运行时 (例如直接跑 grover.py)
-    from graph import Graph
-    from dominating_set import AllDominated
+from .graph import Graph
+from .dominating_set import AllDominated, AllDominatedPooled, AllDominatedConst, aux_qubits_needed
+from .classical import is_feasible
+from .results import GroverResult
+from .backends import make_backend, probability_circuit, probabilities_from_result
+from .profiling import stage_timer
+from .mcx_synthesis import MCXSynthesizer, clean_ancillas
+from .cache import graph_fingerprint, backend_fingerprint, cache_key
+from .phase_oracle import domination_mask, simulate_grover, optimal_iterations
+from .subset_encoding import (build_subset_circuit, simulate_subset_grover,
+                              subset_domination_mask, subset_iterations, decode_subset)
 
-def diffuser(n_qubits):
+def apply_diffuser(qc, qubits, ancillas=(), mcx_synthesis="native"):
     """
-    Grover's Diffuser (Inversion about the mean).
-    It amplifies the probability of the marked states.
+    Appends the diffuser gate sequence on 'qubits' to qc (or a resources.GateCounter).
+    ancillas are qubits known to be |0> that the MCX may borrow
+    (mcx_synthesis as in apply_oracle).
     """
-    qc = QuantumCircuit(n_qubits)
+    circuit = qc if mcx_synthesis is None else MCXSynthesizer(qc, mcx_synthesis)
+    qubits = list(qubits)
     # Apply H gates to all qubits
-    qc.h(range(n_qubits))
+    circuit.h(qubits)
     # Apply X gates to all qubits
-    qc.x(range(n_qubits))
+    circuit.x(qubits)
     
     # Apply Multi-Controlled Z (MCZ)
     # Equivalent to: H(last) -> MCX -> H(last)
-    qc.h(n_qubits - 1)
-    qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-    qc.h(n_qubits - 1)
+    circuit.h(qubits[-1])
+    with clean_ancillas(circuit, list(ancillas)):
+        circuit.mcx(qubits[:-1], qubits[-1])
+    circuit.h(qubits[-1])
     
     # Apply X gates
-    qc.x(range(n_qubits))
+    circuit.x(qubits)
     # Apply H gates
-    qc.h(range(n_qubits))
+    circuit.h(qubits)
+    if circuit is not qc:
+        circuit.flush()
+
+def diffuser(n_qubits, num_ancillas=0, mcx_synthesis="native"):
+    """
+    Grover's Diffuser (Inversion about the mean).
+    It amplifies the probability of the marked states.
+    The gate acts on n_qubits followed by num_ancillas clean ancillas.
+    """
+    qc = QuantumCircuit(n_qubits + num_ancillas)
+    apply_diffuser(qc, range(n_qubits), range(n_qubits, n_qubits + num_ancillas), mcx_synthesis)
     
     # Convert to gate
     gate = qc.to_gate()
     gate.name = "Diffuser"
     return gate
 
-def run_grover(graph, k, iterations=None):
+def oracle_circuit(graph, k, n_bits_node, num_aux_qubits, pool_size=None,
+                   synthesis="generic", mcx_synthesis="native", targets=None):
     """
-    Runs Grover's algorithm to find a Dominating Set of size k.
+    Builds the AllDominated verifier for (graph, k) on [input, aux, target].
+    With pool_size set, the ancilla-lean AllDominatedPooled variant is used.
+    synthesis="neighborhood" tests A_i against the classical set N[v]
+    (DominatedConst) instead of running Dominated/Adj on a B register.
+    With targets, only those vertices have to be dominated (one flag each).
+    """
+    qr_input = QuantumRegister(k * n_bits_node, 'input')
+    qr_aux = QuantumRegister(num_aux_qubits, 'aux')
+    qr_target = QuantumRegister(1, 'target')
+    qc = QuantumCircuit(qr_input, qr_aux, qr_target)
+
+    # Slice the input register into k chunks (A_1, A_2 ... A_k)
+    A_list = []
+    for i in range(k):
+        start = i * n_bits_node
+        end = (i + 1) * n_bits_node
+        A_list.append(qr_input[start:end])
+
+    apply_oracle(graph, qc, A_list, qr_aux, qr_target[0], pool_size, synthesis, mcx_synthesis,
+                 targets)
+    return qc
+
+def apply_oracle(graph, qc, A_list, aux, target, pool_size=None, synthesis="generic",
+                 mcx_synthesis="native", targets=None):
+    """
+    Appends the verifier selected by pool_size/synthesis to qc (or a resources.GateCounter).
+    The gates go through an mcx_synthesis.MCXSynthesizer: "native" cancels
+    adjacent X masks and keeps MCX gates whole (Aer runs them natively),
+    "ancilla" also ANDs controls into the clean aux qubits (shallower once
+    transpiled to CX), "toffoli" leaves no MCX as long as some qubit is idle
+    (see mcx_synthesis for the fallback). None appends the gates
+    exactly as the builders emit them.
+    """
+    if synthesis not in ("generic", "neighborhood"):
+        raise ValueError(f"Unknown synthesis '{synthesis}', expected 'generic' or 'neighborhood'")
+    circuit = qc if mcx_synthesis is None else MCXSynthesizer(qc, mcx_synthesis)
+    num_checked = graph.n if targets is None else len(targets)
+    if pool_size is not None and pool_size < num_checked:
+        AllDominatedPooled(graph, circuit, A_list, aux, target, pool_size, synthesis, targets)
+    elif synthesis == "neighborhood":
+        AllDominatedConst(graph, circuit, A_list, aux, target, targets)
+    else:
+        AllDominated(graph, circuit, A_list, aux, target, targets)
+    if circuit is not qc:
+        circuit.flush()
+
+def oracle(graph, k, n_bits_node, num_aux_qubits, pool_size=None, synthesis="generic",
+           mcx_synthesis="native", targets=None):
+    """
+    Compiles the AllDominated verifier for (graph, k) into a single gate.
+    The gate acts on [input, aux, target] and is appended by reference,
+    so the MCX/X sequence is expanded only once per run.
+    """
+    qc = oracle_circuit(graph, k, n_bits_node, num_aux_qubits, pool_size, synthesis,
+                        mcx_synthesis, targets)
+    gate = qc.to_gate()
+    gate.name = "Oracle"
+    return gate
+
+def total_qubits(n, k, pool_size=None, synthesis="generic"):
+    """Width of the Grover circuit: input + oracle AUX + target."""
+    n_bits_node = int(np.ceil(np.log2(n)))
+    return k * n_bits_node + aux_qubits_needed(n, n_bits_node, k, pool_size, synthesis) + 1
+
+def choose_pool_size(n, k, qubit_budget, synthesis="generic"):
+    """
+    Largest flag pool whose circuit fits in qubit_budget qubits.
+    Returns None when the full per-vertex flag register fits.
+    """
+    if qubit_budget is None or total_qubits(n, k, None, synthesis) <= qubit_budget:
+        return None
+    for pool_size in reversed(range(1, n)):
+        if total_qubits(n, k, pool_size, synthesis) <= qubit_budget:
+            return pool_size
+    raise ValueError(f"Oracle for n={n}, k={k} needs at least "
+                     f"{total_qubits(n, k, 1, synthesis)} qubits, budget is {qubit_budget}")
+
+def oracle_tradeoffs(graph, k, synthesis="generic"):
+    """
+    Width/depth trade-off of the oracle for pool sizes 1, 2, 4, ... and the
+    full flag register (pool_size None). MCX gates count as one operation.
+    """
+    n = graph.n
+    n_bits_node = int(np.ceil(np.log2(n)))
+    pool_sizes = []
+    p = 1
+    while p < n:
+        pool_sizes.append(p)
+        p *= 2
+    pool_sizes.append(None)
+
+    report = []
+    for pool_size in pool_sizes:
+        num_aux_qubits = aux_qubits_needed(n, n_bits_node, k, pool_size, synthesis)
+        qc = oracle_circuit(graph, k, n_bits_node, num_aux_qubits, pool_size, synthesis)
+        ops = qc.count_ops()
+        report.append({
+            "pool_size": pool_size,
+            "qubits": total_qubits(n, k, pool_size, synthesis),
+            "depth": qc.depth(),
+            "size": qc.size(),
+            "mcx": ops.get("mcx", 0),
+        })
+    return report
+
+def compare_oracles(graph, k):
+    """
+    Before/after gate counts and depth of the "generic" and "neighborhood"
+    oracles, both as built (MCX = one gate) and transpiled to the Aer basis.
+    """
+    n = graph.n
+    n_bits_node = int(np.ceil(np.log2(n)))
+    report = {}
+    for synthesis in ("generic", "neighborhood"):
+        num_aux_qubits = aux_qubits_needed(n, n_bits_node, k, None, synthesis)
+        qc = oracle_circuit(graph, k, n_bits_node, num_aux_qubits, None, synthesis)
+        t_qc = transpile(qc, basis_gates=['u', 'cx'])
+        report[synthesis] = {
+            "qubits": qc.num_qubits,
+            "size": qc.size(),
+            "depth": qc.depth(),
+            "mcx": qc.count_ops().get("mcx", 0),
+            "transpiled_size": t_qc.size(),
+            "transpiled_depth": t_qc.depth(),
+            "cx": t_qc.count_ops().get("cx", 0),
+        }
+    return report
+
+# Largest search register for which iterations="auto" counts solutions classically
+AUTO_COUNT_MAX_QUBITS = 24
+
+def grover_iterations(num_input_qubits):
+    """Optimal ~pi/4 * sqrt(N) iteration count for a single marked state."""
+    N = 2**num_input_qubits
+    return int(np.floor((np.pi / 4) * np.sqrt(N)))
+
+def resolve_iterations(graph, k, iterations, marked=None, encoding="index", targets=None):
+    """
+    Turns the 'iterations' argument of run_grover into a number.
+    None keeps the single-solution formula; "auto" counts the marked states M
+    exactly (classical enumeration) and uses floor(pi/4 * sqrt(N/M)).
+    For registers too large to enumerate, see counting.choose_iterations
+    (quantum counting) and counting.exponential_search.
+    """
+    if encoding == "subset":
+        if iterations is None:
+            return subset_iterations(graph.n, k)
+        if iterations == "auto":
+            M = int(np.count_nonzero(subset_domination_mask(graph, k)[1]))
+            return subset_iterations(graph.n, k, M)
+        return iterations
+
+    n_bits_node = int(np.ceil(np.log2(graph.n)))
+    num_input_qubits = k * n_bits_node
+    if iterations is None:
+        return grover_iterations(num_input_qubits)
+    if iterations == "auto":
+        if num_input_qubits > AUTO_COUNT_MAX_QUBITS:
+            raise ValueError(f"iterations='auto' enumerates 2^{num_input_qubits} inputs; "
+                             "use counting.exponential_search for registers this large")
+        if marked is None:
+            marked = domination_mask(graph, k, targets)
+        return optimal_iterations(len(marked), int(np.count_nonzero(marked)))
+    return iterations
+
+def _add_block(qc, block, qubits):
+    if isinstance(block, QuantumCircuit):
+        qc.compose(block, qubits, inplace=True)
+    else:
+        qc.append(block, qubits)
+
+def build_grover_circuit(graph, k, iterations=None, pool_size=None, synthesis="generic",
+                         mcx_synthesis="native", oracle_block=None, diffuser_block=None,
+                         targets=None):
+    """
+    Builds the (untranspiled) Grover circuit searching for a Dominating Set of size k.
+    mcx_synthesis is passed to apply_oracle; with "ancilla" or "toffoli" the diffuser
+    also borrows the aux register, which is clean between oracle calls.
+    oracle_block/diffuser_block replace the blocks built here: a Gate is
+    appended by reference, a QuantumCircuit (e.g. one already transpiled,
+    see incremental.IncrementalOracle) is composed inline.
+    targets restricts the oracle to dominating those vertices (see
+    decomposition).
     """
     n = graph.n
     # Number of bits to represent one node index
@@ -55,17 +252,14 @@ def run_grover(graph, k, iterations=None):
     num_input_qubits = k * n_bits_node
     
     # Auxiliary qubits needed for the Oracle
-    # We need enough scratch space for the 'AllDominated' check.
-    # From previous logic: we need at least n_bits_node + extra for comparisons.
-    # Let's allocate a generous amount to be safe (simulators can handle it).
-    num_aux_qubits = n_bits_node + 2 + n  
+    # B_temp (n_bits_node) + one flag per vertex (or a flag pool and counter)
+    # + k scratch flags used inside 'Dominated'.
+    num_checked = n if targets is None else len(targets)
+    num_aux_qubits = aux_qubits_needed(num_checked, n_bits_node, k, pool_size, synthesis)
     
     # Output qubit for the Oracle (the one that gets flipped)
     num_target_qubit = 1
     
-    # Total qubits
-    total_qubits = num_input_qubits + num_aux_qubits + num_target_qubit
-    
     # Registers
     qr_input = QuantumRegister(num_input_qubits, 'input')
     qr_aux = QuantumRegister(num_aux_qubits, 'aux')
@@ -83,42 +277,242 @@ def run_grover(graph, k, iterations=None):
     
     # 2. Determine iterations (if not provided, use optimal ~sqrt(N))
     if iterations is None:
-        N = 2**num_input_qubits
-        iterations = int(np.floor((np.pi / 4) * np.sqrt(N)))
-        # For small cases, usually 1 or 2 is enough.
-        # print(f"Auto-calculated iterations: {iterations}")
+        iterations = grover_iterations(num_input_qubits)
 
     # 3. Grover Loop
+    # Both blocks are built once and appended by reference in every iteration.
+    if oracle_block is None:
+        oracle_block = oracle(graph, k, n_bits_node, num_aux_qubits, pool_size, synthesis,
+                              mcx_synthesis, targets)
+    diffuser_ancillas = list(qr_aux) if mcx_synthesis in ("ancilla", "toffoli") else []
+    if diffuser_block is None:
+        diffuser_block = diffuser(num_input_qubits, len(diffuser_ancillas), mcx_synthesis)
+    oracle_qubits = list(qr_input) + list(qr_aux) + list(qr_target)
     for _ in range(iterations):
         # -- Oracle --
-        # We need to slice the input register into k chunks (A_1, A_2 ... A_k)
-        A_list = []
-        for i in range(k):
-            # Slicing the input register
-            start = i * n_bits_node
-            end = (i + 1) * n_bits_node
-            A_list.append(qr_input[start:end])
-            
-        # Apply the Verifier (Oracle)
-        # Note: AllDominated expects (G, circuit, A_list, AUX, b)
-        AllDominated(graph, qc, A_list, qr_aux, qr_target[0])
+        _add_block(qc, oracle_block, oracle_qubits)
         
         # -- Diffuser --
-        qc.append(diffuser(num_input_qubits), qr_input)
+        _add_block(qc, diffuser_block, list(qr_input) + diffuser_ancillas)
         
     # 4. Measurement
     qc.measure(qr_input, cr)
-    
+    return qc
+
+def run_grover(graph, k, iterations=None, shots=1024, cache=None, method="aer",
+               qubit_budget=None, synthesis="generic", encoding="index",
+               skip_infeasible=False, decode=False, simulation_method="automatic",
+               precision="double", max_parallel_threads=0, max_memory_mb=0,
+               profiler=None, mcx_synthesis="native", incremental=None, targets=None):
+    """
+    Runs Grover's algorithm to find a Dominating Set of size k.
+    If a CircuitCache is given, circuit construction and transpilation are
+    skipped for any (graph, k, iterations, backend) seen before.
+
+    qubit_budget caps the circuit width: when the per-vertex flag register
+    does not fit, the oracle keeps only a pool of flags live and counts
+    dominated chunks instead (narrower but deeper, see oracle_tradeoffs).
+    synthesis selects the per-vertex domination check ("generic" or
+    "neighborhood", see compare_oracles); mcx_synthesis how its MCX chains
+    are written out (see apply_oracle).
+    iterations="auto" picks the iteration count from the exact number of
+    dominating k-tuples instead of assuming a single solution.
+
+    encoding="subset" searches an n-qubit one-hot register prepared in the
+    weight-k Dicke state, so each unordered set appears exactly once
+    (C(n,k) states instead of 2^(k*n_bits)). Counts are then keyed by n-bit
+    one-hot strings; vertex_set_counts() decodes either encoding.
+
+    With skip_infeasible, k is first checked with the classical solver and
+    ({}, None) is returned without simulating if no dominating set of size k
+    exists.
+
+    method="phase" skips the circuit entirely: the domination predicate is
+    evaluated classically once and the search register is simulated as a
+    phase flip + inversion about the mean (no ancillas). The measurement
+    distribution is the same; the returned circuit is None.
+
+    With decode=True the counts are returned as a GroverResult (decoded vertex
+    sets, domination check, success probability) instead of a raw dict.
+
+    simulation_method, precision, max_parallel_threads and max_memory_mb
+    configure the Aer backend (see backends.make_backend; "automatic" picks
+    statevector, MPS or a stabilizer method from the circuit).
+    shots=None is the shot-free mode: the returned dict maps each outcome to
+    its exact probability instead of a sampled count.
+
+    A profiling.Profiler passed as profiler collects the time spent in each
+    stage: construct, transpile, simulate and decode.
+
+    incremental takes an incremental.IncrementalOracle built for (graph, k,
+    synthesis, mcx_synthesis): the circuit is assembled from its transpiled
+    segments (and returned transpiled), and after a few graph edits only the
+    segments they touched are rebuilt, re-transpiled and re-spliced. It
+    replaces cache (passing both is an error) and needs encoding="index"
+    without a qubit_budget pool.
+
+    targets restricts the search to sets dominating just those vertices (the
+    rest of the graph only supplies dominators), as decomposition does for
+    the components left after its reductions. It needs encoding="index"
+    and no skip_infeasible or incremental.
+    """
+    stage = stage_timer(profiler)
+
+    def finish(counts, qc):
+        if decode:
+            with stage("decode"):
+                return GroverResult(graph, counts, k, encoding, targets), qc
+        return counts, qc
+
+    if encoding not in ("index", "subset"):
+        raise ValueError(f"Unknown encoding '{encoding}', expected 'index' or 'subset'")
+    if encoding == "subset" and qubit_budget is not None:
+        raise ValueError("qubit_budget is only supported with encoding='index'")
+    if targets is not None and (encoding != "index" or skip_infeasible
+                                or incremental is not None):
+        raise ValueError("targets needs encoding='index' and no skip_infeasible or incremental")
+    if skip_infeasible and not is_feasible(graph, k):
+        return finish({}, None)
+
+    if method == "phase" and encoding == "subset":
+        with stage("construct"):
+            iterations = resolve_iterations(graph, k, iterations, encoding=encoding)
+        with stage("simulate"):
+            counts = simulate_subset_grover(graph, k, iterations, shots=shots)
+        return finish(counts, None)
+    if method == "phase":
+        with stage("construct"):
+            marked = domination_mask(graph, k, targets)
+            iterations = resolve_iterations(graph, k, iterations, marked)
+        with stage("simulate"):
+            counts = simulate_grover(marked, iterations, shots=shots)
+        return finish(counts, None)
+    if method != "aer":
+        raise ValueError(f"Unknown method '{method}', expected 'aer' or 'phase'")
+    with stage("construct"):
+        iterations = resolve_iterations(graph, k, iterations, encoding=encoding,
+                                        targets=targets)
+        pool_size = choose_pool_size(graph.n, k, qubit_budget, synthesis)
+    if incremental is not None:
+        if (incremental.graph is not graph or incremental.k != k
+                or incremental.synthesis != synthesis
+                or incremental.mcx_synthesis != mcx_synthesis):
+            raise ValueError("incremental was built for another graph, k or synthesis")
+        if encoding != "index" or pool_size is not None:
+            raise ValueError("incremental needs encoding='index' and no qubit_budget pool")
+        if cache is not None:
+            raise ValueError("incremental keeps its own transpiled segments; pass no cache")
+
+    def build():
+        if encoding == "subset":
+            return build_subset_circuit(graph, k, iterations)
+        return build_grover_circuit(graph, k, iterations, pool_size, synthesis, mcx_synthesis,
+                                    targets=targets)
+
+    if incremental is not None:
+        with stage("construct"):
+            incremental.update()
+            # The oracle has the Grover circuit's width and all its non-Clifford
+            # gates, so it stands in for the untranspiled circuit when picking the method
+            backend = make_backend(incremental.circuit() if iterations else None,
+                                   simulation_method, precision,
+                                   max_parallel_threads, max_memory_mb)
+        with stage("transpile"):
+            qc = t_qc = incremental.grover_circuit(iterations, backend)
+    elif cache is None:
+        with stage("construct"):
+            qc = build()
+            backend = make_backend(qc, simulation_method, precision,
+                                   max_parallel_threads, max_memory_mb)
+        # Transpile for the simulator
+        with stage("transpile"):
+            t_qc = transpile(qc, backend)
+    else:
+        with stage("construct"):
+            fingerprint = graph_fingerprint(graph)
+            circuit_key = cache_key("circuit", fingerprint, k, iterations, pool_size,
+                                    synthesis, encoding, mcx_synthesis, targets)
+
+            qc = cache.get(circuit_key)
+            if qc is None:
+                qc = build()
+                cache.put(circuit_key, qc)
+
+            backend = make_backend(qc, simulation_method, precision,
+                                   max_parallel_threads, max_memory_mb)
+        with stage("transpile"):
+            transpiled_key = cache_key("transpiled", fingerprint, k, iterations, pool_size,
+                                       synthesis, encoding, mcx_synthesis, targets,
+                                       backend_fingerprint(backend))
+            t_qc = cache.get(transpiled_key)
+            if t_qc is None:
+                t_qc = transpile(qc, backend)
+                cache.put(transpiled_key, t_qc)
+
     # 5. Simulation
-    backend = AerSimulator()
-    # Transpile for the simulator
-    t_qc = transpile(qc, backend)
-    result = backend.run(t_qc, shots=1024).result()
-    counts = result.get_counts()
+    with stage("simulate"):
+        if shots is None:
+            # Shot-free mode: swap the measurements for a save_probabilities.
+            # Done after caching because QPY cannot store Aer's save instructions.
+            result = backend.run(probability_circuit(t_qc), shots=1).result()
+            counts = probabilities_from_result(result, qc.num_clbits)
+        else:
+            result = backend.run(t_qc, shots=shots).result()
+            counts = result.get_counts()
     
-    return counts, qc
+    return finish(counts, qc)
+
+def decode_bitstring(bitstring, k, n_bits_node):
+    """
+    Converts a measured bitstring into the k vertex indices (A_1, ..., A_k).
+    Qiskit prints qubit 0 rightmost, so A_1 is the last n_bits_node characters.
+    """
+    value = int(bitstring, 2)
+    node_mask = (1 << n_bits_node) - 1
+    return tuple((value >> (i * n_bits_node)) & node_mask for i in range(k))
 
-# 简易测试代码 (Run this to verify)
+def vertex_set_counts(counts, k, n_bits_node=None, encoding="index", n=None):
+    """
+    Merges raw counts into counts per unordered vertex set (sorted tuples).
+    With the index encoding, permutations and repeated indices of the same
+    set collapse into one entry, and given the vertex count n, padding
+    indices >= n (which are no vertex) are dropped from the sets.
+    """
+    sets = {}
+    for bitstring, count in counts.items():
+        if encoding == "subset":
+            vertices = decode_subset(bitstring)
+        else:
+            vertices = tuple(sorted(set(u for u in decode_bitstring(bitstring, k, n_bits_node)
+                                        if n is None or u < n)))
+        sets[vertices] = sets.get(vertices, 0) + count
+    return sets
+
+def run_grover_batch(jobs, shots=1024, synthesis="generic", max_parallel_threads=0,
+                     mcx_synthesis="native"):
+    """
+    Runs many Grover searches as a single Aer job.
+    jobs is a list of (graph, k, iterations) tuples (iterations may be None).
+    All circuits are transpiled together and executed in one backend.run call,
+    with Aer running independent experiments in parallel across cores
+    (max_parallel_threads=0 uses all of them).
+    Returns a list of (counts, qc), one per job, in the same order.
+    """
+    circuits = []
+    for graph, k, iterations in jobs:
+        iterations = resolve_iterations(graph, k, iterations)
+        circuits.append(build_grover_circuit(graph, k, iterations, synthesis=synthesis,
+                                             mcx_synthesis=mcx_synthesis))
+
+    from qiskit_aer import AerSimulator
+    backend = AerSimulator(max_parallel_threads=max_parallel_threads,
+                           max_parallel_experiments=0)
+    t_circuits = transpile(circuits, backend)
+    result = backend.run(t_circuits, shots=shots).result()
+
+    return [(result.get_counts(i), qc) for i, qc in enumerate(circuits)]
+
+# 简易测试代码 (Run this to verify: python -m Implementation.grover)
 if __name__ == "__main__":
     # Create a simple triangle graph (0-1, 1-2, 2-0) + isolated 3
     # 0 -- 1
@@ -132,17 +526,16 @@ if __name__ == "__main__":
     g.add_edge(0, 2)
     
     print("Running Grover on a 4-node graph, looking for Dominating Set of size k=2...")
-    counts, _ = run_grover(g, k=2)
+    result, _ = run_grover(g, k=2, decode=True)
     
     print("\nTop 5 Results:")
-    # Sort by frequency
-    sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    for bitstring, count in sorted_counts[:5]:
-        # Convert bitstring to node indices
-        # Bitstring is e.g. "1101" -> Node 3 (11) and Node 1 (01)
-        # Be careful with Endianness: Qiskit returns bits reversed usually?
-        # Actually Qiskit counts are key string.
-        # Let's just print raw first.
-        print(f"State: {bitstring} | Count: {count}")
-    
-    print("\n[System Check]: If you see counts appearing, the Engine is running!")
\ No newline at end of file
+    # Bitstrings are decoded with qubit 0 rightmost: A_1 is the lowest n_bits_node bits
+    order = np.argsort(-result.shots)
+    for row in order[:5]:
+        vertices = tuple(int(u) for u in result.vertices[row])
+        status = "dominating" if result.valid[row] else "not dominating"
+        print(f"State: {result.bitstrings[row]} -> {vertices} | Count: {result.shots[row]} | {status}")
+
+    print(f"\nSuccess probability: {result.success_probability:.3f}")
+    print(f"Best set found: {result.best_set}")
+    print("\n[System Check]: If you see counts appearing, the Engine is running!")
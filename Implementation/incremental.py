@@ -0,0 +1,242 @@
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister, transpile
+
+from .dominating_set import AdjEdge, AnyFlag, DominatedConst, Equal, aux_qubits_needed
+from .mcx_synthesis import MCXSynthesizer, clean_ancillas
+from .cache import backend_fingerprint
+from .grover import apply_diffuser, build_grover_circuit
+
+# Segment layout of the AllDominated verifier (same predicate and registers
+# as build_grover_circuit's oracle, pool_size=None).
+#   synthesis="neighborhood": ("vertex", v) is DominatedConst of v and only
+#       depends on N[v]; an edit {u, v} makes segments u and v stale.
+#   synthesis="generic": ("load", v), ("or", v) and ("unload", v) frame the
+#       Dominated check of v and never depend on the edges; ("edge", u, v) is
+#       that edge's share of Adj for every A_i. Adj is the concatenation of the
+#       edge segments, so an edit adds, drops or keeps exactly one of them.
+#   ("check",) is the final AND of the vertex flags.
+# Each segment is a full-width circuit, transpiled on its own and cached per
+# backend. The assembled oracle is cached per backend too, as a list of spans
+# (one per segment occurrence, in _plan order); an update only re-splices the
+# spans of the segments it rebuilt or dropped.
+
+class IncrementalOracle:
+    """
+    The oracle of build_grover_circuit for (graph, k), kept as per-vertex and
+    per-edge segments that follow the edits of 'graph'. update() rebuilds
+    only the segments touched by add_edge/remove_edge since the last call
+    (everything after a wholesale replacement of the graph), and transpiled()
+    re-transpiles only those. Pass it to run_grover(incremental=...) to
+    rerun a search after a few edits.
+    """
+    def __init__(self, graph, k, synthesis="generic", mcx_synthesis="native"):
+        if synthesis not in ("generic", "neighborhood"):
+            raise ValueError(f"Unknown synthesis '{synthesis}', expected 'generic' or 'neighborhood'")
+        self.graph = graph
+        self.k = k
+        self.synthesis = synthesis
+        self.mcx_synthesis = mcx_synthesis
+        self.revision = None
+        self.n = None
+        self._segments = {}
+        # backend fingerprint -> {segment key: transpiled segment}
+        self._transpiled = {}
+        self._diffusers = {}
+        # source (None or a backend fingerprint) -> (oracle, [(key, size, phase)])
+        self._assembled = {}
+        # source -> keys rebuilt or dropped since that oracle was assembled
+        self._stale = {}
+        self.update()
+
+    def _reset(self):
+        n = self.graph.n
+        self.n = n
+        self.n_bits_node = int(np.ceil(np.log2(n)))
+        self.num_input_qubits = self.k * self.n_bits_node
+        self.num_aux_qubits = aux_qubits_needed(n, self.n_bits_node, self.k, None, self.synthesis)
+        self._segments = {}
+        self._transpiled = {}
+        self._diffusers = {}
+        self._assembled = {}
+        self._stale = {}
+
+    def _empty(self):
+        return QuantumCircuit(QuantumRegister(self.num_input_qubits, 'input'),
+                              QuantumRegister(self.num_aux_qubits, 'aux'),
+                              QuantumRegister(1, 'target'))
+
+    def _registers(self, qc):
+        """A_list, B_temp, vertex flags, inner flags and target of a segment."""
+        nb, n = self.n_bits_node, self.n
+        inputs = qc.qubits[:self.num_input_qubits]
+        aux = qc.qubits[self.num_input_qubits:-1]
+        A_list = [inputs[i * nb:(i + 1) * nb] for i in range(self.k)]
+        b_size = nb if self.synthesis == "generic" else 0
+        return A_list, aux[:b_size], aux[b_size:b_size + n], aux[b_size + n:], qc.qubits[-1]
+
+    def _build(self, key):
+        qc = self._empty()
+        circuit = qc if self.mcx_synthesis is None else MCXSynthesizer(qc, self.mcx_synthesis)
+        A_list, B_temp, flags, inner_aux, target = self._registers(qc)
+        kind = key[0]
+        if kind == "vertex":
+            DominatedConst(self.graph, circuit, A_list, key[1], inner_aux, flags[key[1]])
+        elif kind in ("load", "unload"):
+            v_bin = format(key[1], f'0{self.n_bits_node}b')[::-1]
+            loaded = [B_temp[i] for i, bit in enumerate(v_bin) if bit == '1']
+            if kind == "load" and loaded:
+                circuit.x(loaded)
+            for i in range(self.k):
+                Equal(circuit, A_list[i], B_temp, inner_aux[i])
+            if kind == "unload" and loaded:
+                circuit.x(loaded)
+        elif kind == "or":
+            AnyFlag(circuit, inner_aux[:self.k], flags[key[1]])
+        elif kind == "edge":
+            for i in range(self.k):
+                AdjEdge(circuit, A_list[i], B_temp, key[1], key[2], inner_aux[i])
+        else:
+            with clean_ancillas(circuit, list(B_temp) + list(inner_aux)):
+                circuit.mcx(list(flags), target)
+        if circuit is not qc:
+            circuit.flush()
+        return qc
+
+    def _all_keys(self):
+        keys = [("check",)]
+        if self.synthesis == "neighborhood":
+            return keys + [("vertex", v) for v in range(self.n)]
+        for v in range(self.n):
+            keys += [("load", v), ("or", v), ("unload", v)]
+        return keys + [("edge", int(u), int(v)) for u, v in self.graph.edges()]
+
+    def update(self):
+        """
+        Brings the segments up to date with the graph.
+        Returns the keys of the segments that were rebuilt or dropped.
+        """
+        graph = self.graph
+        changes = None if self.revision is None else graph.changes_since(self.revision)
+        if changes is None or graph.n != self.n:
+            self._reset()
+            stale = set(self._all_keys())
+        elif self.synthesis == "neighborhood":
+            stale = {("vertex", w) for edge in changes for w in edge}
+        else:
+            stale = {("edge", min(u, v), max(u, v)) for u, v in changes if u != v}
+        self.revision = graph.revision
+
+        for key in stale:
+            if key[0] == "edge" and not graph.has_edge(key[1], key[2]):
+                self._segments.pop(key, None)
+            else:
+                self._segments[key] = self._build(key)
+            for transpiled in self._transpiled.values():
+                transpiled.pop(key, None)
+        for keys in self._stale.values():
+            keys |= stale
+        return stale
+
+    def _plan(self, segments):
+        """Segment keys in assembly order, with Adj spelled out as its edge segments."""
+        if self.synthesis == "neighborhood":
+            marks = [[("vertex", v)] for v in range(self.n)]
+        else:
+            # Equal and Adj both XOR into the inner flags and commute, so each
+            # vertex computes all equalities first and then the whole Adj block
+            adj = sorted(key for key in segments if key[0] == "edge")
+            marks = [[("load", v)] + adj + [("or", v)] + adj + [("unload", v)]
+                     for v in range(self.n)]
+        return ([key for mark in marks for key in mark] + [("check",)]
+                + [key for mark in reversed(marks) for key in mark])
+
+    def _assemble(self, source, segments):
+        """
+        The oracle composed from a {key: segment} dict, cached under 'source'.
+        Only the spans of segments rebuilt or dropped since the last call are
+        replaced; the returned circuit is the cached one and must not be modified.
+        """
+        plan = self._plan(segments)
+        if source not in self._assembled:
+            self._assembled[source] = (self._empty(), [])
+            self._stale[source] = set(plan)
+        qc, spans = self._assembled[source]
+        stale = self._stale[source]
+        if not stale:
+            return qc
+        # Keys outside 'stale' keep their order in the plan, so the two only
+        # differ in runs of stale keys between unchanged spans
+        kept, i, j, offset = [], 0, 0, 0
+        while True:
+            removed = []
+            while i < len(spans) and spans[i][0] in stale:
+                removed.append(spans[i])
+                i += 1
+            added = []
+            while j < len(plan) and plan[j] in stale:
+                segment = segments[plan[j]]
+                added.append((plan[j], len(segment.data), segment.global_phase))
+                j += 1
+            if removed or added:
+                # CircuitData splices in place; the public QuantumCircuit.data does not
+                size = sum(span[1] for span in removed)
+                qc._data[offset:offset + size] = [instruction for key, _, _ in added
+                                                  for instruction in segments[key].data]
+                qc.global_phase += (sum(span[2] for span in added)
+                                    - sum(span[2] for span in removed))
+                kept += added
+                offset += sum(span[1] for span in added)
+            if i == len(spans):
+                break
+            kept.append(spans[i])
+            offset += spans[i][1]
+            i += 1
+            j += 1
+        self._assembled[source] = (qc, kept)
+        self._stale[source] = set()
+        return qc
+
+    def circuit(self):
+        """The (untranspiled) oracle circuit on [input, aux, target]."""
+        return self._assemble(None, self._segments)
+
+    def transpiled(self, backend):
+        """The oracle transpiled for 'backend', transpiling only the segments not cached yet."""
+        fingerprint = backend_fingerprint(backend)
+        cached = self._transpiled.setdefault(fingerprint, {})
+        missing = [key for key in self._segments if key not in cached]
+        if missing:
+            for key, transpiled in zip(missing, transpile([self._segments[key] for key in missing],
+                                                          backend)):
+                # Back onto the [input, aux, target] registers so it can be spliced
+                cached[key] = self._empty().compose(transpiled)
+        return self._assemble(fingerprint, cached)
+
+    def _diffuser_width(self):
+        ancillas = self.num_aux_qubits if self.mcx_synthesis in ("ancilla", "toffoli") else 0
+        return self.num_input_qubits + ancillas
+
+    def _transpiled_diffuser(self, backend):
+        fingerprint = backend_fingerprint(backend)
+        if fingerprint not in self._diffusers:
+            width = self._diffuser_width()
+            qc = QuantumCircuit(width)
+            apply_diffuser(qc, range(self.num_input_qubits), range(self.num_input_qubits, width),
+                           self.mcx_synthesis)
+            self._diffusers[fingerprint] = transpile(qc, backend)
+        return self._diffusers[fingerprint]
+
+    def grover_circuit(self, iterations=None, backend=None):
+        """
+        Grover circuit on this oracle (as build_grover_circuit). With a
+        backend, the circuit is assembled from the transpiled segments and
+        can be run on it directly.
+        """
+        if backend is None:
+            oracle_gate = self.circuit().to_gate()
+            oracle_gate.name = "Oracle"
+            return build_grover_circuit(self.graph, self.k, iterations, None, self.synthesis,
+                                        self.mcx_synthesis, oracle_block=oracle_gate)
+        return build_grover_circuit(self.graph, self.k, iterations, None, self.synthesis,
+                                    self.mcx_synthesis, oracle_block=self.transpiled(backend),
+                                    diffuser_block=self._transpiled_diffuser(backend))
@@ -0,0 +1,213 @@
+from contextlib import contextmanager, nullcontext
+
+from qiskit.circuit import QuantumRegister, Qubit
+
+# MCX synthesis layer for the oracle builders.
+# The builders (Adj, Dominated, AllDominated, the diffuser, ...) emit long
+# chains of X-masked MCX gates. Wrapping the circuit in an MCXSynthesizer
+# changes how that stream is written out, not what it computes:
+#   - X gates are buffered per qubit, so the uncompute mask of one MCX and the
+#     compute mask of the next cancel instead of being emitted back to back;
+#   - mode="ancilla" ANDs pairs of controls into the clean ancillas the
+#     builder declares (clean_ancillas) with relative-phase Toffolis (RCCX),
+#     as a balanced tree of logarithmic depth, and leaves the MCX on what is
+#     left to the transpiler, which borrows idle qubits on its own;
+#   - mode="toffoli" also decomposes what the clean tree leaves: into a
+#     dirty-ancilla V-chain on idle qubits, or the one-ancilla split into two
+#     half-size MCXs when only one qubit is idle. When no qubit is idle at
+#     all (every qubit is a control, the target or a busy ancilla) the MCX is
+#     kept whole, as in "ancilla" (e.g. a diffuser without ancillas).
+# Aer executes MCX natively, so mode="native" (masks only) is the fastest to
+# simulate; "ancilla" lowers the depth once the circuit is transpiled to a
+# CX basis, and "toffoli" gives exact Toffoli/T counts without transpiling.
+
+MODES = ("native", "ancilla", "toffoli")
+
+def _as_list(qubits):
+    if isinstance(qubits, (list, tuple, range, QuantumRegister)):
+        return list(qubits)
+    return [qubits]
+
+class MCXSynthesizer:
+    """
+    Proxy for a QuantumCircuit (or resources.GateCounter) that the oracle
+    builders write into instead of the circuit itself. It supports the calls
+    the builders make (x, h, cx, mcx, append, data); call flush() when done
+    so that the buffered X gates reach the circuit.
+    """
+    def __init__(self, circuit, mode="native"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown MCX synthesis '{mode}', expected one of {MODES}")
+        self.circuit = circuit
+        self.mode = mode
+        if hasattr(circuit, "qubits"):
+            self.qubits = list(circuit.qubits)
+            self._bits = True
+        else:
+            self.qubits = list(range(circuit.num_qubits))
+            self._bits = False
+        # Qubits with an X not yet written out (dict keeps insertion order)
+        self._pending = {}
+        self._clean = []
+
+    def _resolve(self, qubits):
+        # Integer indices and Qubit objects must compare equal as buffer keys
+        qubits = _as_list(qubits)
+        if self._bits:
+            return [q if isinstance(q, Qubit) else self.qubits[q] for q in qubits]
+        return qubits
+
+    def _flush(self, qubits):
+        for q in qubits:
+            if self._pending.pop(q, False):
+                self.circuit.x(q)
+
+    def flush(self):
+        """Writes out every buffered X gate."""
+        self._flush(list(self._pending))
+
+    @contextmanager
+    def clean(self, qubits):
+        """Declares 'qubits' to be |0> for the duration of the block."""
+        saved = self._clean
+        self._clean = saved + [q for q in self._resolve(qubits) if q not in saved]
+        try:
+            yield
+        finally:
+            self._clean = saved
+
+    # --- Gates used by the builders ---
+
+    def x(self, qubits):
+        for q in self._resolve(qubits):
+            if q in self._pending:
+                del self._pending[q]
+            else:
+                self._pending[q] = True
+
+    def h(self, qubits):
+        qubits = self._resolve(qubits)
+        self._flush(qubits)
+        self.circuit.h(qubits if len(qubits) > 1 else qubits[0])
+
+    def cx(self, control, target):
+        # An X on the target commutes with CX and stays buffered
+        control, target = self._resolve([control, target])
+        self._flush([control])
+        self.circuit.cx(control, target)
+
+    def mcx(self, controls, target):
+        controls = self._resolve(controls)
+        (target,) = self._resolve(target)
+        self._flush(controls)
+        if self.mode == "native" or len(controls) < 3:
+            self.circuit.mcx(controls, target)
+        else:
+            self._synthesize(controls, target)
+
+    def append(self, operation, qubits):
+        self.flush()
+        self.circuit.append(operation, qubits)
+
+    @property
+    def data(self):
+        self.flush()
+        return self.circuit.data
+
+    # --- Decompositions ---
+
+    def _ancillas(self, busy):
+        busy = set(busy)
+        clean = [q for q in self._clean if q not in busy]
+        taken = set(clean) | busy
+        dirty = [q for q in self.qubits if q not in taken]
+        return clean, dirty
+
+    def _synthesize(self, controls, target):
+        clean, dirty = self._ancillas(controls + [target])
+        tree, reduced = self._and_tree(controls, clean)
+        # Idle qubits may be borrowed in any state, clean ones must really be |0>
+        self._flush([gate[2] for gate in tree])
+        for gate in tree:
+            self._toffoli(*gate, relative_phase=True)
+
+        m = len(reduced)
+        spare = dirty + [q for q in clean if q not in {g[2] for g in tree}]
+        if m <= 2 or self.mode == "toffoli" and len(spare) >= m - 2:
+            self._and(reduced, target, spare)
+        elif self.mode == "toffoli" and spare:
+            self._split(reduced, target, spare[0])
+        else:
+            self.circuit.mcx(reduced, target)
+
+        for gate in reversed(tree):
+            self._toffoli(*gate, relative_phase=True)
+
+    def _and_tree(self, controls, clean):
+        """
+        Pairs up controls level by level, each pair ANDed into a fresh clean
+        ancilla, until two controls remain or the ancillas run out.
+        Returns the RCCX gates (a, b, ancilla) and the remaining controls.
+        """
+        gates = []
+        level = list(controls)
+        free = list(clean)
+        while len(level) > 2 and free:
+            next_level = []
+            while len(level) >= 2 and free and len(level) + len(next_level) > 2:
+                a, b = level.pop(0), level.pop(0)
+                ancilla = free.pop(0)
+                gates.append((a, b, ancilla))
+                next_level.append(ancilla)
+            level = next_level + level
+        return gates, level
+
+    def _toffoli(self, a, b, target, relative_phase=False):
+        if relative_phase:
+            self.circuit.rccx(a, b, target)
+        else:
+            self.circuit.ccx(a, b, target)
+
+    def _dirty_chain(self, c, t, a):
+        """V-chain on m - 2 ancillas in any state: 2 CCX + 4(m - 2) - 2 RCCX."""
+        m = len(c)
+        # a[i] collects c[0..i+1]; run twice so every ancilla is restored
+        down = [(c[i + 1], a[i - 1], a[i]) for i in reversed(range(1, m - 2))]
+        for _ in range(2):
+            self._toffoli(c[m - 1], a[m - 3], t)
+            for gate in down:
+                self._toffoli(*gate, relative_phase=True)
+            self._toffoli(c[0], c[1], a[0], relative_phase=True)
+            for gate in reversed(down):
+                self._toffoli(*gate, relative_phase=True)
+
+    def _split(self, c, t, ancilla):
+        """
+        One idle qubit: XOR the AND of the first half of the controls into
+        it, then the AND of the rest with it into the target, twice, so the
+        idle qubit is restored whatever its state. Each half uses the other
+        half (and the target) as its dirty ancillas.
+        """
+        half = (len(c) + 1) // 2
+        first, second = c[:half], c[half:]
+        for _ in range(2):
+            self._and(first, ancilla, second + [t])
+            self._and(second + [ancilla], t, first)
+
+    def _and(self, controls, target, dirty):
+        m = len(controls)
+        if m == 1:
+            self.circuit.cx(controls[0], target)
+        elif m == 2:
+            self._toffoli(controls[0], controls[1], target)
+        else:
+            self._dirty_chain(controls, target, dirty[:m - 2])
+
+def clean_ancillas(circuit, qubits):
+    """
+    Context in which the builder guarantees 'qubits' are |0>, so MCX gates
+    emitted inside may use them as clean ancillas. A no-op on plain circuits.
+    """
+    if isinstance(circuit, MCXSynthesizer):
+        return circuit.clean(qubits)
+    return nullcontext()
@@ -1,3 +1,4 @@
+import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
 
 # --- Utils ---
@@ -74,11 +75,331 @@ def add(circuit, A, B, R, AUX):
         circuit.cx(A[i], R[i])
         circuit.cx(AUX[i-1], R[i])
 
+# --- In-place adders ---
+def maj(circuit, c, b, a):
+    """Cuccaro MAJ block: a <- majority(a, b, c)."""
+    circuit.cx(a, b)
+    circuit.cx(a, c)
+    circuit.ccx(c, b, a)
+
+def uma(circuit, c, b, a):
+    """Cuccaro UMA block (2-CNOT version): undoes MAJ and writes the sum bit into b."""
+    circuit.ccx(c, b, a)
+    circuit.cx(a, c)
+    circuit.cx(c, b)
+
+def cuccaro_add(circuit, A, B, anc, carry=None):
+    """
+    Cuccaro ripple-carry adder: B <- B + A in place, A unchanged.
+    anc is one clean ancilla (returned clean). With carry, the carry out is
+    XORed into it, i.e. carry acts as an extra high bit of B.
+    """
+    n = len(A)
+    chain = [anc] + list(A)
+    for i in range(n):
+        maj(circuit, chain[i], B[i], A[i])
+    if carry is not None:
+        circuit.cx(A[n - 1], carry)
+    for i in reversed(range(n)):
+        uma(circuit, chain[i], B[i], A[i])
+
+def cuccaro_subtract(circuit, A, B, anc, carry=None):
+    """
+    B <- B - A in place, computed as NOT(NOT B + A).
+    With carry as an extra high bit of B, it ends up 1 (from 0) iff B < A.
+    """
+    targets = list(B) + ([carry] if carry is not None else [])
+    circuit.x(targets)
+    cuccaro_add(circuit, A, B, anc, carry)
+    circuit.x(targets)
+
+def qft(circuit, B):
+    """QFT without swaps: afterwards B[j] carries the phase 2*pi*x / 2^(j+1)."""
+    for j in reversed(range(len(B))):
+        circuit.h(B[j])
+        for k in reversed(range(j)):
+            circuit.cp(np.pi / 2**(j - k), B[k], B[j])
+
+def iqft(circuit, B):
+    """Inverse of qft()."""
+    for j in range(len(B)):
+        for k in range(j):
+            circuit.cp(-np.pi / 2**(j - k), B[k], B[j])
+        circuit.h(B[j])
+
+def phi_add(circuit, A, B, sign=1):
+    """Draper adder in the Fourier basis: phi(B) <- phi(B + sign * A), no ancillas."""
+    for j in range(len(B)):
+        for i in range(min(j + 1, len(A))):
+            circuit.cp(sign * 2 * np.pi * 2**i / 2**(j + 1), A[i], B[j])
+
+def draper_add(circuit, A, B):
+    """QFT-based adder: B <- B + A mod 2^len(B), no ancillas."""
+    qft(circuit, B)
+    phi_add(circuit, A, B)
+    iqft(circuit, B)
+
+def phi_add_const(circuit, a, B, controls=()):
+    """
+    phi(B) <- phi(B + a mod 2^len(B)) for a classical a: one phase per qubit
+    of B, controlled on every qubit in 'controls'. Negative a subtracts.
+    """
+    controls = list(controls)
+    for j in range(len(B)):
+        angle = 2 * np.pi * a / 2**(j + 1)
+        angle = (angle + np.pi) % (2 * np.pi) - np.pi
+        if np.isclose(angle, 0):
+            continue
+        if controls:
+            circuit.mcp(angle, controls, B[j])
+        else:
+            circuit.p(angle, B[j])
+
+def draper_add_const(circuit, a, B, controls=()):
+    """B <- B + a mod 2^len(B) for a classical a, optionally controlled."""
+    qft(circuit, B)
+    phi_add_const(circuit, a, B, controls)
+    iqft(circuit, B)
+
 # --- 1.7 Add Mod ---
+def _reduce_mod(circuit, N, R, A, anc, flag, T):
+    """
+    R (n+1 qubits, R[n] the high bit) holds s = x + y < 2N with y < N and x
+    = number(A). Replaces s by s mod N and returns flag and T to zero.
+    """
+    n = len(N)
+    low, high = R[:n], R[n]
+    # s - N: the high bit is set iff s < N
+    cuccaro_subtract(circuit, N, low, anc, high)
+    circuit.cx(high, flag)
+    # Add N back if s < N, through T = flag AND N
+    for i in range(n):
+        circuit.ccx(flag, N[i], T[i])
+    cuccaro_add(circuit, T, low, anc, high)
+    for i in range(n):
+        circuit.ccx(flag, N[i], T[i])
+    # The result is >= A exactly when no reduction happened (flag = 1)
+    cuccaro_subtract(circuit, A, low, anc, high)
+    circuit.x(high)
+    circuit.cx(high, flag)
+    circuit.x(high)
+    cuccaro_add(circuit, A, low, anc, high)
+
 def add_mod(circuit, N, A, B, R, AUX):
-    """Simplified Mod Add: Just Add."""
-    add(circuit, A, B, R, AUX)
+    """
+    R <- (A + B) mod N for A, B < N, with R starting at 0.
+    A, B and N are unchanged; AUX needs n + 3 clean qubits and is returned clean.
+    """
+    n = len(A)
+    high, anc, flag = AUX[0], AUX[1], AUX[2]
+    T = AUX[3:3 + n]
+    R_ext = list(R) + [high]
+    copy(circuit, B, R)
+    cuccaro_add(circuit, A, R, anc, high)
+    _reduce_mod(circuit, N, R_ext, A, anc, flag, T)
 
 # --- 1.8 Times Two ---
 def times_two_mod(circuit, N, A, R, AUX):
-    add_mod(circuit, N, A, A, R, AUX)
\ No newline at end of file
+    """R <- 2A mod N for A < N, with R starting at 0; AUX as in add_mod."""
+    n = len(A)
+    high, anc, flag = AUX[0], AUX[1], AUX[2]
+    T = AUX[3:3 + n]
+    R_ext = list(R) + [high]
+    # Doubling is a shift: copy A one position up
+    for i in range(n):
+        circuit.cx(A[i], R_ext[i + 1])
+    _reduce_mod(circuit, N, R_ext, A, anc, flag, T)
+
+# --- Beauregard modular arithmetic (classical a and N) ---
+def _inverse(circuit, qubits, build):
+    """Appends the inverse of the gates that build(scratch) writes on a copy of 'qubits'."""
+    scratch = QuantumCircuit(len(qubits))
+    build(scratch, list(range(len(qubits))))
+    circuit.compose(scratch.inverse(), qubits, inplace=True)
+
+def phi_add_mod_const(circuit, controls, a, N, B, anc):
+    """
+    Beauregard's doubly controlled modular adder in the Fourier basis:
+    phi(B) <- phi(B + a mod N) if all 'controls' are 1, for 0 <= a, B < N.
+    B has n + 1 qubits (one more than N needs); anc is one clean ancilla.
+    """
+    msb = B[-1]
+    phi_add_const(circuit, a, B, controls)
+    phi_add_const(circuit, -N, B)
+    iqft(circuit, B)
+    circuit.cx(msb, anc)
+    qft(circuit, B)
+    phi_add_const(circuit, N, B, [anc])
+    phi_add_const(circuit, -a, B, controls)
+    # Clear anc: B + a mod N >= a exactly when no reduction happened
+    iqft(circuit, B)
+    circuit.x(msb)
+    circuit.cx(msb, anc)
+    circuit.x(msb)
+    qft(circuit, B)
+    phi_add_const(circuit, a, B, controls)
+
+def cmult_mod(circuit, control, a, N, X, B, anc):
+    """B <- B + a * X mod N if control is 1 (B has len(X) + 1 qubits)."""
+    qft(circuit, B)
+    for i in range(len(X)):
+        phi_add_mod_const(circuit, [control, X[i]], (a << i) % N, N, B, anc)
+    iqft(circuit, B)
+
+def controlled_multiply_mod(circuit, control, a, N, X, B, anc):
+    """
+    X <- a * X mod N in place if control is 1, for gcd(a, N) = 1 and X < N.
+    B (len(X) + 1 qubits) and anc are clean ancillas and are returned clean.
+    """
+    n = len(X)
+    cmult_mod(circuit, control, a, N, X, B, anc)
+    for i in range(n):
+        circuit.cswap(control, X[i], B[i])
+    a_inv = pow(a, -1, N)
+    qubits = [control] + list(X) + list(B) + [anc]
+    _inverse(circuit, qubits, lambda qc, q: cmult_mod(
+        qc, q[0], a_inv, N, q[1:1 + n], q[1 + n:2 + 2 * n], q[2 + 2 * n]))
+
+def mod_exp(circuit, a, N, E, X, B, anc):
+    """
+    X <- a^E * X mod N for a classical base a coprime to N (X = 1 gives a^E mod N).
+    E is the exponent register; B (len(X) + 1 qubits) and anc are clean
+    ancillas. Width is len(E) + 2 * len(X) + 2 qubits.
+    """
+    for i in range(len(E)):
+        controlled_multiply_mod(circuit, E[i], pow(a, 2**i, N), N, X, B, anc)
+
+# --- Constant-folded arithmetic (classical operands) ---
+def _flip(circuit, controls, target):
+    """X on target, controlled on every qubit in 'controls' (plain X if none)."""
+    if controls:
+        circuit.mcx(list(controls), target)
+    else:
+        circuit.x(target)
+
+def _const_carry(circuit, bit, b, c, target, controls=()):
+    """
+    XORs the carry out of b + bit + c into target, for a classical bit
+    (c is None when there is no carry in). bit = 1 gives b OR c = b ^ c ^ bc,
+    bit = 0 gives b AND c; every gate only reads b and c, so the block is
+    its own inverse.
+    """
+    controls = list(controls)
+    if c is None:
+        if bit:
+            circuit.mcx(controls + [b], target)
+        return
+    if bit:
+        circuit.mcx(controls + [b], target)
+        circuit.mcx(controls + [c], target)
+    circuit.mcx(controls + [b, c], target)
+
+def add_const(circuit, a, B, AUX, carry=None, controls=()):
+    """
+    B <- B + a mod 2^n for a classical a: the ripple-carry adder with the
+    addend folded into the carry logic (no A register, at most one Toffoli
+    per bit and direction). AUX needs n - 1 clean qubits for the carries.
+    With carry, the carry out is XORed into it (an extra high bit of B).
+    Only the sum updates are controlled, so 'controls' add no carry gates.
+    """
+    n = len(B)
+    a %= 2**n
+    bits = [(a >> i) & 1 for i in range(n)]
+    C = [None] + list(AUX[:n - 1])
+
+    for i in range(n - 1):
+        _const_carry(circuit, bits[i], B[i], C[i], C[i + 1])
+    if carry is not None:
+        _const_carry(circuit, bits[n - 1], B[n - 1], C[n - 1], carry, controls)
+    # Top bit first: c_i still depends only on the (unchanged) lower bits
+    for i in reversed(range(n)):
+        if C[i] is not None:
+            circuit.mcx(list(controls) + [C[i]], B[i])
+        if bits[i]:
+            _flip(circuit, controls, B[i])
+        if i > 0:
+            _const_carry(circuit, bits[i - 1], B[i - 1], C[i - 1], C[i])
+
+def greater_or_eq_const(circuit, A, b, r, AUX, controls=()):
+    """
+    r ^= (A >= b) for a classical b: the carry out of A + (2^n - b).
+    AUX needs n - 1 clean qubits (returned clean); A is unchanged.
+    """
+    n = len(A)
+    if b <= 0:
+        _flip(circuit, controls, r)
+        return
+    if b >= 2**n:
+        return
+    c = 2**n - b
+    bits = [(c >> i) & 1 for i in range(n)]
+    C = [None] + list(AUX[:n - 1])
+    for i in range(n - 1):
+        _const_carry(circuit, bits[i], A[i], C[i], C[i + 1])
+    _const_carry(circuit, bits[n - 1], A[n - 1], C[n - 1], r, controls)
+    for i in reversed(range(n - 1)):
+        _const_carry(circuit, bits[i], A[i], C[i], C[i + 1])
+
+def add_mod_const(circuit, N, a, B, AUX, controls=()):
+    """
+    B <- (B + a) mod N in place for classical a and N, with B < N.
+    AUX needs n clean qubits (a flag and n - 1 carries), returned clean.
+    """
+    n = len(B)
+    a %= N
+    if a == 0:
+        return
+    flag, carries = AUX[0], AUX[1:n]
+    # flag = B + a >= N, i.e. N has to be subtracted
+    greater_or_eq_const(circuit, B, N - a, flag, carries, controls)
+    add_const(circuit, a, B, carries, controls=controls)
+    add_const(circuit, 2**n - N, B, carries, controls=[flag])
+    # The result is < a exactly when N was subtracted
+    greater_or_eq_const(circuit, B, a, flag, carries, controls)
+    _flip(circuit, controls, flag)
+
+def times_two_mod_const(circuit, N, B, AUX):
+    """
+    B <- 2B mod N in place for an odd classical N and B < N (doubling is
+    not invertible modulo an even N). AUX needs n clean qubits.
+    With m = (N + 1) / 2, 2B mod N is 2B if B < m and 2(B - m) + 1 otherwise,
+    so it is a conditional constant subtraction, a shift and the flag as bit 0.
+    """
+    if N % 2 == 0:
+        raise ValueError(f"times_two_mod_const needs an odd modulus, got {N}")
+    n = len(B)
+    m = (N + 1) // 2
+    flag, carries = AUX[0], AUX[1:n]
+    greater_or_eq_const(circuit, B, m, flag, carries)
+    add_const(circuit, 2**n - m, B, carries, controls=[flag])
+    # B < 2^(n-1) now, so a left rotation is a shift by one
+    for i in reversed(range(n - 1)):
+        circuit.swap(B[i], B[i + 1])
+    circuit.cx(flag, B[0])
+    # The result is odd exactly when the flag was set
+    circuit.cx(B[0], flag)
+
+def controlled_multiply_mod_const(circuit, control, a, N, X, AUX):
+    """
+    X <- a * X mod N in place if control is 1, for gcd(a, N) = 1 and X < N,
+    using only X/CX/MCX gates. AUX needs 2n clean qubits (an accumulator
+    and add_mod_const's work qubits), returned clean.
+    """
+    n = len(X)
+    B, work = AUX[:n], AUX[n:2 * n]
+    for j in range(n):
+        add_mod_const(circuit, N, (a << j) % N, B, work, controls=[control, X[j]])
+    for j in range(n):
+        circuit.cswap(control, X[j], B[j])
+    # B holds the old X: subtract a^-1 * (a * X) to clear it
+    a_inv = pow(a, -1, N)
+    for j in range(n):
+        add_mod_const(circuit, N, -(a_inv << j) % N, B, work, controls=[control, X[j]])
+
+def mod_exp_ripple(circuit, a, N, E, X, AUX):
+    """
+    Toffoli-only counterpart of mod_exp: X <- a^E * X mod N, built from the
+    constant-folded ripple adders. AUX needs 2 * len(X) clean qubits.
+    """
+    for i in range(len(E)):
+        controlled_multiply_mod_const(circuit, E[i], pow(a, 2**i, N), N, X, AUX)
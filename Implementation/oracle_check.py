@@ -0,0 +1,81 @@
+import numpy as np
+
+from .phase_oracle import domination_mask
+from .resources import GateCounter, oracle_counter
+from .reversible import netlist_from_gates, run_netlist, pack, unpack, any_set
+from .dominating_set import SubsetAllDominated
+from .classical import closed_neighborhood_masks
+from .mcx_synthesis import MCXSynthesizer
+
+# Inputs evaluated per pass (bit lanes); bounds the packed state to
+# num_qubits * CHUNK_SIZE / 8 bytes
+CHUNK_SIZE = 1 << 20
+
+def subset_oracle_netlist(graph, mcx_synthesis="native"):
+    """Netlist of SubsetAllDominated on [X (n qubits), n flags, target]."""
+    n = graph.n
+    counter = GateCounter(2 * n + 1, record=True)
+    circuit = counter if mcx_synthesis is None else MCXSynthesizer(counter, mcx_synthesis)
+    SubsetAllDominated(graph, circuit, list(range(n)), list(range(n, 2 * n)), 2 * n)
+    if mcx_synthesis is not None:
+        circuit.flush()
+    return counter, n
+
+def subset_dominating(graph, subsets):
+    """Whether each n-bit subset (bit u = vertex u chosen) dominates the graph."""
+    masks = np.array(closed_neighborhood_masks(graph), dtype=np.uint64)
+    return np.all((subsets[:, None] & masks[None, :]) != 0, axis=1)
+
+def check_oracle(graph, k=None, pool_size=None, synthesis="generic", encoding="index",
+                 max_report=10, mcx_synthesis="native", targets=None):
+    """
+    Runs the oracle's X/CX/MCX netlist classically on every input basis state
+    (bit-parallel, CHUNK_SIZE inputs at a time) with aux and target at 0, and
+    checks that
+      - the target equals the classical domination check of the input,
+      - every aux qubit is back to 0,
+      - the input register is unchanged.
+    encoding="index" checks the oracle build_grover_circuit uses for
+    (pool_size, synthesis, mcx_synthesis) over all 2^(k*n_bits) inputs; encoding="subset"
+    checks SubsetAllDominated over all 2^n subsets (k is not used).
+    targets checks the restricted oracle (index encoding only).
+    Returns a report dict with the number of inputs, up to max_report
+    offending inputs per check, and 'ok'.
+    """
+    if encoding == "subset":
+        counter, num_inputs = subset_oracle_netlist(graph, mcx_synthesis)
+        expected_for = lambda idx: subset_dominating(graph, idx)
+    else:
+        counter = oracle_counter(graph, k, pool_size, synthesis, record=True,
+                                 mcx_synthesis=mcx_synthesis, targets=targets)
+        num_inputs = k * int(np.ceil(np.log2(graph.n)))
+        marked = domination_mask(graph, k, targets)
+        expected_for = lambda idx: marked[idx.astype(np.int64)]
+
+    netlist = netlist_from_gates(counter.data)
+    num_qubits = counter.num_qubits
+    target = num_qubits - 1
+    aux = list(range(num_inputs, target))
+    report = {"inputs": 2**num_inputs, "gates": len(netlist),
+              "mismatched": [], "dirty_ancillas": [], "modified_inputs": []}
+
+    for start in range(0, 2**num_inputs, CHUNK_SIZE):
+        idx = np.arange(start, min(start + CHUNK_SIZE, 2**num_inputs), dtype=np.uint64)
+        state = np.zeros((num_qubits, max(1, -(-len(idx) // 64))), dtype=np.uint64)
+        packed = pack(idx, num_inputs)
+        state[:num_inputs] = packed
+        run_netlist(netlist, state)
+
+        # Row-wise reductions: unpack only holds 64 rows per value
+        output = unpack(state[[target]], len(idx)).astype(bool)
+        dirty = any_set(state[aux], len(idx))
+        modified = any_set(state[:num_inputs] ^ packed, len(idx))
+        for key, bad in (("mismatched", output != expected_for(idx)),
+                         ("dirty_ancillas", dirty), ("modified_inputs", modified)):
+            room = max_report - len(report[key])
+            if room > 0:
+                report[key] += idx[np.flatnonzero(bad)[:room]].astype(int).tolist()
+
+    report["ok"] = not (report["mismatched"] or report["dirty_ancillas"]
+                        or report["modified_inputs"])
+    return report
@@ -0,0 +1,101 @@
+import numpy as np
+
+# Number of basis states evaluated at once when building the mask
+BLOCK_SIZE = 1 << 20
+
+def closed_neighborhoods(graph, n_bits_node):
+    """
+    Bitmask of N[u] = {u} + neighbors(u) for every index u the register can hold.
+    Returns a uint64 array of shape (2**n_bits_node, words). Indices u >= n
+    (unused codes when n is not a power of two) dominate nothing, exactly
+    like in the AllDominated oracle.
+    """
+    n = graph.n
+    words = (n + 63) // 64
+    masks = np.zeros((2**n_bits_node, words), dtype=np.uint64)
+    indptr, indices = graph.csr()
+    rows = np.concatenate([np.arange(n), np.repeat(np.arange(n), np.diff(indptr))])
+    cols = np.concatenate([np.arange(n), indices])
+    bits = np.left_shift(np.uint64(1), (cols % 64).astype(np.uint64))
+    np.bitwise_or.at(masks, (rows, cols // 64), bits)
+    return masks
+
+def full_mask(n, vertices=None):
+    """Bitmask with all n vertices (or just 'vertices') set, in the layout of closed_neighborhoods."""
+    words = (n + 63) // 64
+    mask = np.zeros(words, dtype=np.uint64)
+    for v in range(n) if vertices is None else vertices:
+        mask[v // 64] |= np.uint64(1) << np.uint64(v % 64)
+    return mask
+
+def domination_mask(graph, k, targets=None):
+    """
+    Evaluates the AllDominated predicate classically for all 2^(k*n_bits) inputs.
+    Entry i is True iff the k vertex indices encoded in basis state i
+    (A_1 in the lowest n_bits, as in run_grover) form a dominating set
+    (or, with targets, dominate every vertex in targets).
+    """
+    n_bits_node = int(np.ceil(np.log2(graph.n)))
+    num_input_qubits = k * n_bits_node
+    N = 2**num_input_qubits
+
+    neighborhoods = closed_neighborhoods(graph, n_bits_node)
+    target = full_mask(graph.n, targets)
+    node_mask = (1 << n_bits_node) - 1
+
+    marked = np.empty(N, dtype=bool)
+    for start in range(0, N, BLOCK_SIZE):
+        idx = np.arange(start, min(start + BLOCK_SIZE, N), dtype=np.int64)
+        dominated = np.zeros((len(idx), len(target)), dtype=np.uint64)
+        for i in range(k):
+            A_i = (idx >> (i * n_bits_node)) & node_mask
+            dominated |= neighborhoods[A_i]
+        marked[start:start + len(idx)] = np.all(dominated & target == target, axis=1)
+    return marked
+
+def count_marked(graph, k):
+    """Exact number M of marked inputs (ordered k-tuples that dominate the graph)."""
+    return int(np.count_nonzero(domination_mask(graph, k)))
+
+def optimal_iterations(N, M):
+    """
+    floor(pi/4 * sqrt(N/M)) iterations for M marked states out of N.
+    With no marked state there is nothing to amplify, so no oracle call is spent.
+    """
+    if M == 0:
+        return 0
+    return int(np.floor((np.pi / 4) * np.sqrt(N / M)))
+
+def grover_probabilities(marked, iterations):
+    """
+    Statevector of the search register after Grover iterations, with the
+    oracle applied as a phase flip on the marked entries.
+    Returns the measurement probabilities of every basis state.
+    """
+    state = np.full(len(marked), 1 / np.sqrt(len(marked)))
+    for _ in range(iterations):
+        # -- Oracle -- (phase kickback of the |-> target)
+        state[marked] *= -1
+        # -- Diffuser -- (inversion about the mean)
+        state = 2 * state.mean() - state
+    probs = state**2
+    return probs / probs.sum()
+
+def simulate_grover(marked, iterations, shots=1024, seed=None):
+    """
+    Samples measurement outcomes of the phase-oracle Grover simulation.
+    Counts use the same bitstring keys as Qiskit (qubit 0 rightmost).
+    shots=None returns the exact probabilities instead.
+    """
+    num_input_qubits = int(np.log2(len(marked)))
+    probs = grover_probabilities(marked, iterations)
+    if shots is None:
+        return {format(int(i), f'0{num_input_qubits}b'): float(probs[i])
+                for i in np.flatnonzero(probs)}
+    rng = np.random.default_rng(seed)
+    samples = rng.multinomial(shots, probs)
+
+    counts = {}
+    for i in np.flatnonzero(samples):
+        counts[format(int(i), f'0{num_input_qubits}b')] = int(samples[i])
+    return counts
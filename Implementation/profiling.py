@@ -0,0 +1,44 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+STAGES = ("construct", "transpile", "simulate", "decode")
+
+class Profiler:
+    """
+    Wall-clock timings per stage of run_grover (see STAGES).
+    Pass the same Profiler to several runs to accumulate; 'calls' counts how
+    often each stage was entered.
+    """
+    def __init__(self):
+        self.timings = {}
+        self.calls = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    @property
+    def total(self):
+        return sum(self.timings.values())
+
+    def report(self):
+        """Rows of (stage, seconds, share of the total), in pipeline order."""
+        total = self.total or 1.0
+        names = [s for s in STAGES if s in self.timings]
+        names += [s for s in self.timings if s not in STAGES]
+        return [(name, self.timings[name], self.timings[name] / total) for name in names]
+
+    def print(self):
+        for name, seconds, share in self.report():
+            print(f"{name:<10} {seconds:9.4f} s  {share:6.1%}")
+
+def stage_timer(profiler):
+    """profiler.stage, or a no-op context factory when profiling is off."""
+    if profiler is None:
+        return lambda name: nullcontext()
+    return profiler.stage
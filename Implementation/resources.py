@@ -0,0 +1,178 @@
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from .dominating_set import Adj, Dominated, aux_qubits_needed
+from .grover import apply_oracle, apply_diffuser, resolve_iterations
+
+# Cost model for multi-controlled X gates. An MCX with c >= 3 controls is
+# costed as the clean-ancilla V-chain of 2c - 3 Toffolis; each Toffoli is
+# 7 T gates and 6 CX gates; a relative-phase Toffoli (RCCX, emitted by
+# mcx_synthesis) is 4 T gates and 3 CX gates.
+TOFFOLI_T_COUNT = 7
+TOFFOLI_CX_COUNT = 6
+RCCX_T_COUNT = 4
+RCCX_CX_COUNT = 3
+
+CountedGate = namedtuple("CountedGate", ["operation", "qubits"])
+
+def toffolis_per_mcx(num_controls):
+    """Toffolis in the V-chain decomposition of an MCX with num_controls controls."""
+    if num_controls < 2:
+        return 0
+    return 2 * num_controls - 3
+
+class GateCounter:
+    """
+    Stand-in for QuantumCircuit that only records gate counts and depth.
+    The oracle builders (Adj, Dominated, AllDominated, ...) only call
+    x/h/cx/mcx, slice registers and replay circuit.data, so they run
+    unchanged on a GateCounter with plain integer qubits. No Qiskit objects
+    are created, which keeps estimation cheap for graphs whose circuits are
+    too large to build. Names follow QuantumCircuit.count_ops (an MCX with
+    1 or 2 controls is a 'cx' or 'ccx').
+    """
+    def __init__(self, num_qubits, record=False):
+        self.num_qubits = num_qubits
+        self.ops = Counter()
+        self.mcx_controls = Counter()
+        self._levels = [0] * num_qubits
+        # Gate list, only kept when a builder needs to replay it (AllDominatedPooled)
+        self.record = record
+        self.data = []
+
+    def _gate(self, name, qubits):
+        level = max(self._levels[q] for q in qubits) + 1
+        for q in qubits:
+            self._levels[q] = level
+        self.ops[name] += 1
+        if self.record:
+            self.data.append(CountedGate(name, tuple(qubits)))
+
+    def x(self, qubits):
+        for q in np.atleast_1d(qubits).tolist():
+            self._gate("x", (q,))
+
+    def h(self, qubits):
+        for q in np.atleast_1d(qubits).tolist():
+            self._gate("h", (q,))
+
+    def cx(self, control, target):
+        self._gate("cx", (control, target))
+
+    def ccx(self, a, b, target):
+        self.mcx([a, b], target)
+
+    def rccx(self, a, b, target):
+        self._gate("rccx", (a, b, target))
+
+    def mcx(self, controls, target):
+        controls = list(controls)
+        name = {0: "x", 1: "cx", 2: "ccx"}.get(len(controls), "mcx")
+        if len(controls) >= 2:
+            self.mcx_controls[len(controls)] += 1
+        self._gate(name, controls + [target])
+
+    def append(self, operation, qubits):
+        qubits = list(qubits)
+        if operation in ("x", "h", "rccx"):
+            self._gate(operation, qubits)
+        else:
+            self.mcx(qubits[:-1], qubits[-1])
+
+    def depth(self):
+        return max(self._levels, default=0)
+
+    def summary(self):
+        """Qubits, depth and gate counts, plus T-count and CX estimates from the V-chain model."""
+        toffolis = sum(toffolis_per_mcx(c) * m for c, m in self.mcx_controls.items())
+        return {
+            "qubits": self.num_qubits,
+            "depth": self.depth(),
+            "size": sum(self.ops.values()),
+            "x": self.ops["x"],
+            "h": self.ops["h"],
+            "cx": self.ops["cx"],
+            "ccx": self.ops["ccx"],
+            "rccx": self.ops["rccx"],
+            "mcx": self.ops["mcx"],
+            "max_controls": max(self.mcx_controls, default=0),
+            "t_count": TOFFOLI_T_COUNT * toffolis + RCCX_T_COUNT * self.ops["rccx"],
+            "cx_estimate": (self.ops["cx"] + TOFFOLI_CX_COUNT * toffolis
+                            + RCCX_CX_COUNT * self.ops["rccx"]),
+        }
+
+def _n_bits_node(graph, n_bits_node):
+    return n_bits_node if n_bits_node is not None else int(np.ceil(np.log2(graph.n)))
+
+def estimate_adj(graph, n_bits_node=None):
+    """Resources of Adj on registers A, B (n_bits_node qubits each) and a target."""
+    nb = _n_bits_node(graph, n_bits_node)
+    counter = GateCounter(2 * nb + 1)
+    Adj(graph, counter, list(range(nb)), list(range(nb, 2 * nb)), 2 * nb)
+    return counter.summary()
+
+def estimate_dominated(graph, k, n_bits_node=None):
+    """Resources of Dominated on [A_1..A_k, B, k scratch flags, target]."""
+    nb = _n_bits_node(graph, n_bits_node)
+    counter = GateCounter(k * nb + nb + k + 1)
+    A_list = [list(range(i * nb, (i + 1) * nb)) for i in range(k)]
+    B = list(range(k * nb, (k + 1) * nb))
+    AUX = list(range((k + 1) * nb, (k + 1) * nb + k))
+    Dominated(graph, counter, A_list, B, AUX, (k + 1) * nb + k)
+    return counter.summary()
+
+def oracle_counter(graph, k, pool_size=None, synthesis="generic", record=False,
+                   mcx_synthesis="native", targets=None):
+    """
+    GateCounter holding the oracle that build_grover_circuit would append,
+    on qubits [input, aux, target]. record=True keeps the gate list.
+    """
+    n = graph.n if targets is None else len(targets)
+    nb = _n_bits_node(graph, None)
+    num_aux_qubits = aux_qubits_needed(n, nb, k, pool_size, synthesis)
+    counter = GateCounter(k * nb + num_aux_qubits + 1,
+                          record=record or (pool_size is not None and pool_size < n))
+    A_list = [list(range(i * nb, (i + 1) * nb)) for i in range(k)]
+    aux = list(range(k * nb, k * nb + num_aux_qubits))
+    apply_oracle(graph, counter, A_list, aux, k * nb + num_aux_qubits, pool_size, synthesis,
+                 mcx_synthesis, targets)
+    return counter
+
+def estimate_all_dominated(graph, k, pool_size=None, synthesis="generic", mcx_synthesis="native"):
+    """Resources of the full oracle (AllDominated, or its pooled/neighborhood variants)."""
+    return oracle_counter(graph, k, pool_size, synthesis, mcx_synthesis=mcx_synthesis).summary()
+
+def estimate_diffuser(n_qubits, num_ancillas=0, mcx_synthesis="native"):
+    """Resources of the diffuser on n_qubits qubits (plus num_ancillas clean ancillas)."""
+    counter = GateCounter(n_qubits + num_ancillas)
+    apply_diffuser(counter, range(n_qubits), range(n_qubits, n_qubits + num_ancillas),
+                   mcx_synthesis)
+    return counter.summary()
+
+def estimate_grover(graph, k, iterations=None, pool_size=None, synthesis="generic",
+                    mcx_synthesis="native"):
+    """
+    Resources of the whole build_grover_circuit (index encoding), with the
+    Oracle and Diffuser blocks expanded. Counts are exact; depth lays the
+    blocks end to end, so it is an upper bound on the flattened depth.
+    """
+    nb = _n_bits_node(graph, None)
+    num_input_qubits = k * nb
+    iterations = resolve_iterations(graph, k, iterations)
+
+    oracle_cost = estimate_all_dominated(graph, k, pool_size, synthesis, mcx_synthesis)
+    num_ancillas = oracle_cost["qubits"] - num_input_qubits - 1 if mcx_synthesis in ("ancilla", "toffoli") else 0
+    diffuser_cost = estimate_diffuser(num_input_qubits, num_ancillas, mcx_synthesis)
+    report = {"qubits": oracle_cost["qubits"], "iterations": iterations}
+    for key in ("size", "x", "h", "cx", "ccx", "rccx", "mcx", "t_count", "cx_estimate", "depth"):
+        report[key] = iterations * (oracle_cost[key] + diffuser_cost[key])
+    # Initialization (H on the input, X + H on the target) and measurement
+    report["x"] += 1
+    report["h"] += num_input_qubits + 1
+    report["size"] += num_input_qubits + 2
+    report["depth"] += 2 + 1
+    report["measure"] = num_input_qubits
+    report["size"] += num_input_qubits
+    report["max_controls"] = max(oracle_cost["max_controls"], diffuser_cost["max_controls"])
+    return report
@@ -0,0 +1,112 @@
+import numpy as np
+
+from .phase_oracle import closed_neighborhoods, full_mask
+
+def bitstring_array(bitstrings):
+    """
+    Unpacks Qiskit count keys into a (m, width) uint8 array of bits,
+    column j holding qubit j (Qiskit prints qubit 0 rightmost).
+    """
+    width = len(bitstrings[0])
+    chars = np.frombuffer("".join(bitstrings).encode(), dtype=np.uint8)
+    return (chars.reshape(-1, width)[:, ::-1] - ord('0')).astype(np.uint8)
+
+class GroverResult:
+    """
+    Decoded and verified measurement counts of a run_grover call.
+    All distinct outcomes are decoded and checked against the graph at once:
+      bitstrings  - the raw count keys
+      shots       - count of each outcome
+      vertices    - (m, k) vertex indices per outcome (index encoding), or the
+                    (m, n) membership bits (subset encoding)
+      valid       - whether each outcome is a dominating set (with targets:
+                    whether it dominates every vertex in targets)
+    """
+    def __init__(self, graph, counts, k, encoding="index", targets=None):
+        self.graph = graph
+        self.k = k
+        self.encoding = encoding
+        self.targets = targets
+        self.bitstrings = list(counts)
+        # Integer counts, or probabilities when run_grover ran with shots=None
+        self.shots = np.array([counts[b] for b in self.bitstrings])
+
+        if not self.bitstrings:
+            self.vertices = np.zeros((0, k), dtype=np.int64)
+            self.valid = np.zeros(0, dtype=bool)
+            return
+
+        bits = bitstring_array(self.bitstrings)
+        if encoding == "subset":
+            self.vertices = bits
+            self.valid = self._check_subsets(bits)
+        else:
+            n_bits_node = int(np.ceil(np.log2(graph.n)))
+            # A_i occupies qubits [i*n_bits_node, (i+1)*n_bits_node), little-endian
+            weights = (1 << np.arange(n_bits_node, dtype=np.int64))
+            chunks = bits.reshape(len(bits), k, n_bits_node).astype(np.int64)
+            self.vertices = chunks @ weights
+            self.valid = self._check_indices(self.vertices, n_bits_node)
+
+    def _check_indices(self, vertices, n_bits_node):
+        neighborhoods = closed_neighborhoods(self.graph, n_bits_node)
+        dominated = np.zeros((len(vertices), neighborhoods.shape[1]), dtype=np.uint64)
+        for i in range(self.k):
+            dominated |= neighborhoods[vertices[:, i]]
+        target = full_mask(self.graph.n, self.targets)
+        return np.all(dominated & target == target, axis=1)
+
+    def _check_subsets(self, bits):
+        n = self.graph.n
+        adjacency = np.eye(n, dtype=np.int64)
+        edges = self.graph.edges()
+        adjacency[edges[:, 0], edges[:, 1]] = 1
+        adjacency[edges[:, 1], edges[:, 0]] = 1
+        dominated = bits.astype(np.int64) @ adjacency
+        if self.targets is not None:
+            dominated = dominated[:, list(self.targets)]
+        return np.all(dominated > 0, axis=1)
+
+    @property
+    def total_shots(self):
+        return self.shots.sum().item() if len(self.shots) else 0
+
+    @property
+    def success_probability(self):
+        """Fraction of shots that measured a dominating set."""
+        if self.total_shots == 0:
+            return 0.0
+        return float(self.shots[self.valid].sum() / self.total_shots)
+
+    def _vertex_set(self, row):
+        if self.encoding == "subset":
+            return tuple(int(u) for u in np.flatnonzero(self.vertices[row]))
+        # Codes n..2^n_bits_node - 1 are padding, not vertices: they dominate
+        # nothing and are left out of the set
+        return tuple(sorted(set(int(u) for u in self.vertices[row] if u < self.graph.n)))
+
+    @property
+    def valid_sets(self):
+        """Counts per distinct dominating set (sorted vertex tuples), most frequent first."""
+        sets = {}
+        for row in np.flatnonzero(self.valid):
+            vertex_set = self._vertex_set(row)
+            sets[vertex_set] = sets.get(vertex_set, 0) + self.shots[row].item()
+        return dict(sorted(sets.items(), key=lambda item: item[1], reverse=True))
+
+    @property
+    def best_set(self):
+        """Most frequently measured dominating set, or None if none was seen."""
+        sets = self.valid_sets
+        if not sets:
+            return None
+        return next(iter(sets))
+
+    def summary(self):
+        return {
+            "shots": self.total_shots,
+            "distinct_outcomes": len(self.bitstrings),
+            "success_probability": self.success_probability,
+            "distinct_valid_sets": len(self.valid_sets),
+            "best_set": self.best_set,
+        }
@@ -0,0 +1,176 @@
+import numpy as np
+from qiskit.circuit import ControlledGate, Qubit
+
+# Classical simulation of reversible circuits (X, CX, CCX, MCX, SWAP and
+# their controlled/negated-control forms) on many basis-state inputs at once.
+# The state is bit-packed: row q of a (num_qubits, num_words) uint64 array
+# holds qubit q for 64 inputs per word, so every gate is a few whole-row
+# XOR/AND operations no matter how many inputs are evaluated.
+
+# Gates that act as the identity on basis states
+IGNORED = {"barrier", "measure", "id", "delay"}
+
+class NotReversibleError(ValueError):
+    """The circuit contains a gate that does not map basis states to basis states."""
+
+def compile_netlist(circuit):
+    """
+    Flattens circuit into a list of (kind, target(s), controls) with integer
+    qubit indices. kind is "x" (controls: tuple of (qubit, polarity)) or
+    "swap" (targets a pair, same controls). Composite gates are expanded
+    through their definitions.
+    """
+    netlist = []
+    _flatten(circuit, [circuit.find_bit(q).index for q in circuit.qubits], netlist)
+    return netlist
+
+def _flatten(circuit, index, netlist):
+    positions = {q: i for i, q in enumerate(circuit.qubits)}
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [index[positions[q]] for q in instruction.qubits]
+        name = operation.name
+        if name in IGNORED:
+            continue
+        if name == "x":
+            netlist.append(("x", qubits[0], ()))
+        elif name in ("rccx", "rcccx"):
+            # Relative-phase Toffolis act as Toffolis on basis states
+            netlist.append(("x", qubits[-1], tuple((q, 1) for q in qubits[:-1])))
+        elif name == "swap":
+            netlist.append(("swap", (qubits[0], qubits[1]), ()))
+        elif isinstance(operation, ControlledGate) and operation.base_gate.name in ("x", "swap"):
+            num_controls = operation.num_ctrl_qubits
+            state = operation.ctrl_state
+            controls = tuple((qubits[i], (state >> i) & 1) for i in range(num_controls))
+            if operation.base_gate.name == "x":
+                netlist.append(("x", qubits[num_controls], controls))
+            else:
+                netlist.append(("swap", (qubits[num_controls], qubits[num_controls + 1]), controls))
+        elif operation.definition is not None:
+            _flatten(operation.definition, qubits, netlist)
+        else:
+            raise NotReversibleError(f"Gate '{name}' is not a classical reversible gate")
+
+def netlist_from_gates(gates):
+    """
+    Netlist of a gate list recorded by resources.GateCounter (record=True),
+    so large oracles can be checked without building a QuantumCircuit.
+    """
+    netlist = []
+    for name, qubits in gates:
+        if name in ("x", "cx", "ccx", "rccx", "mcx"):
+            netlist.append(("x", qubits[-1], tuple((q, 1) for q in qubits[:-1])))
+        else:
+            raise NotReversibleError(f"Gate '{name}' is not a classical reversible gate")
+    return netlist
+
+def _control_mask(state, controls, ones):
+    mask = ones.copy()
+    for qubit, polarity in controls:
+        if polarity:
+            mask &= state[qubit]
+        else:
+            mask &= ~state[qubit]
+    return mask
+
+def run_netlist(netlist, state):
+    """Applies a compiled netlist to a packed state in place and returns it."""
+    ones = np.full(state.shape[1], np.iinfo(np.uint64).max, dtype=np.uint64)
+    for kind, target, controls in netlist:
+        if kind == "x":
+            if not controls:
+                state[target] ^= ones
+            elif len(controls) == 1 and controls[0][1]:
+                state[target] ^= state[controls[0][0]]
+            else:
+                state[target] ^= _control_mask(state, controls, ones)
+        else:
+            a, b = target
+            diff = state[a] ^ state[b]
+            if controls:
+                diff &= _control_mask(state, controls, ones)
+            state[a] ^= diff
+            state[b] ^= diff
+    return state
+
+def pack(values, width):
+    """(width, num_words) uint64 rows: row j holds bit j of every value, 64 values per word."""
+    values = np.asarray(values, dtype=np.uint64)
+    count = len(values)
+    num_words = max(1, -(-count // 64))
+    rows = np.zeros((width, num_words * 64), dtype=np.uint8)
+    for j in range(width):
+        rows[j, :count] = (values >> np.uint64(j)) & np.uint64(1)
+    packed = np.packbits(rows, axis=1, bitorder='little')
+    return packed.view(np.uint64).reshape(width, num_words)
+
+def unpack(rows, count):
+    """Inverse of pack: integer values (uint64) of 'count' inputs (at most 64 rows)."""
+    bits = np.unpackbits(np.ascontiguousarray(rows).view(np.uint8), axis=1,
+                         bitorder='little')[:, :count]
+    values = np.zeros(count, dtype=np.uint64)
+    for j in range(len(rows)):
+        values |= bits[j].astype(np.uint64) << np.uint64(j)
+    return values
+
+def any_set(rows, count):
+    """Boolean mask of the 'count' inputs for which any of the packed rows holds a 1."""
+    if len(rows) == 0:
+        return np.zeros(count, dtype=bool)
+    merged = np.ascontiguousarray(np.bitwise_or.reduce(rows, axis=0))
+    return np.unpackbits(merged.view(np.uint8), bitorder='little')[:count].astype(bool)
+
+def _indices(circuit, qubits):
+    if isinstance(qubits, (Qubit, int, np.integer)):
+        qubits = [qubits]
+    return [q if isinstance(q, (int, np.integer)) else circuit.find_bit(q).index for q in qubits]
+
+class ReversibleResult:
+    """Packed output state of simulate(), read back per register."""
+    def __init__(self, circuit, state, count):
+        self.circuit = circuit
+        self.state = state
+        self.count = count
+
+    def value(self, qubits):
+        """Output value of a register (or list of qubits) for every input."""
+        return unpack(self.state[_indices(self.circuit, qubits)], self.count)
+
+    def dirty(self, qubits):
+        """Boolean mask of the inputs for which any of 'qubits' ended non-zero."""
+        return any_set(self.state[_indices(self.circuit, qubits)], self.count)
+
+def simulate(circuit, inputs, netlist=None):
+    """
+    Runs a reversible circuit on many classical inputs at once.
+    inputs maps registers (or qubits, or tuples of qubits) to arrays of input values, one
+    entry per input; every other qubit starts at 0. Returns a
+    ReversibleResult. A netlist from compile_netlist can be passed to reuse
+    the flattening across calls.
+    """
+    counts = {len(np.atleast_1d(values)) for values in inputs.values()}
+    if len(counts) != 1:
+        raise ValueError("All input arrays must have the same length")
+    count = counts.pop()
+    state = np.zeros((circuit.num_qubits, max(1, -(-count // 64))), dtype=np.uint64)
+    for qubits, values in inputs.items():
+        index = _indices(circuit, qubits)
+        state[index] = pack(np.atleast_1d(values), len(index))
+
+    if netlist is None:
+        netlist = compile_netlist(circuit)
+    run_netlist(netlist, state)
+    return ReversibleResult(circuit, state, count)
+
+def all_inputs(*widths):
+    """Every combination of register values for the given widths, as one array per register."""
+    grids = np.meshgrid(*[np.arange(2**w, dtype=np.uint64) for w in widths], indexing='ij')
+    return [grid.ravel() for grid in grids]
+
+def check_ancillas(result, ancillas):
+    """Raises AssertionError listing the first inputs that leave an ancilla dirty."""
+    dirty = result.dirty(ancillas)
+    if dirty.any():
+        raise AssertionError(f"{int(dirty.sum())} inputs leave ancillas dirty, "
+                             f"first at input {np.flatnonzero(dirty)[:5].tolist()}")
@@ -0,0 +1,159 @@
+import asyncio
+from math import comb
+
+import numpy as np
+
+from .grover import run_grover
+from .results import GroverResult
+from .cache import CircuitCache
+
+# Streaming execution of run_grover: shots arrive in chunks, each chunk is
+# decoded and verified on its own (GroverResult over the chunk's distinct
+# outcomes) and merged into running totals, and the stream stops early:
+#   "found"        - min_hits shots measured a verified set (verification
+#                    is exact, so one hit already proves k feasible);
+#   "uniform"      - nothing verified, and a chi-square test cannot tell the
+#                    counts from the uniform distribution an infeasible k
+#                    produces (no marked state, nothing amplified);
+#   "inconclusive" - the shot budget ran out without either.
+# The chi-square test only has power once every outcome expects a few shots,
+# so "uniform" waits for MIN_EXPECTED_COUNT shots per outcome: with 2^(k*nb)
+# outcomes and a small budget, an unlucky feasible k (low success
+# probability at the chosen iterations) ends "inconclusive", not "uniform".
+# Aer samples all shots of a run from one final state, so by default the
+# stream simulates once in shot-free mode and draws the chunks from those
+# probabilities; per_chunk=True runs the backend for every chunk instead
+# (built and transpiled once through a CircuitCache), like a backend that is
+# billed per shot. On a simulator an early stop therefore saves shots and
+# decoding, not simulation time: the default path pays one full simulation
+# up front, and per_chunk=True pays one per chunk, more than a single run.
+
+# Expected shots per outcome before the uniformity test is trusted
+MIN_EXPECTED_COUNT = 5
+
+class GroverStream:
+    """Running totals of a streamed run, updated one chunk of counts at a time."""
+    def __init__(self, graph, k, encoding="index", targets=None, num_outcomes=None):
+        self.graph = graph
+        self.k = k
+        self.encoding = encoding
+        self.targets = targets
+        self.num_outcomes = num_outcomes
+        self.counts = {}
+        self.valid_sets = {}
+        self.shots = 0
+        self.hits = 0
+        # Sum of squared counts, for the chi-square statistic
+        self._sum_squares = 0
+
+    def add(self, counts):
+        """Merges one chunk of counts; only the chunk's outcomes are decoded."""
+        chunk = GroverResult(self.graph, counts, self.k, self.encoding, self.targets)
+        for vertex_set, hits in chunk.valid_sets.items():
+            self.valid_sets[vertex_set] = self.valid_sets.get(vertex_set, 0) + hits
+            self.hits += hits
+        for bitstring, count in counts.items():
+            before = self.counts.get(bitstring, 0)
+            self.counts[bitstring] = before + count
+            self._sum_squares += (before + count)**2 - before**2
+        self.shots += chunk.total_shots
+
+    @property
+    def best_set(self):
+        """Most frequently measured verified set so far, or None."""
+        if not self.valid_sets:
+            return None
+        return max(self.valid_sets, key=self.valid_sets.get)
+
+    def p_uniform(self):
+        """
+        p-value of Pearson's chi-square test of the counts against the
+        uniform distribution over num_outcomes (unseen outcomes count as 0).
+        """
+        if self.shots == 0:
+            return 1.0
+        # scipy.stats takes seconds to import; only streamed runs need it
+        from scipy.stats import chi2
+        N, s = self.num_outcomes, self.shots
+        statistic = N / s * self._sum_squares - s
+        return float(chi2.sf(statistic, N - 1))
+
+    def summary(self, status):
+        return {
+            "status": status,
+            "shots": self.shots,
+            "hits": self.hits,
+            "success_probability": self.hits / self.shots if self.shots else 0.0,
+            "distinct_valid_sets": len(self.valid_sets),
+            "best_set": self.best_set,
+            "p_uniform": self.p_uniform(),
+        }
+
+def _num_outcomes(graph, k, encoding):
+    if encoding == "subset":
+        return comb(graph.n, k)
+    return 2**(k * int(np.ceil(np.log2(graph.n))))
+
+def stream_grover(graph, k, shots=1024, chunk_shots=64, confidence=0.99, min_hits=1,
+                  min_shots=None, per_chunk=False, seed=None, **kwargs):
+    """
+    Runs run_grover (kwargs are passed on) as a stream of chunk_shots-shot
+    chunks, yielding a summary dict after every chunk: status ("running",
+    then "found", "uniform" or "inconclusive" on the last one), shots and
+    hits so far, observed success probability, best verified set and the
+    p-value of the uniformity test.
+    A k is declared "uniform" (most likely infeasible) once nothing was
+    found in at least min_shots (default 2 * chunk_shots) and
+    MIN_EXPECTED_COUNT shots per outcome, and the uniformity test has
+    p-value above 1 - confidence. A budget below MIN_EXPECTED_COUNT shots
+    per outcome can end "found" or "inconclusive", never "uniform".
+    """
+    if shots is None or shots < 1 or chunk_shots < 1:
+        raise ValueError("stream_grover needs shots >= 1 and chunk_shots >= 1")
+    if min_shots is None:
+        min_shots = 2 * chunk_shots
+    encoding = kwargs.get("encoding", "index")
+    num_outcomes = _num_outcomes(graph, k, encoding)
+    stream = GroverStream(graph, k, encoding, kwargs.get("targets"), num_outcomes)
+    min_shots = max(min_shots, MIN_EXPECTED_COUNT * num_outcomes)
+
+    if per_chunk:
+        if kwargs.get("incremental") is None:
+            kwargs.setdefault("cache", CircuitCache())
+        draw = lambda size: run_grover(graph, k, shots=size, **kwargs)[0]
+    else:
+        probabilities, _ = run_grover(graph, k, shots=None, **kwargs)
+        keys = list(probabilities)
+        p = np.array([probabilities[key] for key in keys])
+        p /= p.sum()
+        rng = np.random.default_rng(seed)
+
+        def draw(size):
+            samples = rng.multinomial(size, p)
+            return {keys[i]: int(samples[i]) for i in np.flatnonzero(samples)}
+
+    while stream.shots < shots:
+        stream.add(draw(min(chunk_shots, shots - stream.shots)))
+        if stream.hits >= min_hits:
+            status = "found"
+        elif stream.shots >= min_shots and stream.p_uniform() > 1 - confidence:
+            status = "uniform"
+        elif stream.shots >= shots:
+            status = "inconclusive"
+        else:
+            status = "running"
+        yield stream.summary(status)
+        if status != "running":
+            return
+
+async def astream_grover(graph, k, **kwargs):
+    """
+    Async generator over the same summaries as stream_grover; every chunk is
+    computed in a worker thread, so the event loop stays free.
+    """
+    updates = stream_grover(graph, k, **kwargs)
+    while True:
+        update = await asyncio.to_thread(next, updates, None)
+        if update is None:
+            return
+        yield update
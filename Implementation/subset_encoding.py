@@ -0,0 +1,129 @@
+import itertools
+from math import comb
+
+from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
+import numpy as np
+
+from .dominating_set import SubsetAllDominated
+
+# Subset encoding: an n-qubit register with qubit u = 1 iff vertex u is chosen,
+# restricted to Hamming weight k. The search space is C(n, k) unordered sets
+# instead of the n^k (padded to 2^(k*n_bits)) ordered index tuples.
+
+def _split_and_cyclic_shift(qc, qubits, l, k):
+    """SCS_{l,k} block of the Dicke state preparation (Bartschi & Eidenbenz)."""
+    q = qubits
+    qc.cx(q[l - 2], q[l - 1])
+    qc.cry(2 * np.arccos(np.sqrt(1 / l)), q[l - 1], q[l - 2])
+    qc.cx(q[l - 2], q[l - 1])
+    for j in range(2, k + 1):
+        qc.cx(q[l - j - 1], q[l - 1])
+        qc.mcry(2 * np.arccos(np.sqrt(j / l)), [q[l - 1], q[l - j]], q[l - j - 1])
+        qc.cx(q[l - j - 1], q[l - 1])
+
+def dicke_state(n, k):
+    """Gate preparing the uniform superposition of all weight-k n-bit strings from |0>."""
+    qc = QuantumCircuit(n)
+    q = list(range(n))
+    qc.x(q[n - k:])
+    for l in range(n, k, -1):
+        _split_and_cyclic_shift(qc, q, l, k)
+    for l in range(k, 1, -1):
+        _split_and_cyclic_shift(qc, q, l, l - 1)
+    gate = qc.to_gate()
+    gate.name = f"Dicke({n},{k})"
+    return gate
+
+def subset_diffuser(n, k):
+    """Inversion about the Dicke state: U (2|0><0| - I) U^dagger, U = dicke_state(n, k)."""
+    prep = dicke_state(n, k)
+    qc = QuantumCircuit(n)
+    qc.append(prep.inverse(), range(n))
+    qc.x(range(n))
+    qc.h(n - 1)
+    qc.mcx(list(range(n - 1)), n - 1)
+    qc.h(n - 1)
+    qc.x(range(n))
+    qc.append(prep, range(n))
+    gate = qc.to_gate()
+    gate.name = "Diffuser"
+    return gate
+
+def subset_iterations(n, k, M=1):
+    """floor(pi/4 * sqrt(C(n,k)/M)) iterations (0 if there is no solution)."""
+    if M == 0:
+        return 0
+    return int(np.floor((np.pi / 4) * np.sqrt(comb(n, k) / M)))
+
+def subset_domination_mask(graph, k):
+    """
+    Classical domination check for every k-subset, in itertools.combinations order.
+    Returns (subsets, mask).
+    """
+    neighborhoods = [(1 << u) | sum(1 << v for v in graph.adj_list[u]) for u in range(graph.n)]
+    full = (1 << graph.n) - 1
+    subsets = list(itertools.combinations(range(graph.n), k))
+    mask = np.zeros(len(subsets), dtype=bool)
+    for i, subset in enumerate(subsets):
+        dominated = 0
+        for u in subset:
+            dominated |= neighborhoods[u]
+        mask[i] = dominated == full
+    return subsets, mask
+
+def simulate_subset_grover(graph, k, iterations, shots=1024, seed=None):
+    """
+    Phase-oracle simulation restricted to the C(n,k) subset states.
+    Counts use n-bit one-hot keys with vertex 0 rightmost, like the circuit.
+    shots=None returns the exact probabilities instead.
+    """
+    subsets, marked = subset_domination_mask(graph, k)
+    state = np.full(len(subsets), 1 / np.sqrt(len(subsets)))
+    for _ in range(iterations):
+        state[marked] *= -1
+        state = 2 * state.mean() - state
+    probs = state**2
+    probs /= probs.sum()
+
+    if shots is None:
+        values = probs
+    else:
+        rng = np.random.default_rng(seed)
+        values = rng.multinomial(shots, probs)
+    counts = {}
+    for i in np.flatnonzero(values):
+        key = format(sum(1 << u for u in subsets[i]), f'0{graph.n}b')
+        counts[key] = float(values[i]) if shots is None else int(values[i])
+    return counts
+
+def build_subset_circuit(graph, k, iterations):
+    """Grover circuit over the subset register, starting from the Dicke state."""
+    n = graph.n
+    qr_input = QuantumRegister(n, 'input')
+    qr_aux = QuantumRegister(n, 'aux')
+    qr_target = QuantumRegister(1, 'target')
+    cr = ClassicalRegister(n, 'meas')
+    qc = QuantumCircuit(qr_input, qr_aux, qr_target, cr)
+
+    # 1. Initialization: uniform superposition over all k-subsets
+    qc.append(dicke_state(n, k), qr_input)
+    qc.x(qr_target)
+    qc.h(qr_target)
+
+    # 2. Grover loop, oracle and diffuser built once
+    oracle_qc = QuantumCircuit(qr_input, qr_aux, qr_target)
+    SubsetAllDominated(graph, oracle_qc, qr_input, qr_aux, qr_target[0])
+    oracle_gate = oracle_qc.to_gate()
+    oracle_gate.name = "Oracle"
+    diffuser_gate = subset_diffuser(n, k)
+    oracle_qubits = list(qr_input) + list(qr_aux) + list(qr_target)
+    for _ in range(iterations):
+        qc.append(oracle_gate, oracle_qubits)
+        qc.append(diffuser_gate, qr_input)
+
+    qc.measure(qr_input, cr)
+    return qc
+
+def decode_subset(bitstring):
+    """Vertices whose qubit is 1 (vertex 0 is the rightmost character)."""
+    return tuple(u for u, bit in enumerate(reversed(bitstring)) if bit == '1')
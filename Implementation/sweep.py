@@ -0,0 +1,262 @@
+import csv
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from qiskit.transpiler.exceptions import CircuitTooWideForTarget
+
+from .grover import run_grover
+from .results import GroverResult
+from .classical import greedy_dominating_set, is_feasible, minimum_dominating_set
+
+TABLE_COLUMNS = ["n", "k", "iterations", "shots", "status", "success",
+                 "success_probability", "best_set", "seconds"]
+
+def _limit_memory(memory_limit_mb):
+    """Worker initializer: caps the address space of the worker process."""
+    if memory_limit_mb is None:
+        return
+    import resource
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _start_worker(memory_limit_mb, pids):
+    """Worker initializer: applies the memory cap and reports the worker's pid."""
+    _limit_memory(memory_limit_mb)
+    pids.put(os.getpid())
+
+class WorkerPool:
+    """
+    ProcessPoolExecutor whose workers can be stopped mid-task. Every worker
+    reports its pid on start, and stop() terminates those that are still
+    alive, so abandoned or runaway simulations do not keep the cores busy.
+    """
+    def __init__(self, max_workers, memory_limit_mb=None):
+        self._pids = multiprocessing.SimpleQueue()
+        self._started = set()
+        self.executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_start_worker,
+                                            initargs=(memory_limit_mb, self._pids))
+
+    def submit(self, fn, *args):
+        return self.executor.submit(fn, *args)
+
+    def stop(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        while not self._pids.empty():
+            self._started.add(self._pids.get())
+        # Only our own live children: a pid that already exited is never signalled
+        for process in multiprocessing.active_children():
+            if process.pid in self._started:
+                process.terminate()
+
+def verify_counts(graph, counts, k):
+    """
+    Classically checks every measured outcome.
+    Returns (fraction of shots that are dominating sets, most frequent valid set).
+    """
+    result = GroverResult(graph, counts, k)
+    return result.success_probability, result.best_set
+
+def run_task(graph, k, iterations, shots, method, synthesis, stream=False):
+    """
+    One sweep configuration: runs Grover and verifies the result.
+    With stream, shots are drawn in chunks (streaming.stream_grover) and the
+    row records the shots actually used and the final status ("found",
+    "uniform" or "inconclusive"). Those are sampled shots, not simulation time
+    saved: the stream simulates the whole circuit once before the first
+    chunk, so a streamed row costs as much to simulate as a full one.
+    """
+    start = time.perf_counter()
+    row = {"n": graph.n, "k": k, "iterations": iterations, "shots": shots}
+    try:
+        if stream:
+            from .streaming import stream_grover
+            for update in stream_grover(graph, k, shots=shots, iterations=iterations,
+                                        method=method, synthesis=synthesis):
+                pass
+            row.update(status=update["status"], shots=update["shots"],
+                       success=update["best_set"] is not None,
+                       success_probability=update["success_probability"],
+                       best_set=update["best_set"])
+            row["seconds"] = time.perf_counter() - start
+            return row
+        counts, _ = run_grover(graph, k, iterations=iterations, shots=shots,
+                               method=method, synthesis=synthesis)
+    except MemoryError:
+        row.update(status="memory", success=False, success_probability=0.0, best_set=None)
+    except CircuitTooWideForTarget:
+        row.update(status="too_wide", success=False, success_probability=0.0, best_set=None)
+    else:
+        probability, best_set = verify_counts(graph, counts, k)
+        row.update(status="ok", success=best_set is not None,
+                   success_probability=probability, best_set=best_set)
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+def run_in_pool(fn, tasks, max_workers=None, memory_limit_mb=None, queue_size=None,
+                skip=None):
+    """
+    Runs fn(*task) for every task in a WorkerPool and yields (task, result)
+    as each finishes, with at most queue_size tasks submitted at a time
+    (default: max_workers, which defaults to all cores).
+    skip(task) is checked when a task would start and again for every task
+    still in flight: skipped tasks are not started, and running ones are
+    abandoned (their workers are stopped at the end).
+    A worker killed outright breaks the pool; it is recreated and the tasks
+    that were in flight are retried once each on their own. A task that
+    breaks the pool again yields result None.
+    """
+    max_workers = max_workers or os.cpu_count()
+    queue_size = queue_size or max_workers
+    skip = skip or (lambda task: False)
+    pool = WorkerPool(max_workers, memory_limit_mb)
+    try:
+        # future -> (task, is a retry, pool it runs in)
+        pending = {}
+        retries = []
+        next_task = 0
+        while pending or retries or next_task < len(tasks):
+            for future, (task, _, _) in list(pending.items()):
+                if skip(task):
+                    del pending[future]
+            if retries:
+                # Retries run alone, so a second break is their own
+                if not pending:
+                    task = retries.pop(0)
+                    if not skip(task):
+                        pending[pool.submit(fn, *task)] = (task, True, pool)
+                    continue
+            else:
+                while len(pending) < queue_size and next_task < len(tasks):
+                    task = tasks[next_task]
+                    next_task += 1
+                    if not skip(task):
+                        pending[pool.submit(fn, *task)] = (task, False, pool)
+            if not pending:
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future not in pending:
+                    continue
+                task, retried, owner = pending.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    if owner is pool:
+                        pool.stop()
+                        pool = WorkerPool(max_workers, memory_limit_mb)
+                    if not retried:
+                        retries.append(task)
+                        continue
+                    result = None
+                if skip(task):
+                    continue
+                yield task, result
+    finally:
+        pool.stop()
+
+def sweep(graph, k_values=None, iteration_counts=(None,), shots=1024, method="aer",
+          synthesis="generic", max_workers=None, memory_limit_mb=None, early_stop=True,
+          prune=True, stream=False):
+    """
+    Runs run_grover over every (k, iterations) configuration in a process pool
+    and yields one result row per configuration as soon as it finishes.
+
+    Configurations are started in increasing k, at most max_workers at a time
+    (default: all cores), and memory_limit_mb caps each worker's address space;
+    a task that runs out of memory (or is wider than the simulator allows)
+    reports status "memory" ("too_wide") instead of taking the sweep down.
+    A worker killed outright (the limit hit inside Aer, or the OOM killer)
+    breaks the pool: it is recreated, the configurations that were running
+    are retried once each on their own, and one that breaks it again
+    reports status "memory".
+    With early_stop, once a verified dominating set of size k is found no
+    configuration with a larger k is started, running ones are abandoned,
+    and the sweep ends as soon as every configuration with a smaller k has
+    finished.
+    With prune, the classical solver drops every k that cannot succeed and
+    every k above the greedy upper bound before anything is simulated.
+    With stream, each configuration stops drawing shots as soon as it finds
+    a verified set or its counts look uniform (see run_task); the "shots"
+    column then counts the shots drawn, and the simulation cost is unchanged.
+    """
+    if k_values is None:
+        k_values = range(1, graph.n + 1)
+    if prune:
+        upper = len(greedy_dominating_set(graph))
+        k_values = [k for k in k_values if k <= upper and is_feasible(graph, k)]
+    configs = [(k, it) for k in sorted(k_values) for it in iteration_counts]
+    best_k = None
+
+    def abandoned(task):
+        return early_stop and best_k is not None and task[1] > best_k
+
+    # Keep at most max_workers tasks in flight, smallest k first
+    tasks = [(graph, k, it, shots, method, synthesis, stream) for k, it in configs]
+    for task, row in run_in_pool(run_task, tasks, max_workers, memory_limit_mb,
+                                 skip=abandoned):
+        if row is None:
+            _, k, it = task[:3]
+            row = {"n": graph.n, "k": k, "iterations": it, "shots": shots,
+                   "status": "memory", "success": False, "success_probability": 0.0,
+                   "best_set": None, "seconds": None}
+        yield row
+        if early_stop and row["success"] and (best_k is None or row["k"] < best_k):
+            # Configurations with a larger k are no longer started, and running
+            # ones are abandoned
+            best_k = row["k"]
+
+def write_table(rows, filename):
+    """Writes sweep rows to a CSV results table."""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            row = dict(row)
+            if row["best_set"] is not None:
+                row["best_set"] = " ".join(str(v) for v in row["best_set"])
+            writer.writerow(row)
+
+def find_minimum(graph, results_file=None, **kwargs):
+    """
+    Sweeps k = 1..n and returns (smallest k with a verified solution, its set, rows).
+    kwargs are passed to sweep().
+    """
+    rows = []
+    for row in sweep(graph, **kwargs):
+        rows.append(row)
+    rows.sort(key=lambda r: (r["k"], str(r["iterations"])))
+    if results_file is not None:
+        write_table(rows, results_file)
+
+    for row in rows:
+        if row["success"]:
+            return row["k"], row["best_set"], rows
+    return None, None, rows
+
+def benchmark_against_classical(graph, k, **kwargs):
+    """
+    Times the exact classical solver against one run_grover call for the same k.
+    kwargs are passed to run_grover.
+    """
+    start = time.perf_counter()
+    exact = minimum_dominating_set(graph)
+    classical_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts, _ = run_grover(graph, k, **kwargs)
+    quantum_seconds = time.perf_counter() - start
+    probability, best_set = verify_counts(graph, counts, k)
+
+    return {
+        "n": graph.n,
+        "k": k,
+        "domination_number": len(exact),
+        "classical_seconds": classical_seconds,
+        "quantum_seconds": quantum_seconds,
+        "success_probability": probability,
+        "best_set": best_set,
+    }